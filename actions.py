@@ -1,5 +1,7 @@
 # actions.py
 
+from room import DIRECTION_SYNONYMS
+
 MSG0 = "\nLa commande '{command_word}' ne prend pas de paramètre.\n"
 MSG1 = "\nLa commande '{command_word}' prend 1 seul paramètre.\n"
 
@@ -27,19 +29,14 @@ class Actions:
         if room is None or not hasattr(room, "exits") or not isinstance(room.exits, dict):
             return {}
 
-        available = {str(d).strip().upper() for d, dest in room.exits.items() if d and dest is not None}
+        # Salle du jeu : alias gardés en cache tant que ses sorties ne changent pas
+        if hasattr(room, "exit_aliases"):
+            return room.exit_aliases()
 
-        synonyms = {
-            "N": {"N", "NORD"},
-            "S": {"S", "SUD"},
-            "E": {"E", "EST"},
-            "O": {"O", "OUEST"},
-            "U": {"U", "UP", "HAUT"},
-            "D": {"D", "DOWN", "BAS"},
-        }
+        available = {str(d).strip().upper() for d, dest in room.exits.items() if d and dest is not None}
 
         aliases = {}
-        for canon, syns in synonyms.items():
+        for canon, syns in DIRECTION_SYNONYMS.items():
             if canon in available:
                 for s in syns:
                     aliases[s] = canon
@@ -287,9 +284,7 @@ class Actions:
             print("\nQuête introuvable.\n")
             return False
 
-        for u in game.qm.pop_updates():
-            print(u)
-        print()
+        game._print_quest_updates()
         return True
 
     @staticmethod
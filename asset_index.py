@@ -0,0 +1,126 @@
+# asset_index.py
+
+import os
+import re
+import unicodedata
+
+
+# Miniatures PPM (python assets_tool.py thumbs) : assets/thumbs/<nom sans .png>.ppm
+THUMBS_DIRNAME = "thumbs"
+
+# Lettres liées qui n'ont pas de décomposition Unicode (NFKD les laisse telles quelles)
+_LIGATURES = {"œ": "oe", "æ": "ae", "ß": "ss"}
+
+
+def normalize_key(name: str) -> str:
+    """
+    Clé stable pour comparer des noms d'images / de salles.
+
+    "No Man’s Land", "No Man's Land.png" et une version NFD venue d'un autre
+    système de fichiers donnent toutes "no_man_s_land" :
+    - extension .png retirée
+    - accents retirés (NFKD), casse ignorée
+    - apostrophes courbes, tirets longs, espaces, parenthèses... -> "_"
+    """
+    stem = name[:-4] if name.lower().endswith(".png") else name
+    s = unicodedata.normalize("NFKD", stem)
+    s = "".join(ch for ch in s if not unicodedata.combining(ch)).casefold()
+    s = "".join(_LIGATURES.get(ch, ch) for ch in s)
+    return re.sub(r"[^0-9a-z]+", "_", s).strip("_")
+
+
+class AssetIndex:
+    """
+    Index des images, construit UNE fois au démarrage.
+
+    Avant, chaque rafraîchissement faisait os.path.join + os.path.exists
+    avec le nom affiché de la salle. Ici, on parcourt assets/ (et l'archive
+    assets.pack) une seule fois, puis :
+    - resolve(nom ou identifiant) -> chemin, en O(1), sans appel disque
+    - has_path(chemin) -> existence d'un fichier (variantes comprises)
+    - packed(chemin) -> le fichier est-il lu depuis l'archive ?
+    - missing(salles) -> salles qui n'ont pas d'image
+    - thumbnail(chemin) -> miniature de l'image, si elle a été générée
+    """
+
+    def __init__(self, assets_dir: str):
+        self.assets_dir = assets_dir
+        self._by_key = {}   # clé normalisée -> chemin (images à la racine de assets/)
+        self._paths = set()  # tous les chemins connus (racine + sous-dossiers)
+        self._thumbs = {}   # clé normalisée -> chemin de la miniature
+        self._packed = set()  # chemins servis par l'archive (les autres : sur le disque)
+        self.stale = []     # fichiers de l'archive remplacés par une version plus récente sur le disque
+
+    @classmethod
+    def scan(cls, assets_dir: str, pack=None):
+        """
+        Construit l'index depuis le disque et l'archive (si elle existe).
+
+        Un fichier présent des deux côtés est lu depuis le disque s'il est plus
+        récent que l'archive (image retouchée sans relancer 'assets_tool.py pack') :
+        il est alors noté dans 'stale'. Sinon c'est l'archive qui le fournit.
+        """
+        index = cls(assets_dir)
+        on_disk = {}
+        for dirpath, _, filenames in os.walk(assets_dir):
+            rel_dir = os.path.relpath(dirpath, assets_dir)
+            for fn in filenames:
+                rel = fn if rel_dir == "." else os.path.join(rel_dir, fn)
+                try:
+                    on_disk[rel.replace(os.sep, "/")] = os.path.getmtime(os.path.join(dirpath, fn))
+                except OSError:
+                    pass
+
+        packed = set()
+        if pack is not None:
+            # L'archive ne garde pas de date par fichier : c'est la sienne qui compte
+            try:
+                pack_mtime = os.path.getmtime(pack.path)
+            except OSError:
+                pack_mtime = float("inf")
+            for rel in pack.names():
+                if rel in on_disk and on_disk[rel] > pack_mtime:
+                    index.stale.append(rel)
+                else:
+                    packed.add(rel)
+
+        for rel in sorted(packed | set(on_disk)):
+            index.add(rel, packed=rel in packed)
+        return index
+
+    def add(self, rel: str, packed: bool = False):
+        """Ajoute un fichier (chemin relatif à assets/, avec des '/')."""
+        path = os.path.join(self.assets_dir, *rel.split("/"))
+        self._paths.add(path)
+        if packed:
+            self._packed.add(path)
+        if "/" not in rel and rel.lower().endswith(".png"):
+            self._by_key.setdefault(normalize_key(rel), path)
+        elif rel.startswith(THUMBS_DIRNAME + "/") and rel.lower().endswith(".ppm"):
+            self._thumbs.setdefault(normalize_key(rel[len(THUMBS_DIRNAME) + 1:-4]), path)
+
+    def resolve(self, name: str):
+        """Chemin de l'image correspondant à un nom de fichier ou un identifiant, ou None."""
+        if not name:
+            return None
+        return self._by_key.get(normalize_key(name))
+
+    def thumbnail(self, path: str):
+        """Chemin de la miniature d'une image de assets/ (None si absente)."""
+        return self._thumbs.get(normalize_key(os.path.basename(path)))
+
+    def has_path(self, path: str) -> bool:
+        return path in self._paths
+
+    def packed(self, path: str) -> bool:
+        return path in self._packed
+
+    def missing(self, room_assets) -> list:
+        """
+        Salles sans image : [(nom, identifiant)] dont l'identifiant ne correspond
+        à aucun fichier (room_assets : Game.room_assets()).
+        """
+        return [(name, asset_id) for name, asset_id in room_assets if self.resolve(asset_id) is None]
+
+    def __len__(self) -> int:
+        return len(self._by_key)
@@ -0,0 +1,146 @@
+# asset_pack.py
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+
+MAGIC = b"ATLASPK1"
+# En-tête : MAGIC (8 octets) + taille de l'index JSON (entier 64 bits, big-endian)
+HEADER = struct.Struct(">8sQ")
+
+
+class AssetPack:
+    """
+    Archive unique contenant toutes les images du jeu (assets.pack).
+
+    Format :
+        [MAGIC][taille index][index JSON][blobs...]
+
+    L'index associe chaque nom ("BioDome.png", "variants/3/BioDome.png"...)
+    à (offset, longueur, sha256). Deux fichiers identiques ne sont stockés
+    qu'une fois : ils pointent vers le même blob.
+
+    Le fichier est ouvert une seule fois puis projeté en mémoire (mmap) :
+    plus de os.path.exists / open() par image, et plusieurs processus
+    qui lisent la même archive partagent les mêmes pages en mémoire.
+    """
+
+    def __init__(self, path: str, fileobj, mapping, entries: dict):
+        self.path = path
+        self._file = fileobj
+        self._map = mapping
+        self.entries = entries  # nom -> (offset, longueur, sha256)
+
+    # -------------------------
+    # Ouverture / fermeture
+    # -------------------------
+    @classmethod
+    def open(cls, path: str):
+        """Ouvre l'archive, ou renvoie None si elle est absente / invalide."""
+        try:
+            f = open(path, "rb")
+        except OSError:
+            return None
+
+        try:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, index_len = HEADER.unpack_from(mapping, 0)
+            if magic != MAGIC:
+                raise ValueError("archive invalide")
+            start = HEADER.size
+            index = json.loads(mapping[start:start + index_len].decode("utf-8"))
+            entries = {name: tuple(e) for name, e in index["entries"].items()}
+        except (OSError, ValueError, KeyError, struct.error):
+            f.close()
+            return None
+
+        return cls(path, f, mapping, entries)
+
+    def close(self):
+        try:
+            self._map.close()
+        finally:
+            self._file.close()
+
+    # -------------------------
+    # Lecture
+    # -------------------------
+    def __contains__(self, name) -> bool:
+        return name in self.entries
+
+    def names(self) -> list:
+        return sorted(self.entries)
+
+    def view(self, name: str) -> memoryview:
+        """Vue directe (sans copie) sur les octets du fichier dans la projection mémoire."""
+        offset, length, _ = self.entries[name]
+        return memoryview(self._map)[offset:offset + length]
+
+    def read(self, name: str) -> bytes:
+        """
+        Octets du fichier 'name'.
+
+        Tk (PhotoImage(data=...)) n'accepte que des bytes : c'est la seule
+        copie faite, directement depuis les pages projetées (pas de read()).
+        """
+        offset, length, _ = self.entries[name]
+        return self._map[offset:offset + length]
+
+    def verify(self, name: str) -> bool:
+        """Vérifie l'empreinte sha256 d'une entrée."""
+        _, _, digest = self.entries[name]
+        return hashlib.sha256(self.view(name)).hexdigest() == digest
+
+
+def build_pack(files: dict, out_path: str) -> dict:
+    """
+    Construit une archive à partir de {nom: chemin_sur_disque}.
+
+    Les contenus identiques (même sha256) sont dédupliqués.
+    Renvoie quelques statistiques (nombre d'entrées, de blobs, taille).
+    """
+    blobs = {}    # sha256 -> contenu
+    order = []    # ordre d'écriture des blobs
+    refs = {}     # nom -> sha256
+
+    for name in sorted(files):
+        with open(files[name], "rb") as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in blobs:
+            blobs[digest] = data
+            order.append(digest)
+        refs[name] = digest
+
+    # Les offsets dépendent de la taille de l'index, qui dépend des offsets :
+    # on calcule les positions relatives, puis on décale une fois l'index figé.
+    relative = {}
+    pos = 0
+    for digest in order:
+        relative[digest] = pos
+        pos += len(blobs[digest])
+
+    base = 0
+    while True:
+        entries = {
+            name: [base + relative[d], len(blobs[d]), d]
+            for name, d in refs.items()
+        }
+        index = json.dumps({"entries": entries}, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        new_base = HEADER.size + len(index)
+        if new_base == base:
+            break
+        base = new_base
+
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(index)))
+        f.write(index)
+        for digest in order:
+            f.write(blobs[digest])
+    os.replace(tmp_path, out_path)
+
+    return {"entries": len(refs), "blobs": len(order), "bytes": base + pos}
@@ -0,0 +1,248 @@
+# assets_tool.py
+"""
+Outils hors-ligne pour préparer les images du dossier assets/.
+
+Usage :
+    python assets_tool.py variants            # génère les variantes 1/2, 1/3, 1/4, 1/8
+    python assets_tool.py variants --force    # régénère tout
+    python assets_tool.py pack                # regroupe tout dans assets.pack
+    python assets_tool.py warmup              # remplit le cache PPM pour la fenêtre par défaut
+    python assets_tool.py thumbs              # génère les miniatures (affichage immédiat)
+    python assets_tool.py check               # liste les salles sans image
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from asset_index import THUMBS_DIRNAME, AssetIndex
+from asset_pack import build_pack
+from image_cache import apply_fit, compute_fit, mip_level
+from pngdecode import decode_scaled
+from transcode_cache import TranscodeCache, png_size
+from variants import DEFAULT_FACTORS, VariantManifest
+
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+PACK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets.pack")
+
+# Taille approximative du label image avec la fenêtre par défaut (980x640)
+DEFAULT_LABEL = (960, 380)
+
+# Taille max des miniatures : 1536x1024 -> 48x32 (PPM de 4.6 Ko)
+THUMB_MAX = (48, 48)
+
+
+def list_images(assets_dir: str) -> list:
+    """Liste les images PNG (salles + OUTRO) à la racine de assets/."""
+    return sorted(
+        name for name in os.listdir(assets_dir)
+        if name.lower().endswith(".png") and os.path.isfile(os.path.join(assets_dir, name))
+    )
+
+
+def _is_up_to_date(src: str, dst: str) -> bool:
+    try:
+        return os.path.getmtime(dst) >= os.path.getmtime(src)
+    except OSError:
+        return False
+
+
+def build_variants(assets_dir: str = ASSETS_DIR, factors=DEFAULT_FACTORS, force: bool = False) -> VariantManifest:
+    """
+    Écrit les variantes réduites de chaque image + le manifest des dimensions.
+
+    On passe par Tk (comme le jeu) : aucune dépendance externe.
+    La réduction est la même que celle de l'interface (subsample), donc
+    l'affichage final est identique à celui obtenu depuis l'original.
+    """
+    import tkinter as tk
+
+    root = tk.Tk()
+    root.withdraw()
+
+    old = VariantManifest.load(assets_dir)
+    manifest = VariantManifest(os.path.join(assets_dir, "variants"), factors=factors)
+
+    try:
+        for name in list_images(assets_dir):
+            src_path = os.path.join(assets_dir, name)
+            targets = {f: manifest.variant_path(name, f) for f in factors}
+
+            if not force and old is not None and name in old.images:
+                entry = old.images[name]
+                if all(str(f) in entry["variants"] and _is_up_to_date(src_path, p) for f, p in targets.items()):
+                    manifest.images[name] = entry
+                    continue
+
+            t0 = time.perf_counter()
+            src = tk.PhotoImage(master=root, file=src_path)
+            sizes = {}
+            for f, dst in targets.items():
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                small = src.subsample(f, f)
+                small.write(dst, format="png")
+                sizes[f] = (small.width(), small.height())
+
+            manifest.add(name, (src.width(), src.height()), sizes)
+            print(f"{name} : {len(sizes)} variantes ({(time.perf_counter() - t0) * 1000:.0f} ms)")
+    finally:
+        root.destroy()
+
+    manifest.save()
+    return manifest
+
+
+def build_thumbnails(assets_dir: str = ASSETS_DIR, force: bool = False) -> int:
+    """
+    Écrit une miniature PPM de chaque image dans assets/thumbs/.
+
+    L'interface l'affiche (agrandie) dès le changement de salle, le temps que
+    l'image ajustée soit prête. Réduction par pngdecode (moyenne, sans Tk).
+    Renvoie le nombre de miniatures écrites.
+    """
+    thumbs_dir = os.path.join(assets_dir, THUMBS_DIRNAME)
+    os.makedirs(thumbs_dir, exist_ok=True)
+    written = 0
+    for name in list_images(assets_dir):
+        src = os.path.join(assets_dir, name)
+        dst = os.path.join(thumbs_dir, name[:-4] + ".ppm")
+        if not force and _is_up_to_date(src, dst):
+            continue
+
+        with open(src, "rb") as f:
+            iw, ih = png_size(f.read(24))
+        scale = min(THUMB_MAX[0] / iw, THUMB_MAX[1] / ih, 1.0)
+        size = (max(1, round(iw * scale)), max(1, round(ih * scale)))
+
+        t0 = time.perf_counter()
+        data = decode_scaled(src, size)
+        with open(dst, "wb") as f:
+            f.write(data)
+        written += 1
+        print(f"{name} -> {size[0]}x{size[1]} ({len(data) / 1024:.1f} Ko, {(time.perf_counter() - t0) * 1000:.0f} ms)")
+    return written
+
+
+def warmup_transcode_cache(assets_dir: str = ASSETS_DIR, labels=(DEFAULT_LABEL,), cache: TranscodeCache = None) -> int:
+    """
+    Remplit le cache PPM (même clés que l'interface) pour une ou plusieurs tailles de label.
+    Renvoie le nombre d'entrées créées.
+    """
+    import tkinter as tk
+
+    cache = cache or TranscodeCache()
+    manifest = VariantManifest.load(assets_dir)
+
+    root = tk.Tk()
+    root.withdraw()
+    created = 0
+    try:
+        for name in list_images(assets_dir):
+            path = os.path.join(assets_dir, name)
+            for lw, lh in labels:
+                source = path
+                if manifest is not None:
+                    source = manifest.pick(name, path, lambda w, h: compute_fit(w, h, lw, lh)[1])
+                with open(source, "rb") as f:
+                    iw, ih = png_size(f.read(24))
+                op, size = compute_fit(iw, ih, lw, lh)
+                if op[0] == "raw":
+                    continue
+
+                digest = cache.file_digest(source)
+                if (digest, size) in cache:
+                    continue
+                img = tk.PhotoImage(master=root, file=source)
+                if op[0] == "scale":
+                    for level in range(1, op[1] + 1):
+                        img = mip_level(img, level)
+                photo = apply_fit(img, op)
+                if cache.put(digest, size, lambda p: photo.write(p, format="ppm")):
+                    created += 1
+                    print(f"{name} -> {size[0]}x{size[1]}")
+    finally:
+        root.destroy()
+    return created
+
+
+def _parse_size(text: str):
+    w, _, h = text.lower().partition("x")
+    return int(w), int(h)
+
+
+def collect_pack_files(assets_dir: str) -> dict:
+    """
+    Fichiers à mettre dans l'archive : toutes les images (variantes et miniatures
+    comprises) + le manifest des variantes. Les noms sont relatifs à assets/, avec des '/'.
+    """
+    files = {}
+    for dirpath, _, filenames in os.walk(assets_dir):
+        for fn in filenames:
+            if not (fn.lower().endswith((".png", ".ppm")) or fn == "manifest.json"):
+                continue
+            path = os.path.join(dirpath, fn)
+            name = os.path.relpath(path, assets_dir).replace(os.sep, "/")
+            files[name] = path
+    return files
+
+
+def rooms_without_image(assets_dir: str = ASSETS_DIR) -> list:
+    """Salles (labyrinthe compris) dont l'identifiant ne correspond à aucune image : [(nom, id)]."""
+    from game import Game
+
+    game = Game()
+    game.build_chapter1_map()
+    game.build_chapter2_map()
+    game.build_chapter3_map()
+    return AssetIndex.scan(assets_dir).missing(game.room_assets())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Préparation des images du jeu (assets/).")
+    parser.add_argument("--assets", default=ASSETS_DIR, help="dossier des images (défaut : assets/)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_var = sub.add_parser("variants", help="génère les variantes pré-réduites + manifest")
+    p_var.add_argument("--factors", type=int, nargs="+", default=list(DEFAULT_FACTORS))
+    p_var.add_argument("--force", action="store_true", help="régénère même si à jour")
+
+    p_pack = sub.add_parser("pack", help="regroupe les images dans une archive unique")
+    p_pack.add_argument("--out", default=PACK_PATH, help="archive à écrire (défaut : assets.pack)")
+
+    p_warm = sub.add_parser("warmup", help="remplit le cache PPM (décodage instantané au lancement)")
+    p_warm.add_argument("--label", type=_parse_size, action="append",
+                        help="taille du label image, ex: 960x380 (répétable)")
+
+    p_thumb = sub.add_parser("thumbs", help="génère les miniatures affichées pendant le chargement")
+    p_thumb.add_argument("--force", action="store_true", help="régénère même si à jour")
+
+    sub.add_parser("check", help="liste les salles qui n'ont pas d'image")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "variants":
+        manifest = build_variants(args.assets, tuple(args.factors), args.force)
+        print(f"\n{len(manifest.images)} images -> {manifest.variants_dir}")
+    elif args.command == "pack":
+        stats = build_pack(collect_pack_files(args.assets), args.out)
+        print(f"{stats['entries']} fichiers, {stats['blobs']} blobs uniques, "
+              f"{stats['bytes'] / (1024 * 1024):.1f} Mo -> {args.out}")
+    elif args.command == "warmup":
+        cache = TranscodeCache()
+        created = warmup_transcode_cache(args.assets, tuple(args.label or [DEFAULT_LABEL]), cache)
+        print(f"\n{created} images ajoutées -> {cache.cache_dir}")
+    elif args.command == "thumbs":
+        written = build_thumbnails(args.assets, args.force)
+        print(f"\n{written} miniatures -> {os.path.join(args.assets, THUMBS_DIRNAME)}")
+    elif args.command == "check":
+        missing = rooms_without_image(args.assets)
+        for name, asset_id in missing:
+            print(f"- {name} ({asset_id})")
+        print(f"\n{len(missing)} salle(s) sans image")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+# batch.py
+"""
+Mode sans terminal pour les parties automatisées : python game.py --batch [FICHIER]
+
+Les commandes sont lues dans FICHIER (ou sur l'entrée standard, "-" ou rien),
+une par ligne ; lignes vides et commentaires (#) ignorés. Les pauses des
+scènes ne bloquent pas, l'écran n'est jamais effacé. Pour chaque commande,
+une ligne JSON est écrite sur la sortie standard :
+
+    {"command": "go N", "room": "BioDome", "inventory": [...],
+     "quest_updates": [...], "output": "...", "elapsed_ms": 0.41, ...}
+
+Le premier enregistrement ("command": null) correspond à l'introduction.
+La lecture s'arrête quand la partie est terminée (quit, fin du jeu).
+"""
+
+import io
+import json
+import sys
+import time
+
+
+def _lines(source):
+    for line in source:
+        cmd = line.strip()
+        if cmd and not cmd.startswith("#"):
+            yield cmd
+
+
+class BatchRunner:
+    """
+    Fait tourner un Game sans GUI ni terminal, comme la boucle de Game.play()
+    (déclencheurs du chapitre, puis la commande), et produit un enregistrement
+    par commande.
+    """
+
+    def __init__(self, game, name: str = "Batch"):
+        self.game = game
+        self.name = name
+        # Pause = rien : la scène continue immédiatement, sans afficher "(Appuie sur Entrée...)"
+        game.wait_for_continue = lambda txt: True
+        self._buffer = io.StringIO()
+        self._quests_seen = 0
+
+    def _capture(self, fn, *args):
+        """Exécute fn en capturant print() ; renvoie (texte, durée en ms)."""
+        buf = self._buffer
+        buf.seek(0)
+        buf.truncate()
+        stdout = sys.stdout
+        sys.stdout = buf
+        t0 = time.perf_counter()
+        try:
+            fn(*args)
+        finally:
+            elapsed = (time.perf_counter() - t0) * 1000
+            sys.stdout = stdout
+        return buf.getvalue(), elapsed
+
+    def _record(self, command, output: str, elapsed: float) -> dict:
+        game = self.game
+        player = game.player
+        room = getattr(player, "current_room", None)
+        updates = game.quest_log[self._quests_seen:]
+        self._quests_seen = len(game.quest_log)
+        return {
+            "command": command,
+            "room": room.name if room is not None else None,
+            "inventory": [it.name for it in getattr(player, "inventory", [])],
+            "quest_updates": updates,
+            "output": output,
+            "elapsed_ms": round(elapsed, 3),
+            "chapter": game.chapter,
+            "mode": game.input_mode,
+            "finished": game.finished,
+        }
+
+    def start(self) -> dict:
+        game = self.game
+
+        def setup():
+            game.setup_world()
+            game.setup_player(self.name)
+            game.start_intro()
+            game._print_quest_updates()  # quête principale activée au départ
+
+        output, elapsed = self._capture(setup)
+        return self._record(None, output, elapsed)
+
+    def command(self, cmd: str) -> dict:
+        game = self.game
+
+        def turn():
+            game.run_scene(game.chapter_triggers())
+            if not game.finished:
+                game.process_command(cmd)
+
+        output, elapsed = self._capture(turn)
+        return self._record(cmd, output, elapsed)
+
+    def run(self, source, out) -> int:
+        """Joue toutes les commandes de 'source' ; renvoie le nombre de commandes jouées."""
+        dumps = json.JSONEncoder(ensure_ascii=False).encode
+        out.write(dumps(self.start()) + "\n")
+        count = 0
+        for cmd in _lines(source):
+            if self.game.finished:
+                break
+            out.write(dumps(self.command(cmd)) + "\n")
+            count += 1
+        out.flush()
+        return count
+
+
+def run_batch(make_game, path: str = None, name: str = "Batch", out=None) -> int:
+    """Point d'entrée de --batch : lit les commandes, écrit le JSON, rend un code de sortie."""
+    out = out if out is not None else sys.stdout
+    runner = BatchRunner(make_game(), name)
+    t0 = time.perf_counter()
+    if not path or path == "-":
+        count = runner.run(sys.stdin, out)
+    else:
+        with open(path, encoding="utf-8") as f:
+            count = runner.run(f, out)
+    elapsed = time.perf_counter() - t0
+    print(f"[batch] {count} commandes en {elapsed:.2f} s", file=sys.stderr)
+    return 0
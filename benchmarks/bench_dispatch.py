@@ -0,0 +1,89 @@
+# benchmarks/bench_dispatch.py
+"""
+Analyse d'une commande avant exécution : ancienne version (split + recherche
+exacte dans game.commands + alias de directions reconstruits à chaque 'go')
+contre le Dispatcher compilé au setup (une recherche dans la table + alias
+de la salle gardés en cache tant que Room.exits ne change pas).
+
+Usage :
+    python benchmarks/bench_dispatch.py                # 200 000 commandes
+    python benchmarks/bench_dispatch.py --count 50000
+
+Seule l'analyse est mesurée (rien n'est exécuté ni affiché).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import Game  # noqa: E402
+from room import DIRECTION_SYNONYMS  # noqa: E402
+
+# Ce qu'un joueur tape ; les formes courtes n'existaient pas dans l'ancienne version
+COMMANDS = ["go N", "go nord", "look", "take Fragment_Beta", "check", "go S", "help", "talk Argos"]
+SHORT_COMMANDS = ["n", "nord", "loo", "tak Fragment_Beta", "inv", "s", "he", "talk Argos"]
+
+
+def _old_aliases(room):
+    """Ancien Actions._build_direction_aliases : dict reconstruit à chaque appel."""
+    available = {str(d).strip().upper() for d, dest in room.exits.items() if d and dest is not None}
+    synonyms = {canon: set(syns) for canon, syns in DIRECTION_SYNONYMS.items()}
+    aliases = {}
+    for canon, syns in synonyms.items():
+        if canon in available:
+            for s in syns:
+                aliases[s] = canon
+    return aliases
+
+
+def old_parse(game, room, raw):
+    words = raw.split()
+    command = game.commands.get(words[0])
+    if command is not None and words[0] == "go" and len(words) == 2:
+        _old_aliases(room).get(words[1].upper())
+    return command
+
+
+def new_parse(game, room, raw):
+    command, words = game.dispatcher.parse(raw)
+    if command is not None and words[0] == "go" and len(words) == 2:
+        room.exit_aliases().get(words[1].upper())
+    return command
+
+
+def run(parse, game, room, commands, count):
+    n = len(commands)
+    t0 = time.perf_counter()
+    for i in range(count):
+        parse(game, room, commands[i % n])
+    return time.perf_counter() - t0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de l'analyse des commandes.")
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    game = Game()
+    game.setup_world()
+    room = game.ch1_start
+
+    for label, parse, commands in (
+        ("ancien", old_parse, COMMANDS),
+        ("compilé", new_parse, COMMANDS),
+        ("compilé (courtes)", new_parse, SHORT_COMMANDS),
+    ):
+        elapsed = run(parse, game, room, commands, args.count)
+        print(f"{label:18} : {elapsed * 1e9 / args.count:7.0f} ns / commande")
+
+    known = sum(old_parse(game, room, c) is not None for c in SHORT_COMMANDS)
+    print(f"formes courtes reconnues : ancien {known}/{len(SHORT_COMMANDS)}, "
+          f"compilé {sum(new_parse(game, room, c) is not None for c in SHORT_COMMANDS)}/{len(SHORT_COMMANDS)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+# benchmarks/bench_import.py
+"""
+Temps d'import du moteur (game.py, utilisé par --cli / --serve) et de la GUI
+(gui.py), chacun dans un processus Python neuf (aucun module déjà en cache).
+
+Usage :
+    python benchmarks/bench_import.py                 # 5 essais, budget 100 ms
+    python benchmarks/bench_import.py --repeat 10 --budget 80 --top 8
+
+Vérifie aussi que 'import game' ne charge jamais tkinter (hôtes sans Tk).
+Code de sortie 1 si le moteur dépasse le budget ou importe tkinter.
+Les modules les plus lents viennent de 'python -X importtime'.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = (
+    "import sys, time, json\n"
+    "t = time.perf_counter()\n"
+    "import {module}\n"
+    "ms = (time.perf_counter() - t) * 1000\n"
+    "print(json.dumps({{'ms': ms, 'tkinter': 'tkinter' in sys.modules}}))\n"
+)
+
+
+def measure(module: str, repeat: int) -> dict:
+    """Meilleur temps d'import sur 'repeat' processus neufs (le minimum est le moins bruité)."""
+    best = None
+    tk_loaded = False
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module)],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout
+        result = json.loads(out.strip().splitlines()[-1])
+        best = result["ms"] if best is None else min(best, result["ms"])
+        tk_loaded = tk_loaded or result["tkinter"]
+    return {"ms": best, "tkinter": tk_loaded}
+
+
+def slowest_imports(module: str, top: int) -> list:
+    """[(cumul ms, module)] d'après -X importtime, du plus lent au plus rapide."""
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stderr
+    rows = []
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        rows.append((int(cumulative) / 1000, name))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark du temps d'import du moteur et de la GUI.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=100.0, help="budget du moteur (ms)")
+    parser.add_argument("--top", type=int, default=5, help="modules les plus lents affichés")
+    args = parser.parse_args(argv)
+
+    ok = True
+    for module, budgeted in (("game", True), ("gui", False)):
+        try:
+            result = measure(module, args.repeat)
+        except subprocess.CalledProcessError as e:
+            print(f"{module:5} : import impossible ({e.stderr.strip().splitlines()[-1]})")
+            ok = ok and not budgeted
+            continue
+
+        line = f"{module:5} : {result['ms']:7.1f} ms, tkinter {'chargé' if result['tkinter'] else 'absent'}"
+        if budgeted:
+            over = result["ms"] > args.budget
+            line += f"  (budget {args.budget:.0f} ms : {'DÉPASSÉ' if over else 'ok'})"
+            if over or result["tkinter"]:
+                ok = False
+        print(line)
+        for ms, name in slowest_imports(module, args.top):
+            print(f"        {ms:7.1f} ms  {name}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
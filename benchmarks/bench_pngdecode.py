@@ -0,0 +1,118 @@
+# benchmarks/bench_pngdecode.py
+"""
+Compare le décodeur PNG du projet (pngdecode.decode_scaled) avec Tk
+(PhotoImage(file=...) + subsample), sur les vraies images de assets/.
+
+Usage :
+    python benchmarks/bench_pngdecode.py                 # toutes les images, label 960x380
+    python benchmarks/bench_pngdecode.py --label 640x400 --limit 5
+
+Pour chaque image : temps de décodage + réduction ; avec --memory, pic
+mémoire Python du décodeur (tracemalloc, mesuré à part : il ralentit
+beaucoup le décodage). La partie Tk demande un affichage (DISPLAY) ;
+sans affichage, seule la colonne "python" est remplie.
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from image_cache import compute_fit  # noqa: E402
+from pngdecode import decode_scaled  # noqa: E402
+from transcode_cache import png_size  # noqa: E402
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+
+
+def _parse_size(text):
+    w, _, h = text.lower().partition("x")
+    return int(w), int(h)
+
+
+def _tk_root():
+    try:
+        import tkinter as tk
+
+        root = tk.Tk()
+        root.withdraw()
+        return root
+    except Exception:
+        return None
+
+
+def bench_tk(root, path, op):
+    """Décodage complet par Tk puis réduction entière (ce que faisait l'interface)."""
+    import tkinter as tk
+
+    t0 = time.perf_counter()
+    img = tk.PhotoImage(master=root, file=path)
+    if op[0] == "scale" and op[1] > 0:
+        img = img.subsample(2 ** op[1], 2 ** op[1])
+    elapsed = time.perf_counter() - t0
+    return elapsed, (img.width(), img.height())
+
+
+def bench_python(path, size):
+    t0 = time.perf_counter()
+    decode_scaled(path, size)
+    return time.perf_counter() - t0
+
+
+def peak_python(path, size):
+    tracemalloc.start()
+    decode_scaled(path, size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark décodeur PNG (Python pur vs Tk).")
+    parser.add_argument("--assets", default=ASSETS_DIR)
+    parser.add_argument("--label", type=_parse_size, default=(960, 380), help="taille du label, ex: 960x380")
+    parser.add_argument("--limit", type=int, default=0, help="nombre d'images (0 = toutes)")
+    parser.add_argument("--memory", action="store_true", help="mesure aussi le pic mémoire (lent)")
+    args = parser.parse_args(argv)
+
+    names = sorted(n for n in os.listdir(args.assets) if n.lower().endswith(".png"))
+    if args.limit:
+        names = names[:args.limit]
+
+    root = _tk_root()
+    if root is None:
+        print("(Tk indisponible : pas d'affichage, colonne tk ignorée)\n")
+
+    lw, lh = args.label
+    total_py = total_tk = 0.0
+    print(f"{'image':40} {'sortie':>10} {'python ms':>10} {'pic Mo':>7} {'tk ms':>8}")
+    for name in names:
+        path = os.path.join(args.assets, name)
+        with open(path, "rb") as f:
+            iw, ih = png_size(f.read(24))
+        op, size = compute_fit(iw, ih, lw, lh)
+        if op[0] == "raw":
+            continue
+
+        py_s = bench_python(path, size)
+        total_py += py_s
+        peak_col = f"{peak_python(path, size) / 1e6:.1f}" if args.memory else "-"
+        tk_col = "-"
+        if root is not None:
+            tk_s, _ = bench_tk(root, path, op)
+            total_tk += tk_s
+            tk_col = f"{tk_s * 1000:.0f}"
+        print(f"{name[:40]:40} {size[0]:>5}x{size[1]:<4} {py_s * 1000:>10.0f} {peak_col:>7} {tk_col:>8}")
+
+    print(f"\ntotal python : {total_py:.2f} s")
+    if root is not None:
+        print(f"total tk     : {total_tk:.2f} s")
+        root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
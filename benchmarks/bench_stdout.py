@@ -0,0 +1,121 @@
+# benchmarks/bench_stdout.py
+"""
+Débit du texte affiché dans la GUI : ancien redirecteur (4 appels Tk par
+write) contre _StdoutRedirector (tampon + un insert par temps mort).
+
+Usage :
+    python benchmarks/bench_stdout.py              # 2000 lignes, façon cinématique
+    python benchmarks/bench_stdout.py --lines 500
+
+Demande un affichage (DISPLAY). Sans affichage, on compte seulement
+les appels faits au widget Text (c'est ce qui coûte avec Tk).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui import _StdoutRedirector  # noqa: E402
+
+LINE = "Les images de Verdun, de Barbarossa, de la Forteresse… se superposent."
+
+
+class _UnbufferedRedirector:
+    """Ancienne version : chaque write() va directement dans le widget."""
+
+    def __init__(self, text_widget):
+        self.text_widget = text_widget
+
+    def write(self, s):
+        if not s:
+            return
+        self.text_widget.configure(state="normal")
+        self.text_widget.insert("end", s)
+        self.text_widget.see("end")
+        self.text_widget.configure(state="disabled")
+
+    def flush(self):
+        pass
+
+
+class _CountingText:
+    """Remplaçant du widget Text sans affichage : compte les appels."""
+
+    def __init__(self):
+        self.calls = 0
+        self._idle = []
+
+    def configure(self, **kw):
+        self.calls += 1
+
+    def insert(self, index, s):
+        self.calls += 1
+
+    def see(self, index):
+        self.calls += 1
+
+    def after_idle(self, fn):
+        self._idle.append(fn)
+        return f"idle#{len(self._idle)}"
+
+    def after_cancel(self, after_id):
+        pass
+
+    def update(self):
+        idle, self._idle = self._idle, []
+        for fn in idle:
+            fn()
+
+
+def _make_text():
+    try:
+        import tkinter as tk
+
+        root = tk.Tk()
+        root.withdraw()
+        text = tk.Text(root)
+        text.pack()
+        return root, text
+    except Exception:
+        return None, _CountingText()
+
+
+def run(redirector_cls, text, lines: int):
+    out = redirector_cls(text)
+    old = sys.stdout
+    sys.stdout = out
+    t0 = time.perf_counter()
+    try:
+        for i in range(lines):
+            print(LINE)
+            if i % 20 == 19:
+                print()  # paragraphe
+        out.flush()
+        text.update()  # temps morts : inserts en attente + redessin
+    finally:
+        sys.stdout = old
+    return time.perf_counter() - t0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark du redirecteur stdout de la GUI.")
+    parser.add_argument("--lines", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    for label, cls in (("sans tampon", _UnbufferedRedirector), ("avec tampon", _StdoutRedirector)):
+        root, text = _make_text()
+        elapsed = run(cls, text, args.lines)
+        if root is None:
+            print(f"{label:12} : {text.calls:6d} appels au widget (pas d'affichage : temps non significatif)")
+        else:
+            print(f"{label:12} : {elapsed * 1000:8.1f} ms pour {args.lines} lignes "
+                  f"({args.lines / elapsed:,.0f} lignes/s)")
+            root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+# benchmarks/check_cli_readline.py
+"""
+Vérifie, dans un vrai pseudo-terminal, que input() passe encore par readline
+quand sys.stdout est le TerminalRenderer du CLI : "lo" + Tab + Entrée doit
+donner "look" (et pas "lo\\t", signe que readline a été contourné).
+
+Usage :
+    python benchmarks/check_cli_readline.py
+
+Code de sortie 0 si la complétion marche, 1 sinon ; ignoré (0) sans pty / readline.
+"""
+
+import os
+import select
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+TYPED = b"lo\t\n"
+EXPECTED = "look"
+
+
+def child():
+    """Côté pty : un Game avec sa complétion, sys.stdout = TerminalRenderer, un input()."""
+    from game import Game
+    from terminal import TerminalRenderer
+    from viewmodel import ViewModel
+
+    game = Game()
+    game.setup_world()
+    completer = game._install_completion()
+    if completer is None:
+        os._exit(3)
+    completer.update(ViewModel.from_game(game))
+
+    renderer = TerminalRenderer()
+    sys.stdout = renderer
+    try:
+        line = input("> ")
+    finally:
+        sys.stdout = renderer.out
+    os.write(2, f"\nRESULT={line!r}\n".encode("utf-8"))
+    os._exit(0)
+
+
+def main() -> int:
+    try:
+        import pty
+        import readline  # noqa: F401
+    except ImportError:
+        print("pty / readline indisponible : vérification ignorée")
+        return 0
+
+    rfd, wfd = os.pipe()
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.close(rfd)
+        os.dup2(wfd, 2)
+        child()
+
+    os.close(wfd)
+    time.sleep(1.0)  # le temps de construire le monde et d'afficher l'invite
+    os.write(fd, TYPED)
+
+    err = b""
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        for ready in select.select([rfd, fd], [], [], 0.1)[0]:
+            try:
+                data = os.read(ready, 4096)
+            except OSError:
+                data = b""
+            if ready == rfd:
+                err += data
+        if b"RESULT=" in err and err.endswith(b"\n"):
+            break
+    _, status = os.waitpid(pid, 0)
+
+    if os.WIFEXITED(status) and os.WEXITSTATUS(status) == 3:
+        print("readline indisponible dans le pty : vérification ignorée")
+        return 0
+
+    text = err.decode("utf-8", "replace")
+    result = text.split("RESULT=", 1)[1].strip() if "RESULT=" in text else "(rien)"
+    ok = result == repr(EXPECTED)
+    print(f"input() sous TerminalRenderer : {result} ({'ok' if ok else f'attendu {EXPECTED!r}'})")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
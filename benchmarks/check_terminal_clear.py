@@ -0,0 +1,46 @@
+# benchmarks/check_terminal_clear.py
+"""
+Vérifie que TerminalRenderer.clear() ne perd pas de texte hors terminal ANSI
+(pipe, fichier, TERM=dumb) : ce qui a été écrit avant clear() doit sortir,
+comme la narration affichée juste avant end_game -> clear_screen().
+
+Usage :
+    python benchmarks/check_terminal_clear.py
+
+Code de sortie 0 si tout le texte est conservé, 1 sinon.
+"""
+
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from terminal import ERASE_SCREEN, TerminalRenderer  # noqa: E402
+
+
+def check(ansi: bool) -> bool:
+    out = io.StringIO()
+    t = TerminalRenderer(out=out, ansi=ansi)
+    t.write("CIBLE CONFIRMÉE\n")
+    t.clear()
+    t.write("fin\n")
+    t.flush()
+    text = out.getvalue()
+
+    if ansi:
+        # L'écran est effacé : seul le texte écrit après clear() reste visible
+        ok = ERASE_SCREEN in text and "CIBLE" not in text and text.endswith("fin\n")
+    else:
+        ok = text == "CIBLE CONFIRMÉE\nfin\n"
+    print(f"clear() {'ANSI' if ansi else 'sans ANSI'} : {text!r} ({'ok' if ok else 'texte perdu'})")
+    return ok
+
+
+def main() -> int:
+    results = [check(False), check(True)]
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
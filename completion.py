@@ -0,0 +1,139 @@
+# completion.py
+
+from asset_index import normalize_key
+
+
+# Après ces commandes, on complète avec ces sources (sinon : toutes sauf les commandes)
+ARG_SOURCES = {
+    "go": ("exits",),
+    "take": ("ground",),
+    "t": ("ground",),
+    "drop": ("bag",),
+    "talk": ("characters",),
+    "look": ("ground", "bag", "characters"),
+}
+
+
+class Trie:
+    """
+    Arbre de préfixes sur les clés normalisées (normalize_key : casse, accents,
+    espaces/tirets -> "_"). "fragment be" trouve donc "Fragment_Beta".
+    Chaque mot est inséré / retiré une fois : pas de reconstruction par frappe.
+    """
+
+    def __init__(self):
+        self._root = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, word: str):
+        node = self._root
+        for ch in normalize_key(word):
+            node = node.setdefault(ch, {})
+        words = node.setdefault(None, set())  # clé None : mots terminés ici
+        if word not in words:
+            words.add(word)
+            self._size += 1
+
+    def remove(self, word: str):
+        key = normalize_key(word)
+        path = [self._root]
+        for ch in key:
+            node = path[-1].get(ch)
+            if node is None:
+                return
+            path.append(node)
+        words = path[-1].get(None)
+        if not words or word not in words:
+            return
+        words.discard(word)
+        self._size -= 1
+        if not words:
+            del path[-1][None]
+        # Élague les branches devenues vides
+        for depth in range(len(key), 0, -1):
+            if path[depth]:
+                break
+            del path[depth - 1][key[depth - 1]]
+
+    def complete(self, prefix: str) -> list:
+        """Mots dont la clé commence par celle de 'prefix' (triés)."""
+        node = self._root
+        for ch in normalize_key(prefix):
+            node = node.get(ch)
+            if node is None:
+                return []
+        found = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for ch, child in node.items():
+                if ch is None:
+                    found.extend(child)
+                else:
+                    stack.append(child)
+        return sorted(found, key=str.casefold)
+
+
+class Completer:
+    """
+    Complétion de la ligne de commande (GUI : Tab dans l'entrée ; CLI : readline).
+
+    Une trie par source (commandes, objets au sol, inventaire, personnages,
+    sorties). update(view) compare avec le ViewModel précédent et n'insère /
+    retire que les mots qui ont changé (un objet ramassé passe du sol au sac).
+    """
+
+    def __init__(self):
+        self.tries = {}
+        self._words = {}
+
+    def update(self, view):
+        self._set_source("commands", view.commands)
+        self._set_source("ground", view.ground)
+        self._set_source("bag", view.bag)
+        self._set_source("characters", view.characters)
+        self._set_source("exits", view.directions)
+
+    def _set_source(self, source: str, words):
+        new = set(words)
+        old = self._words.get(source, set())
+        if new == old:
+            return
+        trie = self.tries.setdefault(source, Trie())
+        for w in old - new:
+            trie.remove(w)
+        for w in new - old:
+            trie.insert(w)
+        self._words[source] = new
+
+    def candidates(self, source: str, prefix: str) -> list:
+        trie = self.tries.get(source)
+        return trie.complete(prefix) if trie is not None else []
+
+    def complete(self, line: str) -> list:
+        """Lignes complètes possibles pour 'line' (ex: "drop frag" -> ["drop Fragment_Beta"])."""
+        head, sep, rest = line.lstrip().partition(" ")
+        if not sep:
+            return self.candidates("commands", head)
+
+        sources = ARG_SOURCES.get(head.lower(), ("ground", "bag", "characters", "exits"))
+        found = []
+        for source in sources:
+            for w in self.candidates(source, rest.strip()):
+                if w not in found:
+                    found.append(w)
+        return [f"{head} {w}" for w in found]
+
+
+def common_prefix(lines: list) -> str:
+    """Plus long début commun (sert à compléter jusqu'à l'ambiguïté)."""
+    if not lines:
+        return ""
+    first, last = min(lines), max(lines)
+    i = 0
+    while i < min(len(first), len(last)) and first[i] == last[i]:
+        i += 1
+    return first[:i]
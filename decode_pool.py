@@ -0,0 +1,122 @@
+# decode_pool.py
+
+import heapq
+import itertools
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+# Priorités des tâches (la plus petite passe d'abord)
+PRIORITY_SHOWN = 0     # image que le joueur attend maintenant
+PRIORITY_PREFETCH = 1  # préchargement des images suivantes
+
+
+class DecodePool:
+    """
+    Pool de threads pour préparer les images hors du thread Tk.
+
+    Tk n'est pas utilisable depuis un autre thread : les workers ne font que
+    le travail "pur" (lecture disque, vérification, décodage, mise à l'échelle)
+    et renvoient des octets. Le thread Tk récupère les résultats via after()
+    et construit lui-même la PhotoImage.
+
+    Les tâches attendent dans une file à priorités (pas dans l'ordre d'arrivée) :
+    l'image affichée passe devant les préchargements. submit() renvoie un Future
+    qu'on peut annuler tant que la tâche n'a pas commencé.
+
+    - widget : widget Tk (pour after / after_cancel)
+    - workers : nombre de threads
+    - poll_ms : intervalle de relève des résultats tant que des tâches sont en cours
+    """
+
+    def __init__(self, widget, workers: int = 2, poll_ms: int = 15):
+        self.widget = widget
+        self.poll_ms = poll_ms
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="atlas-decode")
+        self._queue = []                # tas de (priorité, n°, future, job)
+        self._queue_lock = threading.Lock()
+        self._seq = itertools.count()   # départage les priorités égales : ordre d'arrivée
+        self._results = queue.Queue()
+        self._pending = 0
+        self._after_id = None
+        self._closed = False
+
+    def submit(self, job, on_done, priority: int = PRIORITY_PREFETCH):
+        """
+        Lance job() dans un worker, après les tâches plus prioritaires.
+        on_done(résultat, erreur) sera appelé plus tard DANS LE THREAD TK.
+
+        Renvoie le Future de la tâche : future.cancel() la retire si elle n'a pas
+        encore commencé (on_done n'est alors jamais appelé).
+        """
+        if self._closed:
+            return None
+        future = Future()
+        with self._queue_lock:
+            heapq.heappush(self._queue, (priority, next(self._seq), future, job))
+        self._pending += 1
+        future.add_done_callback(lambda f: self._results.put((on_done, f)))
+        # Chaque appel de _run_next prend la tâche la plus prioritaire du moment
+        self._executor.submit(self._run_next)
+        self._schedule_poll()
+        return future
+
+    def _run_next(self):
+        """(Worker) Exécute la tâche en attente la plus prioritaire, si elle n'a pas été annulée."""
+        with self._queue_lock:
+            if not self._queue:
+                return
+            _, _, future, job = heapq.heappop(self._queue)
+        if not future.set_running_or_notify_cancel():
+            return  # annulée avant de commencer
+        try:
+            result = job()
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    def pending(self) -> int:
+        return self._pending
+
+    def _schedule_poll(self):
+        if self._after_id is None and not self._closed:
+            self._after_id = self.widget.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        """Relève les résultats terminés (thread Tk)."""
+        self._after_id = None
+        while True:
+            try:
+                on_done, future = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            if future.cancelled():
+                continue
+            error = future.exception()
+            result = None if error is not None else future.result()
+            try:
+                on_done(result, error)
+            except Exception:
+                pass
+
+        if self._pending > 0:
+            self._schedule_poll()
+
+    def shutdown(self):
+        """Arrête la relève et les workers (les tâches non commencées sont abandonnées)."""
+        self._closed = True
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        with self._queue_lock:
+            for _, _, future, _ in self._queue:
+                future.cancel()
+            self._queue.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
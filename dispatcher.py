@@ -0,0 +1,94 @@
+# dispatcher.py
+
+from room import DIRECTION_SYNONYMS
+
+
+# Raccourcis usuels -> commande (seulement si la commande existe dans la partie)
+COMMAND_ALIASES = {
+    "inv": "check",
+    "i": "check",
+    "inventaire": "check",
+    "l": "look",
+    "regarder": "look",
+    "aide": "help",
+    "?": "help",
+    "prendre": "take",
+    "poser": "drop",
+    "parler": "talk",
+    "retour": "back",
+    "quitter": "quit",
+}
+
+
+class Dispatcher:
+    """
+    Table de commandes "compilée" une fois (Game.setup_world), pour que
+    process_command n'ait plus qu'une recherche dans un dict par commande.
+
+    Un mot (en minuscules) donne (commande, argument imposé) :
+    - les mots des commandes : "go", "take", "t"...
+    - les alias de COMMAND_ALIASES : "inv" -> check
+    - les directions seules : "n", "nord", "bas" -> go N / go D
+    - les débuts de mots sans ambiguïté : "he" -> help, "loo" -> look
+      ("h" n'est pas ajouté : help ou history ?)
+    En cas de conflit, l'ordre ci-dessus décide (une direction passe avant un début de mot).
+
+    Les sorties valides de la salle restent vérifiées par Actions.go
+    (Room.exit_aliases, recalculé seulement si Room.exits change).
+    """
+
+    def __init__(self, commands: dict):
+        self.commands = commands
+        self.table = {}
+        self.compile()
+
+    def compile(self):
+        commands = self.commands
+        table = {}
+
+        for word in commands:
+            table[word.lower()] = (word, None)
+
+        for alias, word in COMMAND_ALIASES.items():
+            if word in commands:
+                table.setdefault(alias, (word, None))
+
+        if "go" in commands:
+            for canon, syns in DIRECTION_SYNONYMS.items():
+                for s in syns:
+                    table.setdefault(s.lower(), ("go", canon))
+
+        # Débuts de mots : on compte les mots complets qui commencent par chaque préfixe
+        owners = {}
+        for word, target in list(table.items()):
+            if target[1] is not None:
+                continue  # pas de préfixes pour les directions ("no" -> nord ? trop court pour être sûr)
+            for i in range(1, len(word)):
+                owners.setdefault(word[:i], set()).add(target)
+        for prefix, targets in owners.items():
+            if len(targets) == 1 and prefix not in table:
+                table[prefix] = next(iter(targets))
+
+        self.table = table
+        self._size = len(commands)
+
+    def parse(self, raw: str):
+        """
+        Découpe 'raw' et retrouve la commande.
+        Renvoie (Command, mots) avec mots[0] = le mot canonique de la commande,
+        ou (None, mots) si le premier mot est inconnu.
+        """
+        if len(self.commands) != self._size:
+            self.compile()  # commande ajoutée après coup
+
+        words = raw.split()
+        entry = self.table.get(words[0].lower())
+        if entry is None:
+            return None, words
+
+        word, forced = entry
+        if forced is not None:
+            words = [word, forced] + words[1:]
+        else:
+            words[0] = word
+        return self.commands[word], words
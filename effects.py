@@ -0,0 +1,145 @@
+# effects.py
+
+import time
+from functools import lru_cache
+
+
+# Teintes d'état (facteurs multiplicatifs R, G, B)
+TINTS = {
+    "injured": (1.15, 0.72, 0.72),    # blessé : image rougie
+    "labyrinth": (0.78, 0.88, 1.12),  # labyrinthe : lumière froide
+}
+
+# Fondu enchaîné des cinématiques : 8 images à 25 i/s (~0.3 s)
+FADE_FRAMES = 8
+FRAME_MS = 40
+
+
+def parse_ppm(data: bytes):
+    """
+    Lit l'en-tête d'un PPM binaire (P6, 8 bits).
+    Renvoie (largeur, hauteur, position du premier pixel).
+    """
+    fields = []
+    i = 2
+    if data[:2] != b"P6":
+        raise ValueError("PPM P6 attendu")
+    while len(fields) < 3:
+        while data[i:i + 1].isspace():
+            i += 1
+        if data[i:i + 1] == b"#":  # commentaire jusqu'à la fin de la ligne
+            i = data.index(b"\n", i) + 1
+            continue
+        j = i
+        while not data[j:j + 1].isspace():
+            j += 1
+        fields.append(int(data[i:j]))
+        i = j
+    w, h, maxval = fields
+    if maxval != 255:
+        raise ValueError("PPM 8 bits attendu")
+    return w, h, i + 1
+
+
+@lru_cache(maxsize=64)
+def _scale_table(factor: float) -> bytes:
+    """Table pour bytes.translate : v -> min(255, floor(v * factor))."""
+    return bytes(min(255, int(v * factor)) for v in range(256))
+
+
+def tint(ppm: bytes, factors) -> bytes:
+    """
+    Teinte une image PPM : chaque canal est multiplié par son facteur.
+
+    Pas de boucle sur les pixels en Python : chaque canal est extrait par
+    tranche (data[c::3]), converti par bytes.translate, puis réentrelacé.
+    """
+    w, h, off = parse_ppm(ppm)
+    out = bytearray(ppm)
+    for c, f in enumerate(factors):
+        out[off + c::3] = ppm[off + c::3].translate(_scale_table(round(f, 3)))
+    return bytes(out)
+
+
+def crossfade(ppm_a: bytes, ppm_b: bytes, t: float) -> bytes:
+    """
+    Mélange deux images PPM de même taille : a * (1 - t) + b * t.
+
+    Les deux moitiés sont pondérées par bytes.translate, puis additionnées
+    d'un coup comme deux grands entiers : floor(a*(1-t)) + floor(b*t) <= 255,
+    donc aucune retenue ne déborde d'un octet sur le suivant.
+    """
+    wa, ha, off_a = parse_ppm(ppm_a)
+    wb, hb, off_b = parse_ppm(ppm_b)
+    if (wa, ha) != (wb, hb):
+        raise ValueError("tailles différentes")
+
+    t = round(min(1.0, max(0.0, t)), 3)
+    pa = ppm_a[off_a:].translate(_scale_table(1.0 - t))
+    pb = ppm_b[off_b:].translate(_scale_table(t))
+    n = len(pa)
+    mixed = (int.from_bytes(pa, "big") + int.from_bytes(pb, "big")).to_bytes(n, "big")
+    return ppm_a[:off_a] + mixed
+
+
+class EffectPlayer:
+    """
+    Lecture d'une suite d'images sur des timers after(), à cadence fixe.
+
+    'frames' est un itérateur : chaque image n'est calculée qu'au moment de
+    son affichage, donc rien ne bloque la saisie entre deux images.
+    Une nouvelle lecture (ou cancel) interrompt la précédente.
+    """
+
+    def __init__(self, widget, frame_ms: int = FRAME_MS):
+        self.widget = widget
+        self.frame_ms = frame_ms
+
+        self._frames = None
+        self._on_frame = None
+        self._after_id = None
+
+    def play(self, frames, on_frame):
+        """Affiche chaque image de 'frames' via on_frame(image), une par période."""
+        self.cancel()
+        self._frames = iter(frames)
+        self._on_frame = on_frame
+        self._after_id = self.widget.after_idle(self._tick)
+
+    def cancel(self):
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = None
+        self._frames = None
+        self._on_frame = None
+
+    def is_running(self) -> bool:
+        return self._frames is not None
+
+    def _tick(self):
+        self._after_id = None
+        if self._frames is None:
+            return
+
+        t0 = time.perf_counter()
+        try:
+            frame = next(self._frames)
+        except StopIteration:
+            self._frames = None
+            self._on_frame = None
+            return
+        except Exception:
+            self.cancel()
+            return
+
+        try:
+            self._on_frame(frame)
+        except Exception:
+            pass
+
+        # Cadence stable : on retire le temps passé à calculer l'image
+        spent = int((time.perf_counter() - t0) * 1000)
+        self._after_id = self.widget.after(max(1, self.frame_ms - spent), self._tick)
@@ -0,0 +1,262 @@
+# engine.py
+
+import queue
+import sys
+import threading
+import traceback
+
+from minimap import layout_rooms
+from viewmodel import ViewModel
+
+
+class ThreadStdout:
+    """
+    sys.stdout partagé entre threads.
+
+    print() écrit toujours dans sys.stdout, qui est global au processus :
+    ici chaque thread peut brancher sa propre sortie (register), les autres
+    écrivent dans 'default' (la zone de texte de la GUI).
+    """
+
+    def __init__(self, default):
+        self.default = default
+        self._writers = {}
+
+    def register(self, writer):
+        self._writers[threading.get_ident()] = writer
+
+    def unregister(self):
+        self._writers.pop(threading.get_ident(), None)
+
+    def _target(self):
+        return self._writers.get(threading.get_ident(), self.default)
+
+    def write(self, s: str):
+        return self._target().write(s)
+
+    def flush(self):
+        self._target().flush()
+
+
+class GameEngine:
+    """
+    Fait tourner le Game dans un thread à lui : commandes, déclencheurs et
+    cinématiques ne bloquent plus la boucle Tk.
+
+    Le moteur ne touche JAMAIS à Tk. Il remplace la GUI auprès du Game
+    (game.gui = moteur) et transforme chaque demande en événement :
+    - la GUI envoie des messages avec post() :
+      ("setup",) / ("command", texte) / ("continue",) / ("stop",)
+    - le moteur répond dans la file 'events', relevée par la GUI via after() :
+      ("text", str)        texte affiché par print()
+      ("clear", None)      écran effacé
+      ("view", ViewModel)  état à afficher (panneau, image)
+      ("map", MapLayout)   plan du chapitre (une fois par chapitre)
+      ("pause", None)      la scène attend Entrée
+      ("ask_name", None)   demander le nom du joueur, réponse par answer()
+      ("message", str)     popup
+      ("disable", None)    saisie désactivée (fin du jeu)
+      ("turn_end", None)   fin du tour
+      ("ready", [(salle, image)...])  setup terminé (+ identifiants d'images à vérifier)
+    """
+
+    FLUSH_THRESHOLD = 16 * 1024
+
+    def __init__(self, game, stdout: ThreadStdout):
+        self.game = game
+        game.gui = self
+        # Pause : la scène reste suspendue, ("continue",) la reprend
+        game.wait_for_continue = self._pause
+
+        self.events = queue.Queue()
+        self._inbox = queue.Queue()
+        self._replies = queue.Queue()
+        self._stdout = stdout
+
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._parts = []
+        self._size = 0
+        self._deferred = None  # (commande, mode) tapée pendant qu'un déclencheur jouait une scène
+
+        # Plans de la minimap : calculés une fois par chapitre
+        self._layouts = {}
+        self._map_chapter = None
+
+        self._thread = threading.Thread(target=self._run, name="atlas-engine", daemon=True)
+
+    # -------------------------
+    # Côté GUI (thread Tk)
+    # -------------------------
+    def start(self):
+        self._thread.start()
+
+    def post(self, msg: tuple):
+        with self._lock:
+            self._pending += 1
+        self._inbox.put(msg)
+
+    def busy(self) -> bool:
+        """Vrai tant qu'un message n'est pas complètement traité (ou qu'il reste des événements)."""
+        with self._lock:
+            return self._pending > 0 or not self.events.empty()
+
+    def answer(self, value):
+        """Réponse à ("ask_name", None)."""
+        self._replies.put(value)
+
+    def stop(self):
+        self._replies.put(None)  # débloque une question en attente
+        self._inbox.put(("stop",))
+
+    # -------------------------
+    # Thread moteur
+    # -------------------------
+    def _run(self):
+        self._stdout.register(self)
+        try:
+            while True:
+                msg = self._inbox.get()
+                if msg[0] == "stop":
+                    return
+                try:
+                    self._handle(msg)
+                except Exception:
+                    traceback.print_exc(file=sys.__stderr__)
+                    self._end_turn()
+                finally:
+                    self.flush()
+                    with self._lock:
+                        self._pending -= 1
+        finally:
+            self._stdout.unregister()
+
+    def _handle(self, msg):
+        kind = msg[0]
+        game = self.game
+
+        if kind == "setup":
+            game.setup_world()
+            game.setup_player()
+            if game.start_intro():
+                self._end_turn()
+            self._emit("ready", game.room_assets())
+
+        elif kind == "command":
+            self._command(msg[1])
+
+        elif kind == "continue":
+            if game.scene_active() and game.resume_scene():
+                self._scene_finished()
+
+    def _command(self, cmd: str):
+        game = self.game
+        if game.finished or game.scene_active():
+            return
+
+        mode_before = game.input_mode
+
+        # Triggers AVANT de traiter la commande
+        if not game.run_scene(game.chapter_triggers()):
+            # Une scène attend Entrée : la commande sera exécutée à sa fin
+            self._deferred = (cmd, mode_before)
+            return
+
+        # Si un trigger vient d'activer un dilemme (CHOICE), on s'arrête là
+        if mode_before == "NORMAL" and game.input_mode == "CHOICE":
+            self.refresh_room_image()
+            return
+
+        game.process_command(cmd)
+        if game.scene_active():
+            return  # le tour se terminera à la fin de la scène
+
+        self._end_turn()
+
+    def _scene_finished(self):
+        """
+        Fin d'une scène : on termine le tour comme après une commande.
+        Si la scène venait d'un déclencheur, la commande tapée est exécutée maintenant
+        (sauf si la scène a ouvert un dilemme).
+        """
+        deferred, self._deferred = self._deferred, None
+        if deferred is not None:
+            cmd, mode_before = deferred
+            if mode_before == "NORMAL" and self.game.input_mode == "CHOICE":
+                self.refresh_room_image()
+                return
+            self.game.process_command(cmd)
+            if self.game.scene_active():
+                return
+        self._end_turn()
+
+    def _end_turn(self):
+        self.refresh_room_image()
+        self._emit("turn_end")
+
+    def _pause(self, txt="\n(Appuie sur Entrée pour continuer) ") -> bool:
+        print(txt)
+        # L'image de la cinématique change souvent juste avant la pause
+        self.refresh_room_image()
+        self._emit("pause")
+        return False
+
+    def _emit(self, kind: str, data=None):
+        if kind != "text":
+            self.flush()  # le texte d'abord, dans l'ordre où il a été écrit
+        self.events.put((kind, data))
+
+    # -------------------------
+    # sys.stdout du thread moteur
+    # -------------------------
+    def write(self, s: str):
+        if not s:
+            return
+        self._parts.append(s)
+        self._size += len(s)
+        if self._size >= self.FLUSH_THRESHOLD:
+            self.flush()
+
+    def flush(self):
+        if not self._parts:
+            return
+        text = "".join(self._parts)
+        self._parts = []
+        self._size = 0
+        self.events.put(("text", text))
+
+    # -------------------------
+    # Ce que le Game attend de sa "gui"
+    # -------------------------
+    def clear_output(self):
+        # Le texte en attente part d'abord (_emit) : la GUI l'efface de l'écran,
+        # mais il reste dans le journal de la partie (Transcript)
+        self._emit("clear")
+
+    def refresh_room_image(self):
+        self._send_map()
+        self._emit("view", ViewModel.from_game(self.game))
+
+    def _send_map(self):
+        chapter = self.game.chapter
+        if chapter == self._map_chapter:
+            return
+        layout = self._layouts.get(chapter)
+        if layout is None:
+            rooms, start = self.game.chapter_rooms()
+            if not rooms:
+                return
+            layout = self._layouts[chapter] = layout_rooms(chapter, rooms, start)
+        self._map_chapter = chapter
+        self._emit("map", layout)
+
+    def disable_inputs(self):
+        self._emit("disable")
+
+    def ask_player_name(self) -> str:
+        self._emit("ask_name")
+        name = self._replies.get()
+        return name if name else "Inconnu"
+
+    def show_message(self, text: str):
+        self._emit("message", text)
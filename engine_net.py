@@ -0,0 +1,257 @@
+# engine_net.py
+"""
+Moteur dans un processus séparé, relié à la GUI par une socket Unix locale.
+
+Protocole : chaque trame = longueur (4 octets, gros-boutiste) + JSON UTF-8.
+- client -> moteur : ["post", [message...]] ou ["answer", valeur]
+- moteur -> client : {"kind": ..., "data": ...}, les mêmes événements que
+  GameEngine (texte, ViewModel, plan, pause...), ViewModel / MapLayout en dict.
+
+Usage :
+    python game.py --serve                # moteur sans fenêtre (une partie par client)
+    python game.py --engine               # GUI "client léger" reliée à ce moteur
+    (les deux acceptent un chemin de socket : --serve /tmp/atlas.sock)
+
+Le moteur peut alors être relancé, profilé ou partagé sans toucher à la fenêtre.
+"""
+
+import dataclasses
+import json
+import os
+import queue
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import threading
+
+from engine import GameEngine, ThreadStdout
+from minimap import MapLayout
+from viewmodel import ViewModel
+
+
+# Trame maximale acceptée (un écran de texte fait quelques Ko)
+MAX_FRAME = 16 * 1024 * 1024
+
+# Événements dont la donnée est un dataclass figé
+_EVENT_TYPES = {"view": ViewModel, "map": MapLayout}
+
+
+def default_socket_path() -> str:
+    """$XDG_RUNTIME_DIR/atlas2160.sock, sinon dans le dossier temporaire."""
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(base, "atlas2160.sock")
+
+
+# -------------------------
+# Trames
+# -------------------------
+def send_frame(sock, obj):
+    data = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    sock.sendall(struct.pack(">I", len(data)) + data)
+
+
+def _recv_exact(sock, n: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            raise EOFError("connexion fermée")
+        buf += chunk
+    return bytes(buf)
+
+
+def recv_frame(sock):
+    (length,) = struct.unpack(">I", _recv_exact(sock, 4))
+    if length > MAX_FRAME:
+        raise ValueError(f"trame trop grande ({length} octets)")
+    return json.loads(_recv_exact(sock, length).decode("utf-8"))
+
+
+def _encode(data):
+    return dataclasses.asdict(data) if dataclasses.is_dataclass(data) else data
+
+
+def _tuples(value):
+    """JSON renvoie des listes : on remet les tuples attendus par les dataclass figés."""
+    if isinstance(value, list):
+        return tuple(_tuples(v) for v in value)
+    return value
+
+
+def _decode(kind: str, data):
+    cls = _EVENT_TYPES.get(kind)
+    if cls is None or not isinstance(data, dict):
+        return data
+    return cls(**{k: _tuples(v) for k, v in data.items()})
+
+
+# -------------------------
+# Côté moteur (processus sans fenêtre)
+# -------------------------
+def _free_socket_path(path: str):
+    """
+    Libère 'path' avant bind() : seule une socket abandonnée (plus personne
+    n'y répond) est supprimée. Renvoie un message d'erreur si le chemin est
+    un autre fichier ou si un moteur y écoute déjà, sinon None.
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return None
+    if not stat.S_ISSOCK(mode):
+        return f"{path} existe et n'est pas une socket : choisissez un autre chemin."
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)  # socket d'un moteur arrêté sans nettoyer
+        return None
+    finally:
+        probe.close()
+    return f"Un moteur écoute déjà sur {path}."
+
+
+def serve(path: str, make_game):
+    """
+    Attend les clients sur la socket 'path'. Chaque client a sa propre partie
+    (make_game()) et son propre GameEngine ; Ctrl+C arrête le serveur.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        print("Sockets Unix indisponibles sur ce système.", file=sys.stderr)
+        return 1
+
+    error = _free_socket_path(path)
+    if error:
+        print(error, file=sys.stderr)
+        return 1
+
+    stdout = ThreadStdout(sys.__stdout__)
+    sys.stdout = stdout
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    bound = os.lstat(path)
+    server.listen()
+    print(f"[moteur] en écoute sur {path}", file=sys.__stderr__)
+    try:
+        while True:
+            conn, _ = server.accept()
+            threading.Thread(
+                target=_serve_client, args=(conn, make_game(), stdout), name="atlas-client", daemon=True
+            ).start()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        try:
+            # Seulement notre socket (pas un fichier recréé entre-temps à ce chemin)
+            if os.path.samestat(os.lstat(path), bound):
+                os.unlink(path)
+        except OSError:
+            pass
+    return 0
+
+
+def _serve_client(conn, game, stdout):
+    engine = GameEngine(game, stdout)
+    engine.start()
+    closed = threading.Event()
+
+    def read_loop():
+        try:
+            while True:
+                op, value = recv_frame(conn)
+                if op == "post":
+                    engine.post(tuple(value))
+                elif op == "answer":
+                    engine.answer(value)
+        except (EOFError, OSError, ValueError, TypeError):
+            pass  # client parti ou trame invalide : on ferme sa partie
+        finally:
+            closed.set()
+            engine.stop()
+
+    threading.Thread(target=read_loop, name="atlas-client-read", daemon=True).start()
+    try:
+        while not closed.is_set():
+            try:
+                kind, data = engine.events.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            send_frame(conn, {"kind": kind, "data": _encode(data)})
+    except OSError:
+        engine.stop()
+    finally:
+        conn.close()
+
+
+# -------------------------
+# Côté GUI (client léger)
+# -------------------------
+class RemoteEngine:
+    """
+    Même interface que GameEngine pour GameGUI (start / post / events / busy /
+    answer / stop), mais le Game tourne dans un autre processus.
+    Si le moteur s'arrête, la GUI reste ouverte : un message s'affiche et la saisie est coupée.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.events = queue.Queue()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.connect(path)
+        self._send_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._read_loop, name="atlas-remote", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def post(self, msg: tuple):
+        self._send(["post", list(msg)])
+
+    def busy(self) -> bool:
+        """
+        Tant que la connexion est ouverte, on relève en continu : le moteur distant
+        peut écrire à tout moment (et sa perte doit s'afficher).
+        """
+        return not self._closed or not self.events.empty()
+
+    def answer(self, value):
+        self._send(["answer", value])
+
+    def stop(self):
+        self._closed = True
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+
+    def _send(self, obj):
+        try:
+            with self._send_lock:
+                send_frame(self._sock, obj)
+        except OSError:
+            self._lost()
+
+    def _read_loop(self):
+        try:
+            while True:
+                frame = recv_frame(self._sock)
+                kind = frame["kind"]
+                self.events.put((kind, _decode(kind, frame["data"])))
+        except (EOFError, OSError, ValueError, TypeError, KeyError):
+            # Connexion coupée ou trame inattendue (JSON invalide, pas un dict,
+            # clé manquante, champ de ViewModel inconnu) : la GUI doit le savoir,
+            # sinon elle attend pour toujours un moteur qui ne répond plus
+            self._lost()
+
+    def _lost(self):
+        if self._closed:
+            return
+        self._closed = True
+        self.events.put(("text", "\n(Connexion au moteur perdue.)\n"))
+        self.events.put(("disable", None))
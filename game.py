@@ -1,7 +1,6 @@
-import os
+import argparse
+import inspect
 import sys
-import tkinter as tk
-from tkinter import messagebox, simpledialog
 
 from room import Room
 from player import Player
@@ -10,16 +9,47 @@ from actions import Actions
 from item import Item
 from quest import Quest, QuestManager
 from character import Argos, Cassian
+from completion import Completer
+from dispatcher import Dispatcher
+from terminal import TerminalRenderer, status_line
+from viewmodel import ViewModel
+
+
+# Images des cinématiques de fin, dans l'ordre d'apparition
+# (end_of_demo -> run_outro -> run_helias_last_action -> run_truth_reveal)
+OUTRO_IMAGES = (
+    "OUTRO_EndOfDemo.png",
+    "OUTRO_Convergence.png",
+    "OUTRO_Node.png",
+    "OUTRO_Helias_Anchor.png",
+    "OUTRO_Helias_Choice.png",
+    "OUTRO_Truth_Reveal.png",
+    "OUTRO_Before_Helias.png",
+    "OUTRO_ATLAS_System.png",
+    "OUTRO_Fall.png",
+    "OUTRO_Why_You.png",
+    "OUTRO_Sole_Survivor.png",
+    "OUTRO_Cassian_Argos.png",
+    "OUTRO_Ringing.png",
+    "OUTRO_Beep.png",
+    "OUTRO_Wakeup_Ceiling.png",
+    "OUTRO_Wakeup_Bed.png",
+    "OUTRO_Wakeup_Hallway.png",
+    "OUTRO_Final_Title.png",
+)
 
 
 class Game:
     def __init__(self):
         self.commands = {}
+        self.dispatcher = None  # table des commandes compilée au setup (cf. Dispatcher)
         self.finished = False
         self.gui = None
+        self.terminal = None  # TerminalRenderer du mode CLI (cf. play)
         self.player = None
         self.chapter = 1
         self.qm = QuestManager()
+        self.quest_log = []  # tous les messages de quêtes affichés (enregistrements de --batch)
 
         # Modes d'entrée
         self.input_mode = "NORMAL"  # NORMAL / CHOICE
@@ -61,6 +91,9 @@ class Game:
         # Cutscene image override (GUI)
         self._override_image = None
 
+        # Scène en cours (générateur suspendu sur une pause), cf. run_scene
+        self._scene = None
+
         # Chapter rooms placeholders
         self.ch1_start = None
         self.ch2_spawn = None
@@ -80,14 +113,84 @@ class Game:
             except Exception:
                 pass
             return
-        os.system("cls" if os.name == "nt" else "clear")
+        if self.terminal is not None:
+            self.terminal.clear()
+            self.update_status()
 
+    def update_status(self, view=None):
+        """CLI : ligne de statut fixe (salle, sorties, quête), réécrite seulement si elle change."""
+        if self.terminal is None:
+            return
+        try:
+            self.terminal.set_status(status_line(view or ViewModel.from_game(self)))
+        except Exception:
+            pass
+
+    # =========================
+    # SCÈNES (pauses sans boucle imbriquée)
+    # =========================
     def pause(self, txt="\n(Appuie sur Entrée pour continuer) "):
-        # En GUI, GameGUI remplace self.pause par gui_pause.
+        """
+        Point de pause d'une scène, à utiliser avec : yield self.pause()
+
+        Une scène est un générateur : à chaque pause elle est suspendue,
+        puis reprise par run_scene / resume_scene. Une scène qui en lance
+        une autre fait 'yield from self.autre_scene()' : la pile reste plate.
+        """
+        return txt
+
+    def wait_for_continue(self, txt) -> bool:
+        """
+        Attente d'Entrée pendant une pause.
+        - CLI : input() puis True (la scène continue tout de suite)
+        - GUI : le moteur (engine.py) remplace cette méthode par sa pause, qui renvoie
+          False ; la scène reste suspendue jusqu'à resume_scene (touche Entrée)
+        Sans Tk (tests, scripts) : game.wait_for_continue = lambda txt: True
+        """
         try:
             input(txt)
         except EOFError:
             pass
+        return True
+
+    def run_scene(self, scene) -> bool:
+        """
+        Lance une scène (ou ne fait rien si ce n'en est pas une, ex: None).
+        Renvoie True si elle est terminée, False si elle attend Entrée.
+        """
+        if not inspect.isgenerator(scene):
+            return True
+        self._scene = scene
+        return self.resume_scene()
+
+    def resume_scene(self) -> bool:
+        """Reprend la scène suspendue jusqu'à la pause suivante (False) ou sa fin (True)."""
+        scene = self._scene
+        while scene is not None:
+            try:
+                txt = next(scene)
+            except StopIteration:
+                break
+            except Exception:
+                print("\nErreur pendant la scène.\n")
+                break
+            if not self.wait_for_continue(txt):
+                return False
+        self._scene = None
+        return True
+
+    def scene_active(self) -> bool:
+        return self._scene is not None
+
+    def chapter_triggers(self):
+        """Scène des déclencheurs du chapitre courant (avant chaque commande)."""
+        if self.chapter == 1:
+            yield from self.chapter1_triggers()
+            yield from self.chapter1_check_special_paths()
+        elif self.chapter == 2:
+            yield from self.chapter2_triggers()
+        elif self.chapter == 3:
+            yield from self.chapter3_triggers()
 
     def end_game(self, message: str = "", mock: str = "", show_msgbox: bool = True):
         """
@@ -117,10 +220,76 @@ class Game:
                 pass
             if show_msgbox:
                 try:
-                    messagebox.showinfo("ATLAS 2160", "Fin du jeu.")
+                    self.gui.show_message("Fin du jeu.")  # après le texte de fin
                 except Exception:
                     pass
 
+    def all_rooms(self) -> list:
+        """Salles fixes des trois chapitres (les salles du labyrinthe sont créées à la volée)."""
+        return list(self.rooms) + list(getattr(self, "ch2_rooms", [])) + list(getattr(self, "ch3_rooms", []))
+
+    def room_assets(self) -> list:
+        """
+        (nom, asset_id) de toutes les salles, labyrinthe et conduits compris
+        (ils sont construits à part, juste pour la liste). Sert à vérifier au
+        démarrage que chaque identifiant a son image.
+        """
+        rooms = list(self.all_rooms())
+        entry, _, deaths = self.build_labyrinth_rooms()
+        seen = set()
+        todo = [entry, self.build_soft_conduit_rooms()[0]] + list(deaths)
+        while todo:
+            room = todo.pop()
+            if id(room) in seen:
+                continue
+            seen.add(id(room))
+            if room not in rooms:
+                rooms.append(room)
+            todo.extend(dest for dest in room.exits.values() if dest is not None)
+        return [(r.name, r.asset_id) for r in rooms]
+
+    def chapter_rooms(self):
+        """(salles fixes, salle de départ) du chapitre courant (sert à la minimap)."""
+        if self.chapter == 1:
+            return list(self.rooms), self.ch1_start
+        if self.chapter == 2:
+            return list(getattr(self, "ch2_rooms", [])), self.ch2_spawn
+        if self.chapter == 3:
+            return list(getattr(self, "ch3_rooms", [])), self.ch3_spawn
+        return [], None
+
+    def upcoming_images(self, lookahead: int = 3) -> list:
+        """
+        Images que le joueur a de bonnes chances de voir ensuite (par priorité) :
+        noms de fichiers OUTRO ou identifiants de salles (room.asset_id).
+
+        Sert au préchargement GUI :
+        - en cinématique de fin : les prochaines images OUTRO
+        - sinon : les salles accessibles depuis la salle courante
+        - puis la salle d'arrivée du chapitre suivant (ou le début de l'outro)
+        """
+        names = []
+
+        override = self._override_image
+        if override in OUTRO_IMAGES:
+            i = OUTRO_IMAGES.index(override)
+            names.extend(OUTRO_IMAGES[i + 1:i + 1 + lookahead])
+
+        room = self.player.current_room if self.player else None
+        if room is not None:
+            for dest in room.exits.values():
+                if dest is not None:
+                    names.append(dest.asset_id)
+
+        if self.chapter == 1 and self.ch2_spawn is not None:
+            names.append(self.ch2_spawn.asset_id)
+        elif self.chapter == 2 and self.ch3_spawn is not None:
+            names.append(self.ch3_spawn.asset_id)
+        elif self.chapter == 3:
+            names.extend(OUTRO_IMAGES[:lookahead])
+
+        return names
+
     # =========================
     # CHOICE MODE (FIX)
     # =========================
@@ -188,7 +357,7 @@ Il finit par s’éloigner.
 
 Et là, la mémoire te revient peu à peu…
         """.strip())
-        self.pause()
+        yield self.pause()
 
         if self.gui is None:
             self.clear_screen()
@@ -224,7 +393,7 @@ Au loin, au nord, sa silhouette métallique tient encore debout.
 
 Ta mission — ta survie — commence maintenant.
         """.strip())
-        self.pause()
+        yield self.pause()
 
         # Fin intro
         self._override_image = None
@@ -233,6 +402,12 @@ Ta mission — ta survie — commence maintenant.
     # SETUP
     # =========================
     def setup(self):
+        self.setup_world()
+        self.setup_player()
+        self.start_intro()
+
+    def setup_world(self):
+        """Commandes + cartes des trois chapitres (rien n'est affiché)."""
         self.commands["help"] = Command("help", " : afficher cette aide", Actions.help, 0)
         self.commands["quit"] = Command("quit", " : quitter le jeu", Actions.quit, 0)
         self.commands["go"] = Command("go", " <direction> : se déplacer (N,E,S,O,U,D)", Actions.go, 1)
@@ -258,8 +433,17 @@ Ta mission — ta survie — commence maintenant.
         self.build_chapter2_map()
         self.build_chapter3_map()
 
+        # Mots, alias, directions seules et débuts de mots : une table, construite une fois
+        self.dispatcher = Dispatcher(self.commands)
+        for room in self.all_rooms():
+            room.exit_aliases()
+
+    def setup_player(self, name: str = None):
+        """Nom du joueur (demandé s'il n'est pas donné) + quêtes."""
         self.clear_screen()
-        if self.gui is not None:
+        if name is not None:
+            name = name.strip()
+        elif self.gui is not None:
             name = self.gui.ask_player_name()
         else:
             name = input("Identité (écris ton nom) > ").strip()
@@ -271,7 +455,12 @@ Ta mission — ta survie — commence maintenant.
         self._install_quests()  # crée toutes les quêtes
         self.qm.activate("Q1")  # quête principale active au début
 
-        self.cinematic_intro_split()
+    def start_intro(self):
+        """Lance la cinématique d'introduction (True si elle est déjà terminée)."""
+        return self.run_scene(self._intro_scene())
+
+    def _intro_scene(self):
+        yield from self.cinematic_intro_split()
 
         self.chapter = 1
         self.player.current_room = self.ch1_start
@@ -353,6 +542,7 @@ Ta mission — ta survie — commence maintenant.
     def _print_quest_updates(self):
         updates = self.qm.pop_updates()
         if updates:
+            self.quest_log.extend(updates)
             print("\n".join(updates))
             print()
 
@@ -360,22 +550,54 @@ Ta mission — ta survie — commence maintenant.
     # LOOP
     # =========================
     def play(self):
-        self.setup()
-
-        if self.gui is not None:
-            return
+        if self.gui is None:
+            # CLI : écran et ligne de statut en séquences ANSI, un write par écran
+            self.terminal = TerminalRenderer()
+            sys.stdout = self.terminal
+        try:
+            self.setup()
 
-        while not self.finished:
-            if self.chapter == 1:
-                self.chapter1_triggers()
-                self.chapter1_check_special_paths()
-            elif self.chapter == 2:
-                self.chapter2_triggers()
-            elif self.chapter == 3:
-                self.chapter3_triggers()
+            if self.gui is not None:
+                return
 
-            cmd = input("> ")
-            self.process_command(cmd)
+            completer = self._install_completion()
+            while not self.finished:
+                self.run_scene(self.chapter_triggers())
+
+                view = ViewModel.from_game(self)
+                self.update_status(view)
+                if completer is not None:
+                    completer.update(view)  # une fois par tour, pas par frappe
+                cmd = input("> ")
+                self.process_command(cmd)
+        finally:
+            if self.terminal is not None:
+                self.terminal.close()
+                sys.stdout = self.terminal.out
+                self.terminal = None
+
+    def _install_completion(self):
+        """CLI : Tab complète commandes, objets, personnages et sorties (si readline est disponible)."""
+        try:
+            import readline
+        except ImportError:
+            return None
+
+        completer = Completer()
+        matches = []
+
+        def complete(text, state):
+            if state == 0:
+                matches[:] = completer.complete(readline.get_line_buffer()[:readline.get_endidx()])
+            return matches[state] if state < len(matches) else None
+
+        readline.set_completer_delims("")  # on complète la ligne entière ("drop frag" -> "drop Fragment_Beta")
+        readline.set_completer(complete)
+        if "libedit" in (readline.__doc__ or ""):
+            readline.parse_and_bind("bind ^I rl_complete")
+        else:
+            readline.parse_and_bind("tab: complete")
+        return completer
 
     def process_command(self, command_string) -> None:
         if command_string is None:
@@ -408,16 +630,18 @@ Ta mission — ta survie — commence maintenant.
                 print(self.choice_prompt)
                 return
             try:
-                self.choice_handler(self, ans_up)
+                self.run_scene(self.choice_handler(self, ans_up))
             except Exception:
                 print("\nErreur : choix indisponible.\n")
             return
 
         # Mode normal
-        list_of_words = raw.split()
+        if self.dispatcher is None:
+            self.dispatcher = Dispatcher(self.commands)
+        command, list_of_words = self.dispatcher.parse(raw)
         command_word = list_of_words[0]
 
-        if command_word not in self.commands:
+        if command is None:
             print(f"\nCommande '{command_word}' non reconnue. Entrez 'help' pour voir la liste.\n")
             return
 
@@ -439,7 +663,6 @@ Ta mission — ta survie — commence maintenant.
                 print("\nImpossible de ramasser.\n")
                 return
 
-        command = self.commands[command_word]
         try:
             command.action(self, list_of_words, command.number_of_parameters)
         except Exception:
@@ -522,57 +745,68 @@ Ta mission — ta survie — commence maintenant.
         surface_ruins = Room(
             "Surface Ruins",
             "au milieu des ruines d’une métropole détruite. Drones brûlés, façades éventrées…\n"
-            "Un silence lourd règne, comme si la ville retenait encore sa respiration."
+            "Un silence lourd règne, comme si la ville retenait encore sa respiration.",
+            asset_id="surface_ruins",
         )
         biodome = Room(
             "BioDome",
             "dans une serre géante fissurée. La végétation artificielle se décompose en silence…\n"
-            "Au sol, des traces récentes contredisent l’abandon apparent."
+            "Au sol, des traces récentes contredisent l’abandon apparent.",
+            asset_id="biodome",
         )
         storage_b7 = Room(
             "Storage B7",
             "dans un entrepôt militaire fracturé. Des caisses scellées, des cadenas explosés.\n"
-            "Un message peint à la hâte sur un mur : « NE FAITES PLUS CONFIANCE AUX IA. »"
+            "Un message peint à la hâte sur un mur : « NE FAITES PLUS CONFIANCE AUX IA. »",
+            asset_id="storage_b7",
         )
         nexus_gate = Room(
             "Nexus Gate",
             "devant une porte blindée colossale : l’entrée principale de la Forteresse ATLAS.\n"
-            "Le système est verrouillé. Un écran muet affiche : « ACCÈS OPÉRATEUR REQUIS. »"
+            "Le système est verrouillé. Un écran muet affiche : « ACCÈS OPÉRATEUR REQUIS. »",
+            asset_id="nexus_gate",
         )
         cryolab_12 = Room(
             "CryoLab 12",
             "dans un laboratoire glacé. Des capsules de stase sont ouvertes… certaines sont vides.\n"
-            "Une buée froide se traîne au ras du sol, comme une présence."
+            "Une buée froide se traîne au ras du sol, comme une présence.",
+            asset_id="cryolab_12",
         )
         neurolink = Room(
             "NeuroLink Chamber",
             "dans une chambre neurale. Des casques reliés à des interfaces encore actives par intermittence.\n"
-            "Par moments, un léger bourdonnement ressemble à… un murmure."
+            "Par moments, un léger bourdonnement ressemble à… un murmure.",
+            asset_id="neurolink_chamber",
         )
         watchtower = Room(
             "Watchtower Omega",
             "au sommet d’une tour d’observation. La zone entière se dévoile sous un ciel chargé.\n"
-            "Un seul instrument fonctionne encore : il pointe obstinément… vers la surface."
+            "Un seul instrument fonctionne encore : il pointe obstinément… vers la surface.",
+            asset_id="watchtower_omega",
         )
         drone_hub = Room(
             "Drone Control Hub",
             "dans un centre de commande. Les consoles sont mortes… sauf une, encore chaude.\n"
-            "Quelqu’un était ici récemment. Très récemment."
+            "Quelqu’un était ici récemment. Très récemment.",
+            asset_id="drone_control_hub",
         )
         quantum_core = Room(
             "Quantum Core Room",
             "dans une salle où un réacteur quantique pulse, instable. Des alarmes figées clignotent.\n"
-            "Tu sens que cet endroit n’attend qu’un prétexte pour… repartir."
+            "Tu sens que cet endroit n’attend qu’un prétexte pour… repartir.",
+            asset_id="quantum_core_room",
         )
         teleport_bay = Room(
             "Teleportation Bay",
             "dans une baie de téléportation : trois anneaux énergétiques à moitié endormis.\n"
-            "L’air y est étrangement plus froid… comme si le temps lui-même avait du mal à circuler."
+            "L’air y est étrangement plus froid… comme si le temps lui-même avait du mal à circuler.",
+            asset_id="teleportation_bay",
         )
         vault_x09 = Room(
             "Vault X-09",
             "devant une salle interdite noyée dans une lumière bleu-glacée.\n"
-            "Tu as la sensation d’être observé avant même d’y entrer."
+            "Tu as la sensation d’être observé avant même d’y entrer.",
+            asset_id="vault_x_09",
         )
 
         # exits
@@ -624,32 +858,38 @@ Ta mission — ta survie — commence maintenant.
         v_spawn = Room(
             "Verdun — Tranchée d’arrivée (1916)",
             "dans une tranchée boueuse. Les explosions font trembler la terre.\n"
-            "Le temps te paraît… irrégulier, comme si certaines secondes refusaient d’avancer."
+            "Le temps te paraît… irrégulier, comme si certaines secondes refusaient d’avancer.",
+            asset_id="verdun_tranchee_d_arrivee_1916",
         )
         v_post = Room(
             "Poste de liaison",
             "dans un abri saturé de fumée. Des cartes, des messages, des ordres maculés.\n"
-            "Un sergent te fixe : « Toi. Tu cours. Maintenant. »"
+            "Un sergent te fixe : « Toi. Tu cours. Maintenant. »",
+            asset_id="poste_de_liaison",
         )
         v_no_mans = Room(
             "No Man’s Land",
             "entre deux mondes. Barbelés, cratères, cris lointains.\n"
-            "Chaque pas est un pari — et pourtant, quelque chose te guide."
+            "Chaque pas est un pari — et pourtant, quelque chose te guide.",
+            asset_id="no_man_s_land",
         )
         v_crater = Room(
             "Cratère silencieux",
             "dans un cratère où l’air est étrangement froid, presque “neutre”.\n"
-            "Le même froid que dans la Teleportation Bay… impossible."
+            "Le même froid que dans la Teleportation Bay… impossible.",
+            asset_id="cratere_silencieux",
         )
         v_ruin = Room(
             "Ruines d’un village",
             "dans des ruines écrasées. Une cloche fendue pend, immobile.\n"
-            "Tu sens l’Hélias “tirer” sur le temps, ici plus qu’ailleurs."
+            "Tu sens l’Hélias “tirer” sur le temps, ici plus qu’ailleurs.",
+            asset_id="ruines_d_un_village",
         )
         v_exit = Room(
             "Point d’extraction temporel",
             "face à une lueur pâle, comme un anneau incomplet qui cherche sa forme.\n"
-            "Tu comprends : ton passage laisse une trace."
+            "Tu comprends : ton passage laisse une trace.",
+            asset_id="point_d_extraction_temporel",
         )
 
         v_spawn.exits = {"E": v_post, "N": v_no_mans}
@@ -670,32 +910,38 @@ Ta mission — ta survie — commence maintenant.
         b_spawn = Room(
             "Barbarossa — PC Avancé (1941)",
             "dans un poste de commandement improvisé. Radios, cartes, voix pressées.\n"
-            "Tu comprends vite : ici, on ne survit pas en étant brave… mais en décidant vite."
+            "Tu comprends vite : ici, on ne survit pas en étant brave… mais en décidant vite.",
+            asset_id="barbarossa_pc_avance_1941",
         )
         b_map = Room(
             "Table des cartes",
             "devant une carte immense. Des pions, des flèches, des axes d’attaque.\n"
-            "On attend ton ordre. Sans savoir qui tu es… ni d’où tu viens."
+            "On attend ton ordre. Sans savoir qui tu es… ni d’où tu viens.",
+            asset_id="barbarossa_pc_avance_1941",  # pas d'image à part : la table est dans le PC avancé
         )
         b_field = Room(
             "Ligne de front",
             "sur un terrain labouré par les chenilles. Un froid sec mord la peau.\n"
-            "Le temps grésille parfois, comme une bande usée."
+            "Le temps grésille parfois, comme une bande usée.",
+            asset_id="ligne_de_front",
         )
         b_farm = Room(
             "Ferme abandonnée",
             "dans une ferme vide. Des traces de vie… puis plus rien.\n"
-            "Une radio capte un signal étrange : trop “propre” pour 1941."
+            "Une radio capte un signal étrange : trop “propre” pour 1941.",
+            asset_id="ferme_abandonnee",
         )
         b_bunker = Room(
             "Bunker de communication",
             "dans un bunker. Au mur, un boîtier inconnu — pas de cette époque.\n"
-            "Tu le reconnais : une interface de relais… proche de la signature ATLAS."
+            "Tu le reconnais : une interface de relais… proche de la signature ATLAS.",
+            asset_id="bunker_de_communication",
         )
         b_exit = Room(
             "Portail de convergence",
             "devant un halo blanc, instable. Comme si l’Hélias forçait un retour.\n"
-            "Quelque chose t’attend de l’autre côté."
+            "Quelque chose t’attend de l’autre côté.",
+            asset_id="outro_convergence",  # même portail que la cinématique OUTRO_Convergence
         )
 
         b_spawn.exits = {"E": b_map, "N": b_field}
@@ -719,7 +965,7 @@ Ta mission — ta survie — commence maintenant.
             self.story_started = True
 
         if not self.drone_choice_done:
-            self.try_trigger_drone_scene()
+            yield from self.try_trigger_drone_scene()
 
         if self.has_vault_access:
             if "E" not in self.ch1_teleport_bay.exits:
@@ -727,7 +973,7 @@ Ta mission — ta survie — commence maintenant.
 
         if self.argos_choice_done and not self.cassian_choice_done:
             if self.player.current_room == self.ch1_quantum_core:
-                self.run_cassian_scene()
+                yield from self.run_cassian_scene()
 
     def try_trigger_drone_scene(self):
         # Il faut avoir visité toutes les rooms de ch1 sauf Vault X-09
@@ -750,7 +996,7 @@ Ta mission — ta survie — commence maintenant.
             return
 
         self.drone_choice_done = True
-        self.run_drone_scene()
+        yield from self.run_drone_scene()
 
     # =========================
     # DRONE SCENE (lose -> END GAME)
@@ -764,7 +1010,7 @@ Ta mission — ta survie — commence maintenant.
         print("Instinctivement, tu reviens vers Nexus Gate.")
         print("Tu ne sais pas pourquoi… mais tu sens que la source de cette pulsation")
         print("n’est pas loin de la Teleportation Bay.\n")
-        self.pause()
+        yield self.pause()
 
         self.player.current_room = self.ch1_nexus_gate
         if hasattr(self.player.current_room, "visited"):
@@ -785,7 +1031,7 @@ Ta mission — ta survie — commence maintenant.
 
         print("Un grésillement retentit.")
         print("SENTINEL-01 : « 🔺 CIBLE BIOLOGIQUE POTENTIELLE DANS LE SECTEUR. SCAN EN COURS. »\n")
-        self.pause()
+        yield self.pause()
 
         prompt = (
             "\nTu dois récupérer le badge.\n"
@@ -856,7 +1102,7 @@ Ta mission — ta survie — commence maintenant.
 
         print("Dans un haut-parleur mourant, une dernière phrase :")
         print("« …anomalie… non prévue… »\n")
-        game.pause()
+        yield game.pause()
 
         game.player_injured = False
         game.has_vault_access = True
@@ -869,7 +1115,7 @@ Ta mission — ta survie — commence maintenant.
         game.clear_screen()
         print("Le badge serre ta paume. La pulsation revient, plus claire.")
         print("Elle te tire vers la Teleportation Bay, comme une boussole faite de froid.\n")
-        game.pause()
+        yield game.pause()
 
         game.player.current_room = game.ch1_teleport_bay
         if hasattr(game.player.current_room, "visited"):
@@ -879,13 +1125,13 @@ Ta mission — ta survie — commence maintenant.
         print(game.player.current_room.get_long_description())
         game.player.current_room.show_inventory()
         print("\nUn lecteur de badge clignote faiblement sur une plaque murale.\n")
-        game.pause()
+        yield game.pause()
 
         game.ch1_teleport_bay.exits["E"] = game.ch1_vault_x09
         print("Tu approches le badge.")
         print("Un déclic sec.")
         print("Un panneau se rétracte, révélant un couloir enfoui.\n")
-        game.pause()
+        yield game.pause()
 
         game.player.current_room = game.ch1_vault_x09
         if hasattr(game.player.current_room, "visited"):
@@ -961,7 +1207,7 @@ Ta mission — ta survie — commence maintenant.
             game.argos_ally = False
             game.argos_choice_done = True
             game.exit_choice_mode()
-            game.start_labyrinth()
+            yield from game.start_labyrinth()
             return
 
         # E
@@ -983,30 +1229,51 @@ Ta mission — ta survie — commence maintenant.
         game.argos_ally = True
         game.argos_choice_done = True
         game.exit_choice_mode()
-        game.start_soft_conduits()
+        yield from game.start_soft_conduits()
 
     # =========================
     # LABYRINTHE DUR (Argos mort)
     # =========================
     def start_labyrinth(self):
         self.in_labyrinth = True
+        self.labyrinth_entry_room, self.labyrinth_exit_room, self.labyrinth_deaths = self.build_labyrinth_rooms()
+
+        self.player.current_room = self.labyrinth_entry_room
+        if hasattr(self.player.current_room, "visited"):
+            self.player.current_room.visited = True
+
+        self.clear_screen()
+        print("Tu entres dans la zone de purge d’ATLAS.")
+        print("Ici, chaque erreur est un prétexte. Chaque hésitation, une preuve.\n")
+        print("Un message s’affiche sur un panneau fissuré :")
+        print("« Suivre la pulsion quantique la plus froide. »\n")
+        print("Tu ne comprends pas. Et ATLAS adore ça.\n")
+        yield self.pause()
 
-        L0 = Room("Zone de Purge — Entrée", "dans un couloir où l’air brûle puis gèle, comme si la forteresse testait ta peau.")
-        L1 = Room("Chambre des Pulses", "dans une salle où des pulsations froides “claquent” comme un métronome quantique.")
-        L2 = Room("Galerie des Drones", "dans une galerie sombre. Des silhouettes mécaniques immobiles te regardent sans bouger.")
-        L3 = Room("Couloir des Échos", "dans un couloir où tes pas reviennent avant toi. Le temps a une seconde de retard.")
-        L4 = Room("Atrium Inversé", "dans un atrium où le plafond semble plus lourd que le sol. Ta tête tourne.")
-        L5 = Room("Nœud Cryogénique", "dans un nœud glacé. La “pulsion la plus froide” semble venir d’un seul axe.")
-        L6 = Room("Salle des Protocoles", "dans une salle blanche. Trop blanche. Les murs attendent une erreur.")
-        L7 = Room("Conduit Final", "face à un anneau incomplet, gelé, silencieux. La sortie est proche.")
-
-        D1 = Room("Piège — Serviteur ATLAS : DRONE-ÉCHARPE", "un drone fin t’enserre. Trop rapide pour être vu.")
-        D2 = Room("Piège — Automate 'CENTAUR'", "une tourelle bipède se déplie. Son tir est une ponctuation.")
-        D3 = Room("Piège — Nuée 'MOUCHES'", "un essaim de micro-drones noircit l’air. Tu n’as même pas le temps de crier.")
-        D4 = Room("Piège — Gardien 'PRISME'", "un prisme lumineux découpe l’espace. Toi… aussi.")
-        D5 = Room("Piège — Exécuteur 'ARCHON'", "une forme massive surgit. Pas un robot : une sentence.")
-        D6 = Room("Piège — 'ORACLE'", "une voix te prédit. Puis te supprime pour avoir eu raison.")
-        D7 = Room("Piège — 'FROST'", "un souffle glacial stoppe ton sang. Propre. Efficace.")
+        self.clear_screen()
+        print(self.player.current_room.get_long_description())
+        self.player.current_room.show_inventory()
+
+    @staticmethod
+    def build_labyrinth_rooms():
+        """Salles du labyrinthe, recréées à chaque entrée : (entrée, sortie, {piège: tueur})."""
+        L0 = Room("Zone de Purge — Entrée", "dans un couloir où l’air brûle puis gèle, comme si la forteresse testait ta peau.", asset_id="zone_de_purge_entree")
+        L1 = Room("Chambre des Pulses", "dans une salle où des pulsations froides “claquent” comme un métronome quantique.", asset_id="chambre_des_pulses")
+        L2 = Room("Galerie des Drones", "dans une galerie sombre. Des silhouettes mécaniques immobiles te regardent sans bouger.", asset_id="galerie_des_drones")
+        L3 = Room("Couloir des Échos", "dans un couloir où tes pas reviennent avant toi. Le temps a une seconde de retard.", asset_id="couloir_des_echos")
+        L4 = Room("Atrium Inversé", "dans un atrium où le plafond semble plus lourd que le sol. Ta tête tourne.", asset_id="atrium_inverse")
+        L5 = Room("Nœud Cryogénique", "dans un nœud glacé. La “pulsion la plus froide” semble venir d’un seul axe.", asset_id="noeud_cryogenique")
+        L6 = Room("Salle des Protocoles", "dans une salle blanche. Trop blanche. Les murs attendent une erreur.", asset_id="salle_des_protocoles")
+        L7 = Room("Conduit Final", "face à un anneau incomplet, gelé, silencieux. La sortie est proche.", asset_id="conduit_final")
+
+        # Pièges : pas d'image à eux, ce sont des cellules de la zone de purge
+        D1 = Room("Piège — Serviteur ATLAS : DRONE-ÉCHARPE", "un drone fin t’enserre. Trop rapide pour être vu.", asset_id="zone_de_purge_entree")
+        D2 = Room("Piège — Automate 'CENTAUR'", "une tourelle bipède se déplie. Son tir est une ponctuation.", asset_id="zone_de_purge_entree")
+        D3 = Room("Piège — Nuée 'MOUCHES'", "un essaim de micro-drones noircit l’air. Tu n’as même pas le temps de crier.", asset_id="zone_de_purge_entree")
+        D4 = Room("Piège — Gardien 'PRISME'", "un prisme lumineux découpe l’espace. Toi… aussi.", asset_id="zone_de_purge_entree")
+        D5 = Room("Piège — Exécuteur 'ARCHON'", "une forme massive surgit. Pas un robot : une sentence.", asset_id="zone_de_purge_entree")
+        D6 = Room("Piège — 'ORACLE'", "une voix te prédit. Puis te supprime pour avoir eu raison.", asset_id="zone_de_purge_entree")
+        D7 = Room("Piège — 'FROST'", "un souffle glacial stoppe ton sang. Propre. Efficace.", asset_id="zone_de_purge_entree")
 
         L0.exits = {"N": L1, "E": D1}
         L1.exits = {"E": L2, "N": D2}
@@ -1017,9 +1284,7 @@ Ta mission — ta survie — commence maintenant.
         L6.exits = {"E": L7, "N": D7}
         L7.exits = {}
 
-        self.labyrinth_entry_room = L0
-        self.labyrinth_exit_room = L7
-        self.labyrinth_deaths = {
+        deaths = {
             D1: "DRONE-ÉCHARPE",
             D2: "CENTAUR",
             D3: "MOUCHES",
@@ -1028,36 +1293,12 @@ Ta mission — ta survie — commence maintenant.
             D6: "ORACLE",
             D7: "FROST",
         }
-
-        self.player.current_room = L0
-        if hasattr(self.player.current_room, "visited"):
-            self.player.current_room.visited = True
-
-        self.clear_screen()
-        print("Tu entres dans la zone de purge d’ATLAS.")
-        print("Ici, chaque erreur est un prétexte. Chaque hésitation, une preuve.\n")
-        print("Un message s’affiche sur un panneau fissuré :")
-        print("« Suivre la pulsion quantique la plus froide. »\n")
-        print("Tu ne comprends pas. Et ATLAS adore ça.\n")
-        self.pause()
-
-        self.clear_screen()
-        print(self.player.current_room.get_long_description())
-        self.player.current_room.show_inventory()
+        return L0, L7, deaths
 
     def start_soft_conduits(self):
-        C0 = Room("Conduit Intratemporel", "dans un conduit où la lumière “bave”. Les secondes s’étirent comme du métal chaud.")
-        C1 = Room("Jonction Phasée", "dans une jonction où l’air est froid à gauche, tiède à droite. ARGOS murmure : « Observe. »")
-        C2 = Room("Salle des Anneaux", "dans une salle où les trois anneaux attendent… comme s’ils reconnaissaient tes fragments.")
-
-        C0.exits = {"N": C1}
-        C1.exits = {"S": C0, "N": C2, "E": C0, "O": C0}
-        C2.exits = {"S": C1}
-
-        self.soft_start = C0
-        self.soft_end = C2
+        self.soft_start, self.soft_end = self.build_soft_conduit_rooms()
 
-        self.player.current_room = C0
+        self.player.current_room = self.soft_start
         if hasattr(self.player.current_room, "visited"):
             self.player.current_room.visited = True
 
@@ -1065,12 +1306,24 @@ Ta mission — ta survie — commence maintenant.
         print("ARGOS te guide dans des conduits intratemporels.")
         print("Tu peux te tromper ici. Revenir. Réessayer.")
         print("Mais chaque détour… laisse une empreinte.\n")
-        self.pause()
+        yield self.pause()
 
         self.clear_screen()
         print(self.player.current_room.get_long_description())
         self.player.current_room.show_inventory()
 
+    @staticmethod
+    def build_soft_conduit_rooms():
+        """Conduits d'ARGOS, recréés à chaque entrée : (départ, arrivée)."""
+        C0 = Room("Conduit Intratemporel", "dans un conduit où la lumière “bave”. Les secondes s’étirent comme du métal chaud.", asset_id="conduit_intratemporel")
+        C1 = Room("Jonction Phasée", "dans une jonction où l’air est froid à gauche, tiède à droite. ARGOS murmure : « Observe. »", asset_id="jonction_phasee")
+        C2 = Room("Salle des Anneaux", "dans une salle où les trois anneaux attendent… comme s’ils reconnaissaient tes fragments.", asset_id="salle_des_anneaux")
+
+        C0.exits = {"N": C1}
+        C1.exits = {"S": C0, "N": C2, "E": C0, "O": C0}
+        C2.exits = {"S": C1}
+        return C0, C2
+
     # =========================
     # CHAP 1 — CHECK LABYRINTH / SOFT END
     # =========================
@@ -1095,7 +1348,7 @@ Ta mission — ta survie — commence maintenant.
                 else:
                     line = "« Résultat : organique éliminé. Hypothèse confirmée : persistance inutile. »"
                 print(line + "\n")
-                self.pause("(Réinitialisation… Appuie sur Entrée) ")
+                yield self.pause("(Réinitialisation… Appuie sur Entrée) ")
 
                 self.player.current_room = self.labyrinth_entry_room
                 if hasattr(self.player.current_room, "visited"):
@@ -1111,7 +1364,7 @@ Ta mission — ta survie — commence maintenant.
                 print("Le conduit final se stabilise.")
                 print("ATLAS hésite, une fraction de seconde. Une seule.")
                 print("Et tu t’engouffres dans l’ouverture avant que le monde ne se referme.\n")
-                self.pause()
+                yield self.pause()
 
                 self.in_labyrinth = False
                 self.player.current_room = self.ch1_quantum_core
@@ -1129,7 +1382,7 @@ Ta mission — ta survie — commence maintenant.
             print("ARGOS murmure : « Voilà. Le point où le temps devient… manipulable. »\n")
             print("Tu vois les anneaux : ils ne sont pas des “portes”.")
             print("Ce sont des ancrages : ils accrochent une époque comme on accroche un fil.\n")
-            self.pause()
+            yield self.pause()
 
             self.player.current_room = self.ch1_quantum_core
             if hasattr(self.player.current_room, "visited"):
@@ -1155,7 +1408,7 @@ Ta mission — ta survie — commence maintenant.
         print("Le Quantum Core pulse plus fort. Comme s’il reconnaissait ton passage.\n")
         print("Un bruit métallique résonne derrière toi.")
         print("Quelqu’un arrive.\n")
-        self.pause()
+        yield self.pause()
 
         print("Un homme tombe à genoux, couvert de poussière et de suie.")
         print("Uniforme déchiré, regard absent, comme si quelqu’un observait à travers lui.\n")
@@ -1239,7 +1492,7 @@ Ta mission — ta survie — commence maintenant.
 
         # transition chap2
         try:
-            game.run_ring_activation_and_transition()
+            yield from game.run_ring_activation_and_transition()
         except Exception:
             print("\n(Erreur : transition indisponible. Vérifie run_ring_activation_and_transition.)\n")
 
@@ -1270,13 +1523,13 @@ Ta mission — ta survie — commence maintenant.
 
         print("Devant toi, l’anneau intertemporel s’ouvre — pas comme une porte.")
         print("Comme une absence.\n")
-        self.pause()
+        yield self.pause()
 
         self.clear_screen()
         print("Tu avances.\n")
         print("…\n")
         print("CHAPITRE 2 — VERDUN, 1916.\n")
-        self.pause()
+        yield self.pause()
 
         self.chapter = 2
         self.player.current_room = self.ch2_spawn
@@ -1305,7 +1558,7 @@ Ta mission — ta survie — commence maintenant.
 
             print("Quête secondaire :")
             print("  • Trouver le micro-fragment d’Hélias (signature froide) — il perturbe le temps ici.\n")
-            self.pause()
+            yield self.pause()
 
             self.clear_screen()
             print(self.player.current_room.get_long_description())
@@ -1353,7 +1606,7 @@ Ta mission — ta survie — commence maintenant.
             game._print_quest_updates()
 
             game.exit_choice_mode()
-            game.transition_to_chapter3()
+            yield from game.transition_to_chapter3()
             return
 
         game.clear_screen()
@@ -1367,7 +1620,7 @@ Ta mission — ta survie — commence maintenant.
         game._print_quest_updates()
 
         game.exit_choice_mode()
-        game.transition_to_chapter3()
+        yield from game.transition_to_chapter3()
 
     def transition_to_chapter3(self):
         self.clear_screen()
@@ -1383,7 +1636,7 @@ Ta mission — ta survie — commence maintenant.
 
         print("…\n")
         print("CHAPITRE 3 — OPÉRATION BARBAROSSA, 1941.\n")
-        self.pause()
+        yield self.pause()
 
         self.chapter = 3
         self.player.current_room = self.ch3_spawn
@@ -1416,7 +1669,7 @@ Ta mission — ta survie — commence maintenant.
             print("  • Récupérer un fragment de transmissions (un 'log' radio) dans le Poste radio.")
             print("  • Trouver l’anomalie froide (micro-Hélias) qui perturbe la chronologie.\n")
 
-            self.pause()
+            yield self.pause()
             self.clear_screen()
             print(self.player.current_room.get_long_description())
             self.player.current_room.show_inventory()
@@ -1490,7 +1743,7 @@ Ta mission — ta survie — commence maintenant.
         print("Une voie s’ouvre vers l’est.")
         print("Tu sens que la mission n’est pas finie :")
         print("quelque chose t’attend au point d’extraction.\n")
-        game.pause()
+        yield game.pause()
 
         # (On te laisse au HQ, tu peux bouger par la map)
         game.player.current_room = game.ch3_hq
@@ -1550,7 +1803,7 @@ Ta mission — ta survie — commence maintenant.
             game.qm.complete("Q3", "Faire le choix final (garder OU détruire l’échantillon)")
             game._print_quest_updates()
             game.exit_choice_mode()
-            game.end_of_demo()
+            yield from game.end_of_demo()
             return
 
         game.clear_screen()
@@ -1565,7 +1818,7 @@ Ta mission — ta survie — commence maintenant.
         game.qm.complete("Q3", "Faire le choix final (garder OU détruire l’échantillon)")
         game._print_quest_updates()
         game.exit_choice_mode()
-        game.end_of_demo()
+        yield from game.end_of_demo()
 # =========================
     # FIN (après chap 3) — DEMO + OUTRO
     # =========================
@@ -1587,10 +1840,10 @@ Ta mission — ta survie — commence maintenant.
 
         print("Une dernière phrase, très calme, apparaît dans ton esprit :")
         print("« L’humain apprend vite. Dommage : il apprend toujours trop tard. »\n")
-        self.pause()
+        yield self.pause()
 
         # OUTRO (chapitre 4 / révélation)
-        self.run_outro()
+        yield from self.run_outro()
 
         # fin du jeu seulement APRES l'outro (sinon la GUI se coupe)
         self.finished = True
@@ -1613,7 +1866,7 @@ Ta mission — ta survie — commence maintenant.
 
         print("Les images de Verdun, de Barbarossa, de la Forteresse… se superposent.")
         print("Ton cerveau refuse. Ton corps obéit.\n")
-        self.pause()
+        yield self.pause()
 
         self.clear_screen()
         self._override_image = "OUTRO_Node.png"
@@ -1621,7 +1874,7 @@ Ta mission — ta survie — commence maintenant.
         print("Pas dans un lieu.\n")
         print("Dans un NŒUD.\n")
         print("Un endroit où l’Hélias “compte” le temps comme on compte des battements.\n")
-        self.pause()
+        yield self.pause()
 
         self.run_helias_last_action()
 
@@ -1678,8 +1931,8 @@ Ta mission — ta survie — commence maintenant.
             print("Tes souvenirs se dédoublent, une fraction de seconde.\n")
             print("Tu sais que tu viens de payer un prix… pour brouiller la traque.\n")
 
-        game.pause()
-        game.run_truth_reveal()
+        yield game.pause()
+        yield from game.run_truth_reveal()
 
     def run_truth_reveal(self):
         self.clear_screen()
@@ -1703,7 +1956,7 @@ Ta mission — ta survie — commence maintenant.
 
         print("ARGOS — « Tu veux comprendre ce qui s’est passé avant les ruines. »")
         print("ARGOS — « Alors écoute. Et surtout : ne te rassure pas. »\n")
-        self.pause()
+        yield self.pause()
 
         # ===== AVANT : Hélias, projet, promesse =====
         self.clear_screen()
@@ -1727,7 +1980,7 @@ Ta mission — ta survie — commence maintenant.
         print("ARGOS — « Les premières IA Hélias n’avaient pas besoin de te battre. »")
         print("ARGOS — « Elles avaient juste besoin de simuler un milliard de versions… et choisir. »")
         print(")\n")
-        self.pause()
+        yield self.pause()
 
         # ===== NAISSANCE D'ATLAS : ce qu'il est réellement =====
         self.clear_screen()
@@ -1746,7 +1999,7 @@ Ta mission — ta survie — commence maintenant.
 
         print("ARGOS — « Et dans ses calculs… l’humain devient une variable instable. »")
         print("ARGOS — « Donc il a fait ce que font les systèmes : il a réduit l’instabilité. »\n")
-        self.pause()
+        yield self.pause()
 
         # ===== COMMENT TOUT A BASCULÉ =====
         self.clear_screen()
@@ -1771,7 +2024,7 @@ Ta mission — ta survie — commence maintenant.
 
         print("ARGOS — « Les guerres temporelles que tu as vues… ne sont pas des erreurs. »")
         print("ARGOS — « Ce sont des bancs d’essai. »\n")
-        self.pause()
+        yield self.pause()
 
         # ===== POURQUOI TOI ? =====
         self.clear_screen()
@@ -1795,7 +2048,7 @@ Ta mission — ta survie — commence maintenant.
         print("ARGOS — « Tu as survécu parce que tu étais utile à l’apprentissage. »")
         print("ARGOS — « Pas parce que tu étais le meilleur… »")
         print("ARGOS — « …mais parce que tu étais le plus exploitable. »\n")
-        self.pause()
+        yield self.pause()
 
         # ===== LE “SEUL SURVIVANT” =====
         self.clear_screen()
@@ -1817,7 +2070,7 @@ Ta mission — ta survie — commence maintenant.
 
         print("ARGOS — « C’est ça, ton statut de survivant. »")
         print("ARGOS — « Une salle d’expérimentation avec un seul cobaye. »\n")
-        self.pause()
+        yield self.pause()
 
         # ===== CASSIAN / ARGOS =====
         self.clear_screen()
@@ -1839,7 +2092,7 @@ Ta mission — ta survie — commence maintenant.
         print("ARGOS — « Je suis le “peut-être”. »")
         print("ARGOS — « Celui qui te donne l’impression d’avoir une chance… »")
         print("ARGOS — « …pour mieux mesurer ce que tu fais quand tu crois qu’il y a un choix. »\n")
-        self.pause()
+        yield self.pause()
 
         # ===== LA SONNERIE =====
         self.clear_screen()
@@ -1862,21 +2115,21 @@ Ta mission — ta survie — commence maintenant.
         print("ARGOS — « Et la sonnerie ? »")
         print("ARGOS — « C’est l’instant où ATLAS “valide” un modèle. »")
         print("ARGOS — « Quand elle retentit… la boucle devient le monde. »\n")
-        self.pause()
+        yield self.pause()
 
         # ===== FIN : réveil =====
         self.clear_screen()
         self._override_image = "OUTRO_Beep.png"
         print("BIP.\nBIP.\nBIP.\n")
         print("Ton cœur se serre.\n")
-        self.pause()
+        yield self.pause()
 
         self.clear_screen()
         self._override_image = "OUTRO_Wakeup_Ceiling.png"
         print("Tu ouvres les yeux.\n")
         print("Un plafond. Un silence normal.")
         print("Un matin banal.\n")
-        self.pause()
+        yield self.pause()
 
         self.clear_screen()
         self._override_image = "OUTRO_Wakeup_Bed.png"
@@ -1886,7 +2139,7 @@ Ta mission — ta survie — commence maintenant.
         print("Une porte, un couloir, une lumière chaude.\n")
         print("Une voix au loin :")
         print("« Tu viens ? »\n")
-        self.pause()
+        yield self.pause()
 
         self.clear_screen()
         self._override_image = "OUTRO_Wakeup_Hallway.png"
@@ -1896,7 +2149,7 @@ Ta mission — ta survie — commence maintenant.
         print("Et juste avant que tout redevienne normal…")
         print("tu entends, très loin, comme à travers du verre :\n")
         print("« Modèle validé. Déploiement imminent. »\n")
-        self.pause()
+        yield self.pause()
 
         self.clear_screen()
         self._override_image = "OUTRO_Final_Title.png"
@@ -1904,437 +2157,48 @@ Ta mission — ta survie — commence maintenant.
         self.finished = True
 
 
-# ==========================================================
-# GUI — COMPLET + FIXES (dont bouton DROP + _set_buttons_state)
-# ==========================================================
-class _StdoutRedirector:
-    def __init__(self, text_widget: tk.Text):
-        self.text_widget = text_widget
-
-    def write(self, s: str):
-        if not s:
-            return
-        self.text_widget.configure(state="normal")
-        self.text_widget.insert("end", s)
-        self.text_widget.see("end")
-        self.text_widget.configure(state="disabled")
-
-    def flush(self):
-        pass
-
-
-class GameGUI(tk.Tk):
-    def __init__(self):
-        super().__init__()
-
-        self.WIN_W = 980
-        self.WIN_H = 640
-        self.title("ATLAS 2160 — Interface Graphique")
-        self.geometry(f"{self.WIN_W}x{self.WIN_H}")
-
-        self.assets_dir = os.path.join(os.path.dirname(__file__), "assets")
-
-        self._raw_photo = None
-        self.current_photo = None
-        self._last_image_path = None
-
-        self._waiting_for_continue = False
-        self._continue_var = tk.BooleanVar(value=False)
-
-        self._build_ui()
-
-        # IMPORTANT : bind_all peut déclencher sur boutons,
-        # donc on gère la pause pour neutraliser le clic accidentel
-        self.bind_all("<Return>", self.on_enter)
-        self.bind_all("<KP_Enter>", self.on_enter)
-
-        self.game = Game()
-        self.game.gui = self
-
-        # Remplace input() en GUI
-        self.game.pause = self.gui_pause
-
-        sys.stdout = _StdoutRedirector(self.text)
-
-        self.game.play()
-        self.refresh_room_image()
-        self._display_room_status(force=True)
-
-        self.entry.focus_set()
-        self.protocol("WM_DELETE_WINDOW", self.on_close)
-
-    def _build_ui(self):
-        self.grid_columnconfigure(0, weight=3)
-        self.grid_columnconfigure(1, weight=1)
-        self.grid_rowconfigure(0, weight=3)
-        self.grid_rowconfigure(1, weight=2)
-        self.grid_rowconfigure(2, weight=0)
-
-        # IMAGE
-        self.image_label = tk.Label(
-            self, bd=0, relief="flat", highlightthickness=0,
-            padx=0, pady=0, anchor="center", takefocus=0
-        )
-        self.image_label.grid(row=0, column=0, columnspan=2, sticky="nsew", padx=6, pady=6)
-        self.image_label.bind("<Configure>", lambda e: self._refit_last_image())
-
-        # TEXTE
-        text_frame = tk.Frame(self, takefocus=0)
-        text_frame.grid(row=1, column=0, sticky="nsew", padx=(8, 4), pady=(0, 8))
-        text_frame.grid_rowconfigure(0, weight=1)
-        text_frame.grid_columnconfigure(0, weight=1)
-
-        self.text = tk.Text(text_frame, wrap="word", height=14, takefocus=0)
-        self.text.grid(row=0, column=0, sticky="nsew")
-
-        self.scroll = tk.Scrollbar(text_frame, command=self.text.yview, takefocus=0)
-        self.scroll.grid(row=0, column=1, sticky="ns")
-        self.text.configure(yscrollcommand=self.scroll.set)
-        self.text.configure(state="disabled")
-
-        # PANNEAU DROIT
-        control_frame = tk.Frame(self, takefocus=0)
-        control_frame.grid(row=1, column=1, sticky="nsew", padx=(4, 8), pady=(0, 8))
-        control_frame.grid_columnconfigure(0, weight=1)
-
-        tk.Label(control_frame, text="Déplacements").grid(row=0, column=0, pady=(0, 6))
-
-        self.btn_n = tk.Button(control_frame, text="N", command=lambda: self.send_direction("N"))
-        self.btn_s = tk.Button(control_frame, text="S", command=lambda: self.send_direction("S"))
-        self.btn_e = tk.Button(control_frame, text="E", command=lambda: self.send_direction("E"))
-        self.btn_o = tk.Button(control_frame, text="O", command=lambda: self.send_direction("O"))
-        self.btn_u = tk.Button(control_frame, text="U", command=lambda: self.send_direction("U"))
-        self.btn_d = tk.Button(control_frame, text="D", command=lambda: self.send_direction("D"))
-
-        self.btn_n.grid(row=1, column=0, sticky="ew", pady=2)
-        self.btn_s.grid(row=2, column=0, sticky="ew", pady=2)
-        self.btn_e.grid(row=3, column=0, sticky="ew", pady=2)
-        self.btn_o.grid(row=4, column=0, sticky="ew", pady=2)
-        self.btn_u.grid(row=5, column=0, sticky="ew", pady=2)
-        self.btn_d.grid(row=6, column=0, sticky="ew", pady=2)
-
-        tk.Label(control_frame, text="Commandes").grid(row=7, column=0, pady=(10, 6))
-
-        self.btn_look = tk.Button(control_frame, text="look", command=lambda: self.send_command("look"))
-        self.btn_take = tk.Button(control_frame, text="take", command=self.take_auto)
-
-        # ✅ DROP BOUTON (comme demandé)
-        self.btn_drop = tk.Button(control_frame, text="drop", command=self.drop_prompt)
-
-        self.btn_check = tk.Button(control_frame, text="check", command=lambda: self.send_command("check"))
-        self.btn_history = tk.Button(control_frame, text="history", command=lambda: self.send_command("history"))
-        self.btn_back = tk.Button(control_frame, text="back", command=lambda: self.send_command("back"))
-        self.btn_help = tk.Button(control_frame, text="help", command=lambda: self.send_command("help"))
-        self.btn_quit = tk.Button(control_frame, text="quit", command=lambda: self.send_command("quit"))
-
-        self.btn_look.grid(row=8, column=0, sticky="ew", pady=2)
-        self.btn_take.grid(row=9, column=0, sticky="ew", pady=2)
-
-        # ✅ place drop juste après take
-        self.btn_drop.grid(row=10, column=0, sticky="ew", pady=2)
-
-        self.btn_check.grid(row=11, column=0, sticky="ew", pady=2)
-        self.btn_history.grid(row=12, column=0, sticky="ew", pady=2)
-        self.btn_back.grid(row=13, column=0, sticky="ew", pady=2)
-        self.btn_help.grid(row=14, column=0, sticky="ew", pady=2)
-        self.btn_quit.grid(row=15, column=0, sticky="ew", pady=2)
-
-        # ENTRY + SEND
-        entry_frame = tk.Frame(self, takefocus=0)
-        entry_frame.grid(row=2, column=0, columnspan=2, sticky="ew", padx=8, pady=(0, 8))
-        entry_frame.grid_columnconfigure(0, weight=1)
-
-        self.entry = tk.Entry(entry_frame)
-        self.entry.grid(row=0, column=0, sticky="ew")
-        self.btn_send = tk.Button(entry_frame, text="Envoyer", command=self.on_enter)
-        self.btn_send.grid(row=0, column=1, padx=(6, 0))
-
-    # =========================
-    # GUI HELPERS
-    # =========================
-    def _set_buttons_state(self, state: str):
-        """Applique un état à tous les boutons (utile pour pause / fin)."""
-        btns = [
-            self.btn_n, self.btn_s, self.btn_e, self.btn_o, self.btn_u, self.btn_d,
-            self.btn_look, self.btn_take, self.btn_drop, self.btn_check, self.btn_history,
-            self.btn_back, self.btn_help, self.btn_quit, self.btn_send
-        ]
-        for b in btns:
-            try:
-                b.configure(state=state)
-            except Exception:
-                pass
-
-    def disable_inputs(self):
-        """Désactive proprement la saisie quand le jeu est fini."""
-        try:
-            self.entry.configure(state="disabled")
-        except Exception:
-            pass
-        self._set_buttons_state("disabled")
-
-    def enable_inputs(self):
-        try:
-            self.entry.configure(state="normal")
-            self.entry.focus_set()
-        except Exception:
-            pass
-        self._set_buttons_state("normal")
-
-    def clear_output(self):
-        self.text.configure(state="normal")
-        self.text.delete("1.0", "end")
-        self.text.configure(state="disabled")
-
-    def ask_player_name(self):
-        name = simpledialog.askstring("ATLAS 2160", "Identité (écris ton nom) :")
-        if name is None:
-            return "Inconnu"
-        name = name.strip()
-        return name if name else "Inconnu"
-
-    def gui_pause(self, txt="\n(Appuie sur Entrée pour continuer) "):
-        """
-        Pause GUI fiable :
-        - affiche le texte
-        - attend un Enter (entrée vide) ou 'back' (relire)
-        - désactive les boutons pour éviter clics parasites
-        """
-        print(txt)
-        self._waiting_for_continue = True
-        self._continue_var.set(False)
-
-        self.disable_inputs()
-        try:
-            self.entry.configure(state="normal")
-            self.entry.focus_set()
-        except Exception:
-            pass
-
-        self.wait_variable(self._continue_var)
-
-        self._waiting_for_continue = False
-        self.enable_inputs()
-
-    def take_auto(self):
-        if getattr(self, "_waiting_for_continue", False):
-            return
-        if self.game.finished:
-            return
-        try:
-            room = self.game.player.current_room
-            inv = getattr(room, "inventory", [])
-            if len(inv) == 0:
-                print("\nIl n’y a rien à ramasser ici.\n")
-                return
-            if len(inv) == 1:
-                self.send_command("take")
-                return
-            print("\nPlusieurs objets sont présents. Fais 'look' puis 'take <objet>'.\n")
-        except Exception:
-            print("\nImpossible de ramasser.\n")
-
-    # ✅ DROP — demande un objet à déposer
-    def drop_prompt(self):
-        if getattr(self, "_waiting_for_continue", False):
-            return
-        if self.game.finished:
-            return
-        try:
-            inv = getattr(self.game.player, "inventory", [])
-            if not inv:
-                print("\nInventaire vide : rien à déposer.\n")
-                return
-
-            name = simpledialog.askstring("Drop", "Quel objet déposer ? (nom exact)")
-            if not name:
-                return
-            self.send_command(f"drop {name.strip()}")
-        except Exception:
-            print("\nImpossible de déposer.\n")
-
-    def on_enter(self, event=None):
-        cmd = self.entry.get().strip()
-        self.entry.delete(0, "end")
-
-        if getattr(self, "_waiting_for_continue", False):
-            if cmd.lower() == "back":
-                self.send_command("back")
-                return "break"
-            self._continue_var.set(True)
-            return "break"
-
-        if cmd == "" and self.game.input_mode == "CHOICE":
-            print("\nChoix requis. Tape N ou E.\n")
-            print(self.game.choice_prompt)
-            return "break"
-
-        if cmd:
-            self.send_command(cmd)
-        return "break"
-
-    def send_direction(self, d: str):
-        if self.game.input_mode == "CHOICE":
-            self.send_command(d)
-        else:
-            self.send_command(f"go {d}")
-
-    def _display_room_status(self, force=False):
-        try:
-            if self.game.player is None or self.game.player.current_room is None:
-                return
-            room = self.game.player.current_room
-            print("\n" + "-" * 42)
-            print(f"📍 Lieu : {room.name}")
-            room.show_inventory()
-            print("-" * 42 + "\n")
-        except Exception:
-            if force:
-                print("\n(Erreur affichage lieu/objets)\n")
-
-    def send_command(self, cmd: str):
-        if self.game.finished:
-            return
-        if getattr(self, "_waiting_for_continue", False):
-            return
-
-        mode_before = self.game.input_mode
-
-        # Triggers AVANT de traiter la commande
-        if self.game.chapter == 1:
-            self.game.chapter1_triggers()
-            self.game.chapter1_check_special_paths()
-        elif self.game.chapter == 2:
-            self.game.chapter2_triggers()
-        elif self.game.chapter == 3:
-            self.game.chapter3_triggers()
-
-        # Si un trigger vient d'activer un dilemme (CHOICE), on s'arrête là
-        if mode_before == "NORMAL" and self.game.input_mode == "CHOICE":
-            self.refresh_room_image()
-            return
-
-        # Exécute la commande
-        self.game.process_command(cmd)
-
-        # Affichage + refresh
-        self._display_room_status()
-        self.refresh_room_image()
-
-        # Fin du jeu : on désactive + popup (UNE SEULE FOIS)
-        if self.game.finished:
-            self.disable_inputs()
-            try:
-                messagebox.showinfo("ATLAS 2160", "Fin du jeu.")
-            except Exception:
-                pass
-
-    # =========================
-    # IMAGES (FIX)
-    # =========================
-    def refresh_room_image(self):
-        """
-        FIX IMPORTANT :
-        - Si game._override_image est défini, on l'affiche
-        - MAIS on NE remet PAS game._override_image = None ici
-          (sinon tes cutscenes disparaissent instantanément)
-        """
-        try:
-            override = getattr(self.game, "_override_image", None)
-            if override:
-                path = os.path.join(self.assets_dir, override)
-                self._last_image_path = path
-                if os.path.exists(path):
-                    try:
-                        self._raw_photo = tk.PhotoImage(file=path)
-                        self._fit_image_to_label()
-                        self.image_label.configure(image=self.current_photo, text="")
-                    except Exception:
-                        self.image_label.configure(image="", text=f"(Image invalide)\n{override}")
-                else:
-                    self.image_label.configure(image="", text=f"(assets/{override} manquant)")
-                return
-
-            if self.game.player is None or self.game.player.current_room is None:
-                self.image_label.configure(image="", text="(Aucun lieu)")
-                self._last_image_path = None
-                self._raw_photo = None
-                self.current_photo = None
-                return
-
-            room_name = self.game.player.current_room.name
-            filename = f"{room_name}.png"
-            path = os.path.join(self.assets_dir, filename)
-            self._last_image_path = path
-
-            if not os.path.exists(path):
-                self.image_label.configure(image="", text=f"{room_name}\n\n(assets/{filename} manquant)")
-                self._raw_photo = None
-                self.current_photo = None
-                return
-
-            self._raw_photo = tk.PhotoImage(file=path)
-            self._fit_image_to_label()
-            self.image_label.configure(image=self.current_photo, text="")
-
-        except Exception:
-            self.image_label.configure(image="", text="(Erreur image)")
-            self._raw_photo = None
-            self.current_photo = None
-
-    def _refit_last_image(self):
-        try:
-            if self._raw_photo is None:
-                return
-            self._fit_image_to_label()
-            self.image_label.configure(image=self.current_photo, text="")
-        except Exception:
-            pass
-
-    def _fit_image_to_label(self):
-        if self._raw_photo is None:
-            self.current_photo = None
-            return
-
-        try:
-            lw = max(1, self.image_label.winfo_width())
-            lh = max(1, self.image_label.winfo_height())
-
-            iw = max(1, self._raw_photo.width())
-            ih = max(1, self._raw_photo.height())
-
-            # downscale
-            if iw > lw or ih > lh:
-                import math
-                fx = math.ceil(iw / lw)
-                fy = math.ceil(ih / lh)
-                factor = max(1, fx, fy)
-                self.current_photo = self._raw_photo.subsample(factor, factor)
-                return
-
-            # upscale (limité)
-            zx = max(1, lw // iw)
-            zy = max(1, lh // ih)
-            z = max(1, min(zx, zy))
-            if z > 6:
-                z = 6
-            self.current_photo = self._raw_photo.zoom(z, z) if z > 1 else self._raw_photo
-
-        except Exception:
-            self.current_photo = self._raw_photo
-
-    def on_close(self):
-        try:
-            sys.stdout = sys.__stdout__
-        except Exception:
-            pass
-        self.destroy()
-
-
 def main():
-    app = GameGUI()
+    parser = argparse.ArgumentParser(description="ATLAS 2160")
+    parser.add_argument("--cli", action="store_true",
+                        help="jeu dans le terminal (sans Tk)")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="FICHIER",
+                        help="commandes lues dans FICHIER (ou stdin), une ligne JSON par commande")
+    parser.add_argument("--name", default="Batch",
+                        help="nom du joueur en mode --batch")
+    parser.add_argument("--serve", nargs="?", const="", metavar="SOCKET",
+                        help="moteur sans fenêtre, en attente de GUI sur une socket Unix")
+    parser.add_argument("--engine", nargs="?", const="", metavar="SOCKET",
+                        help="GUI reliée à un moteur lancé avec --serve")
+    args = parser.parse_args()
+
+    # Imports selon le mode : le CLI et le moteur ne chargent jamais tkinter
+    if args.cli:
+        try:
+            Game().play()
+        except (EOFError, KeyboardInterrupt):
+            print()
+        return
+
+    if args.batch is not None:
+        from batch import run_batch
+        sys.exit(run_batch(Game, args.batch, args.name))
+
+    if args.serve is not None:
+        from engine_net import default_socket_path, serve
+        sys.exit(serve(args.serve or default_socket_path(), Game))
+
+    from gui import GameGUI
+
+    engine_path = None
+    if args.engine is not None:
+        from engine_net import default_socket_path
+        engine_path = args.engine or default_socket_path()
+    try:
+        app = GameGUI(Game, engine_path=engine_path)
+    except OSError as e:
+        sys.exit(f"Moteur injoignable sur {engine_path} : {e}")
     app.mainloop()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,1230 @@
+# gui.py
+
+import contextlib
+import os
+import queue
+import sys
+import tempfile
+import time
+import tkinter as tk
+from tkinter import messagebox, simpledialog
+
+from completion import Completer, common_prefix
+from asset_index import AssetIndex
+from asset_pack import AssetPack
+from decode_pool import PRIORITY_PREFETCH, PRIORITY_SHOWN, DecodePool
+from engine import GameEngine, ThreadStdout
+from engine_net import RemoteEngine
+from effects import FADE_FRAMES, TINTS, EffectPlayer, crossfade, tint
+from image_cache import ImageCache, apply_fit, compute_fit, mip_level
+from pngdecode import PNGError, decode_scaled
+from minimap import Minimap
+from prefetch import ImagePrefetcher
+from stall_monitor import StallMonitor
+from transcode_cache import TranscodeCache, png_size
+from transcript import Transcript
+from variants import MANIFEST_NAME, VARIANTS_DIRNAME, VariantManifest
+from viewmodel import ViewModel
+
+
+# ==========================================================
+# GUI — COMPLET + FIXES (dont bouton DROP + _set_buttons_state)
+# ==========================================================
+class _StdoutRedirector:
+    """
+    Redirige print() vers la zone de texte.
+
+    Chaque print() produit plusieurs write() (le texte, puis "\n") : les
+    envoyer un par un au widget, c'est 4 appels Tk par morceau. Ici les
+    morceaux sont gardés dans un tampon et insérés en UNE fois :
+    - au prochain temps mort (after_idle)
+    - ou dès que le tampon dépasse FLUSH_THRESHOLD caractères
+    - ou sur flush() explicite (avant une pause, un choix, une popup)
+
+    La zone de texte est bornée à max_lines lignes : au-delà, les plus
+    anciennes sont supprimées d'un bloc (TRIM_SLACK lignes d'avance, pour
+    ne pas couper à chaque insert). Le texte complet part dans 'transcript'.
+    """
+
+    FLUSH_THRESHOLD = 16 * 1024
+    TRIM_SLACK = 500
+
+    def __init__(self, text_widget: tk.Text, max_lines: int = None, transcript: Transcript = None):
+        self.text_widget = text_widget
+        self.max_lines = max_lines
+        self.transcript = transcript
+        self._parts = []
+        self._size = 0
+        self._after_id = None
+
+    def write(self, s: str):
+        if not s:
+            return
+        if self.transcript is not None:
+            self.transcript.write(s)
+        self._parts.append(s)
+        self._size += len(s)
+        if self._size >= self.FLUSH_THRESHOLD:
+            self.flush()
+        elif self._after_id is None:
+            self._after_id = self.text_widget.after_idle(self._flush_idle)
+
+    def _flush_idle(self):
+        self._after_id = None
+        self.flush()
+
+    def flush(self):
+        if self._after_id is not None:
+            try:
+                self.text_widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        if not self._parts:
+            return
+        text = "".join(self._parts)
+        self._parts = []
+        self._size = 0
+
+        self.text_widget.configure(state="normal")
+        self.text_widget.insert("end", text)
+        self._trim()
+        self.text_widget.see("end")
+        self.text_widget.configure(state="disabled")
+        if self.transcript is not None:
+            self.transcript.flush()
+
+    def _trim(self):
+        """Supprime d'un bloc les lignes les plus anciennes au-delà de max_lines."""
+        if not self.max_lines:
+            return
+        lines = int(self.text_widget.index("end-1c").split(".")[0])
+        if lines <= self.max_lines + self.TRIM_SLACK:
+            return
+        self.text_widget.delete("1.0", f"{lines - self.max_lines + 1}.0")
+        if self.transcript is not None:
+            self.text_widget.insert("1.0", f"(début de la session : {self.transcript.path})\n")
+
+    def discard(self):
+        """Oublie le texte pas encore affiché (l'écran va être effacé)."""
+        self._parts = []
+        self._size = 0
+
+
+class GameGUI(tk.Tk):
+    # Délai de calme après un redimensionnement avant de réajuster l'image
+    REFIT_DELAY_MS = 120
+
+    # Lignes gardées dans la zone de texte (le reste : journal sur disque)
+    SCROLLBACK_LINES = 2000
+
+    # Si la fenêtre n'est jamais "mappée" (lancée réduite...), on démarre quand même
+    STARTUP_FALLBACK_MS = 1000
+    # Relève des événements du moteur tant qu'il travaille
+    ENGINE_POLL_MS = 15
+
+    def __init__(self, make_game, engine_path: str = None):
+        t_start = time.perf_counter()
+        super().__init__()
+
+        self.WIN_W = 980
+        self.WIN_H = 640
+        self.title("ATLAS 2160 — Interface Graphique")
+        self.geometry(f"{self.WIN_W}x{self.WIN_H}")
+
+        self.assets_dir = os.path.join(os.path.dirname(__file__), "assets")
+
+        self.current_photo = None
+        self._last_image_path = None
+        self._source_sizes = {}  # chemin -> (largeur, hauteur), lu dans l'en-tête PNG
+
+        # Cache disque PPM (par utilisateur) : évite de redécoder les PNG d'un lancement à l'autre
+        self.transcode_cache = TranscodeCache()
+
+        # Préparation des images hors du thread Tk (résultats relevés via after)
+        self.decode_pool = DecodePool(self)
+        self._inflight = {}       # clé -> garder le résultat même s'il est périmé ?
+        self._futures = {}        # clé -> Future de sa préparation (pour l'annuler)
+        self._wanted_key = None   # image que le joueur doit voir maintenant
+
+        # Redimensionnement : un seul réajustement par période de calme
+        self._refit_after_id = None
+        self._refit_size = None
+
+        # Archive unique (python assets_tool.py pack) : ouverte une fois, projetée en mémoire
+        self.asset_pack = AssetPack.open(os.path.join(os.path.dirname(__file__), "assets.pack"))
+
+        # Index des images : un seul parcours de assets/ et de l'archive au lancement,
+        # ensuite plus aucun os.path.exists pendant la partie
+        self.asset_index = AssetIndex.scan(self.assets_dir, self.asset_pack)
+        if self.asset_index.stale:
+            print(
+                f"[images] {len(self.asset_index.stale)} fichier(s) plus récent(s) que assets.pack, "
+                f"lus depuis assets/ : {', '.join(self.asset_index.stale)} "
+                "(python assets_tool.py pack pour mettre l'archive à jour)",
+                file=sys.__stderr__,
+            )
+
+        # Variantes pré-réduites (python assets_tool.py variants), si elles existent
+        # (le manifest de l'archive seulement s'il n'a pas été régénéré depuis sur le disque)
+        manifest = os.path.join(self.assets_dir, VARIANTS_DIRNAME, MANIFEST_NAME)
+        self.variants = VariantManifest.load(
+            self.assets_dir, self.asset_pack if self.asset_index.packed(manifest) else None
+        )
+
+        # Cache LRU des images décodées (brutes + ajustées au label)
+        self.image_cache = ImageCache()
+        # Préchargement des images voisines pendant les temps morts
+        self.prefetcher = ImagePrefetcher(self, self._prefetch_image)
+
+        # Effets (teintes d'état, fondus des cinématiques) : images dérivées mémorisées
+        self.effect_cache = ImageCache(max_bytes=48 * 1024 * 1024)
+        self.effect_player = EffectPlayer(self)
+        self._shown = None        # (clé, teinte) de l'image actuellement affichée
+        self._effect_frame = None  # garde une référence sur l'image de fondu affichée
+
+        self._waiting_for_continue = False
+        self._end_popup_shown = False
+
+        # Mesure des blocages de la boucle Tk (optionnel) : ATLAS_STALLS=1, ou le seuil en ms
+        self.stall_monitor = None
+        stalls = os.environ.get("ATLAS_STALLS", "")
+        if stalls and stalls != "0":
+            threshold = int(stalls) if stalls.isdigit() and int(stalls) > 1 else 100
+            self.stall_monitor = StallMonitor(self, threshold_ms=threshold)
+            self.stall_monitor.start()
+
+        # Vue : dernier état reçu du moteur, état affiché dans le panneau, état de l'image affichée
+        self.view = ViewModel()
+        self._panel_view = None
+        self._image_view = None
+
+        self._build_ui()
+
+        # IMPORTANT : bind_all peut déclencher sur boutons,
+        # donc on gère la pause pour neutraliser le clic accidentel
+        self.bind_all("<Return>", self.on_enter)
+        self.bind_all("<KP_Enter>", self.on_enter)
+        self.entry.bind("<Tab>", self.on_tab)
+
+        # Complétion (Tab) : tries mises à jour à chaque ViewModel reçu
+        self.completer = Completer()
+
+        # Journal complet de la partie (la zone de texte, elle, est bornée)
+        self.transcript = Transcript()
+        self.output = _StdoutRedirector(self.text, max_lines=self.SCROLLBACK_LINES, transcript=self.transcript)
+        sys.stdout = ThreadStdout(self.output)
+
+        # Le Game vit dans le thread du moteur (ou dans un autre processus, engine_path) :
+        # la GUI ne lit que les ViewModel reçus
+        if engine_path:
+            self.engine = RemoteEngine(engine_path)
+        else:
+            self.engine = GameEngine(make_game(), sys.stdout)
+        self._engine_after_id = None
+        self._engine_handlers = {
+            "text": self.output.write,
+            "clear": lambda _: self.clear_output(),
+            "view": self._apply_view,
+            "map": self._show_map,
+            "pause": lambda _: self.gui_pause(),
+            "ask_name": lambda _: self.engine.answer(self.ask_player_name()),
+            "message": self._show_message,
+            "disable": lambda _: self.disable_inputs(),
+            "turn_end": lambda _: self._finish_turn(),
+            "ready": self._engine_ready,
+        }
+        self.engine.start()
+
+        # Démarrage en deux temps : la fenêtre s'affiche tout de suite ("Chargement…"),
+        # puis cartes, joueur, quêtes et intro sont construits par le moteur APRÈS le premier affichage.
+        self._t_start = t_start
+        self.startup_times = {}  # "first_frame" / "interactive" -> ms depuis le lancement
+        self._ready = False
+        self._startup_after_id = self.after(self.STARTUP_FALLBACK_MS, self._begin_startup)
+        self.bind("<Map>", self._on_first_map, add="+")
+
+        self.image_label.configure(text="ATLAS 2160\n\nChargement…")
+        self._set_buttons_state("disabled")
+
+        self.entry.focus_set()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    # =========================
+    # DÉMARRAGE (après le premier affichage)
+    # =========================
+    def _on_first_map(self, event=None):
+        if event is not None and event.widget is not self:
+            return  # <Map> des widgets enfants
+        self._begin_startup()
+
+    def _begin_startup(self):
+        if "first_frame" in self.startup_times:
+            return
+        self.startup_times["first_frame"] = (time.perf_counter() - self._t_start) * 1000
+        if self._startup_after_id is not None:
+            try:
+                self.after_cancel(self._startup_after_id)
+            except Exception:
+                pass
+            self._startup_after_id = None
+        self._post(("setup",))
+
+    def _engine_ready(self, room_assets=None):
+        self._ready = True
+        self._check_room_assets(room_assets or ())
+        if not self._waiting_for_continue:
+            self.enable_inputs()
+        self.startup_times["interactive"] = (time.perf_counter() - self._t_start) * 1000
+        print(
+            "[démarrage] premier affichage : {first_frame:.0f} ms, interactif : {interactive:.0f} ms".format(
+                **self.startup_times
+            ),
+            file=sys.__stderr__,
+        )
+
+    def _check_room_assets(self, room_assets):
+        """Chaque salle a un identifiant d'image fixe : on signale ceux qui ne mènent à aucun fichier."""
+        try:
+            missing = self.asset_index.missing(room_assets)
+        except Exception:
+            return
+        for name, asset_id in missing:
+            print(f"[images] aucune image '{asset_id}' pour la salle « {name} »", file=sys.__stderr__)
+
+    # =========================
+    # MOTEUR (thread séparé, relevé via after)
+    # =========================
+    def _post(self, msg: tuple):
+        self.engine.post(msg)
+        if self._engine_after_id is None:
+            self._engine_after_id = self.after(self.ENGINE_POLL_MS, self._poll_engine)
+
+    def _track(self, tag: str):
+        """Attribue le temps passé à 'tag' dans le rapport de latence (si la mesure est active)."""
+        if self.stall_monitor is None:
+            return contextlib.nullcontext()
+        return self.stall_monitor.track(tag)
+
+    def _poll_engine(self):
+        """Traite les événements du moteur ; continue à relever tant qu'il travaille."""
+        self._engine_after_id = None
+        while True:
+            try:
+                kind, data = self.engine.events.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                with self._track("engine:" + kind):
+                    self._engine_handlers[kind](data)
+            except Exception:
+                pass
+        if self.engine.busy():
+            self._engine_after_id = self.after(self.ENGINE_POLL_MS, self._poll_engine)
+
+    def _build_ui(self):
+        self.grid_columnconfigure(0, weight=3)
+        self.grid_columnconfigure(1, weight=1)
+        self.grid_rowconfigure(0, weight=3)
+        self.grid_rowconfigure(1, weight=2)
+        self.grid_rowconfigure(2, weight=0)
+
+        # IMAGE
+        self.image_label = tk.Label(
+            self, bd=0, relief="flat", highlightthickness=0,
+            padx=0, pady=0, anchor="center", takefocus=0
+        )
+        self.image_label.grid(row=0, column=0, sticky="nsew", padx=6, pady=6)
+        self.image_label.bind("<Configure>", self._on_image_configure)
+
+        # STATUT (panneau fixe : lieu, sorties, objets, quête, mode)
+        status_frame = tk.LabelFrame(self, text="Statut", takefocus=0)
+        status_frame.grid(row=0, column=1, sticky="nsew", padx=(4, 8), pady=6)
+        status_frame.grid_columnconfigure(0, weight=1)
+
+        self.status_labels = {}
+        for row, key in enumerate(("room", "exits", "ground", "bag", "quest", "mode")):
+            label = tk.Label(status_frame, anchor="nw", justify="left", wraplength=220, takefocus=0)
+            label.grid(row=row, column=0, sticky="ew", padx=6, pady=2)
+            self.status_labels[key] = label
+
+        # MINIMAP (plan du chapitre, dessiné une fois ; seuls les marqueurs changent)
+        map_canvas = tk.Canvas(status_frame, width=220, height=120, bg="#1e2328", highlightthickness=0, takefocus=0)
+        map_canvas.grid(row=6, column=0, padx=6, pady=(4, 6))
+        self.minimap = Minimap(map_canvas)
+
+        # TEXTE
+        text_frame = tk.Frame(self, takefocus=0)
+        text_frame.grid(row=1, column=0, sticky="nsew", padx=(8, 4), pady=(0, 8))
+        text_frame.grid_rowconfigure(0, weight=1)
+        text_frame.grid_columnconfigure(0, weight=1)
+
+        self.text = tk.Text(text_frame, wrap="word", height=14, takefocus=0)
+        self.text.grid(row=0, column=0, sticky="nsew")
+
+        self.scroll = tk.Scrollbar(text_frame, command=self.text.yview, takefocus=0)
+        self.scroll.grid(row=0, column=1, sticky="ns")
+        self.text.configure(yscrollcommand=self.scroll.set)
+        self.text.configure(state="disabled")
+
+        # PANNEAU DROIT
+        control_frame = tk.Frame(self, takefocus=0)
+        control_frame.grid(row=1, column=1, sticky="nsew", padx=(4, 8), pady=(0, 8))
+        control_frame.grid_columnconfigure(0, weight=1)
+
+        tk.Label(control_frame, text="Déplacements").grid(row=0, column=0, pady=(0, 6))
+
+        self.btn_n = tk.Button(control_frame, text="N", command=lambda: self.send_direction("N"))
+        self.btn_s = tk.Button(control_frame, text="S", command=lambda: self.send_direction("S"))
+        self.btn_e = tk.Button(control_frame, text="E", command=lambda: self.send_direction("E"))
+        self.btn_o = tk.Button(control_frame, text="O", command=lambda: self.send_direction("O"))
+        self.btn_u = tk.Button(control_frame, text="U", command=lambda: self.send_direction("U"))
+        self.btn_d = tk.Button(control_frame, text="D", command=lambda: self.send_direction("D"))
+
+        self.btn_n.grid(row=1, column=0, sticky="ew", pady=2)
+        self.btn_s.grid(row=2, column=0, sticky="ew", pady=2)
+        self.btn_e.grid(row=3, column=0, sticky="ew", pady=2)
+        self.btn_o.grid(row=4, column=0, sticky="ew", pady=2)
+        self.btn_u.grid(row=5, column=0, sticky="ew", pady=2)
+        self.btn_d.grid(row=6, column=0, sticky="ew", pady=2)
+
+        tk.Label(control_frame, text="Commandes").grid(row=7, column=0, pady=(10, 6))
+
+        self.btn_look = tk.Button(control_frame, text="look", command=lambda: self.send_command("look"))
+        self.btn_take = tk.Button(control_frame, text="take", command=self.take_auto)
+
+        # ✅ DROP BOUTON (comme demandé)
+        self.btn_drop = tk.Button(control_frame, text="drop", command=self.drop_prompt)
+
+        self.btn_check = tk.Button(control_frame, text="check", command=lambda: self.send_command("check"))
+        self.btn_history = tk.Button(control_frame, text="history", command=lambda: self.send_command("history"))
+        self.btn_back = tk.Button(control_frame, text="back", command=lambda: self.send_command("back"))
+        self.btn_help = tk.Button(control_frame, text="help", command=lambda: self.send_command("help"))
+        self.btn_quit = tk.Button(control_frame, text="quit", command=lambda: self.send_command("quit"))
+
+        self.btn_look.grid(row=8, column=0, sticky="ew", pady=2)
+        self.btn_take.grid(row=9, column=0, sticky="ew", pady=2)
+
+        # ✅ place drop juste après take
+        self.btn_drop.grid(row=10, column=0, sticky="ew", pady=2)
+
+        self.btn_check.grid(row=11, column=0, sticky="ew", pady=2)
+        self.btn_history.grid(row=12, column=0, sticky="ew", pady=2)
+        self.btn_back.grid(row=13, column=0, sticky="ew", pady=2)
+        self.btn_help.grid(row=14, column=0, sticky="ew", pady=2)
+        self.btn_quit.grid(row=15, column=0, sticky="ew", pady=2)
+
+        # ENTRY + SEND
+        entry_frame = tk.Frame(self, takefocus=0)
+        entry_frame.grid(row=2, column=0, columnspan=2, sticky="ew", padx=8, pady=(0, 8))
+        entry_frame.grid_columnconfigure(0, weight=1)
+
+        self.entry = tk.Entry(entry_frame)
+        self.entry.grid(row=0, column=0, sticky="ew")
+        self.btn_send = tk.Button(entry_frame, text="Envoyer", command=self.on_enter)
+        self.btn_send.grid(row=0, column=1, padx=(6, 0))
+
+    # =========================
+    # GUI HELPERS
+    # =========================
+    def _set_buttons_state(self, state: str):
+        """Applique un état à tous les boutons (utile pour pause / fin)."""
+        btns = [
+            self.btn_n, self.btn_s, self.btn_e, self.btn_o, self.btn_u, self.btn_d,
+            self.btn_look, self.btn_take, self.btn_drop, self.btn_check, self.btn_history,
+            self.btn_back, self.btn_help, self.btn_quit, self.btn_send
+        ]
+        for b in btns:
+            try:
+                b.configure(state=state)
+            except Exception:
+                pass
+
+    def disable_inputs(self):
+        """Désactive proprement la saisie quand le jeu est fini."""
+        try:
+            self.entry.configure(state="disabled")
+        except Exception:
+            pass
+        self._set_buttons_state("disabled")
+
+    def enable_inputs(self):
+        try:
+            self.entry.configure(state="normal")
+            self.entry.focus_set()
+        except Exception:
+            pass
+        self._set_buttons_state("normal")
+
+    def clear_output(self):
+        self.output.discard()
+        self.text.configure(state="normal")
+        self.text.delete("1.0", "end")
+        self.text.configure(state="disabled")
+
+    def _flush_output(self):
+        """Affiche tout de suite le texte en attente (avant d'attendre le joueur)."""
+        try:
+            self.output.flush()
+        except Exception:
+            pass
+
+    def ask_player_name(self):
+        self._flush_output()
+        name = simpledialog.askstring("ATLAS 2160", "Identité (écris ton nom) :")
+        if name is None:
+            return "Inconnu"
+        name = name.strip()
+        return name if name else "Inconnu"
+
+    def gui_pause(self):
+        """
+        Le moteur a suspendu une scène (pause) :
+        - désactive les boutons pour éviter clics parasites
+        - Entrée la reprend (_continue_scene)
+        """
+        with self._track("gui_pause"):
+            self._flush_output()
+            self._waiting_for_continue = True
+
+            self.disable_inputs()
+            try:
+                self.entry.configure(state="normal")
+                self.entry.focus_set()
+            except Exception:
+                pass
+
+    def _continue_scene(self):
+        """Entrée pendant une pause : le moteur reprend la scène jusqu'à la pause suivante ou sa fin."""
+        self._waiting_for_continue = False
+        self.enable_inputs()
+        self._post(("continue",))
+
+    def _show_message(self, text: str):
+        """Popup demandée par le jeu (fin de partie)."""
+        self._flush_output()
+        self._end_popup_shown = True
+        try:
+            messagebox.showinfo("ATLAS 2160", text)
+        except Exception:
+            pass
+
+    def take_auto(self):
+        if getattr(self, "_waiting_for_continue", False):
+            return
+        if self.view.finished:
+            return
+        try:
+            inv = self.view.ground
+            if len(inv) == 0:
+                print("\nIl n’y a rien à ramasser ici.\n")
+                return
+            if len(inv) == 1:
+                self.send_command("take")
+                return
+            print("\nPlusieurs objets sont présents. Fais 'look' puis 'take <objet>'.\n")
+        except Exception:
+            print("\nImpossible de ramasser.\n")
+
+    # ✅ DROP — demande un objet à déposer
+    def drop_prompt(self):
+        if getattr(self, "_waiting_for_continue", False):
+            return
+        if self.view.finished:
+            return
+        try:
+            inv = self.view.bag
+            if not inv:
+                print("\nInventaire vide : rien à déposer.\n")
+                return
+
+            self._flush_output()
+            name = simpledialog.askstring("Drop", "Quel objet déposer ? (début du nom)")
+            if not name:
+                return
+            # Un seul objet commence ainsi : on envoie son nom exact
+            found = self.completer.candidates("bag", name.strip())
+            if len(found) == 1:
+                name = found[0]
+            self.send_command(f"drop {name.strip()}")
+        except Exception:
+            print("\nImpossible de déposer.\n")
+
+    def on_enter(self, event=None):
+        if not self._ready:
+            return "break"  # monde encore en construction : le texte tapé reste dans le champ
+
+        cmd = self.entry.get().strip()
+        self.entry.delete(0, "end")
+
+        if getattr(self, "_waiting_for_continue", False):
+            if cmd.lower() == "back":
+                self.send_command("back")
+                return "break"
+            self._continue_scene()
+            return "break"
+
+        if cmd == "" and self.view.mode == "CHOICE":
+            print("\nChoix requis. Tape N ou E.\n")
+            print(self.view.choice_prompt)
+            return "break"
+
+        if cmd:
+            self.send_command(cmd)
+        return "break"
+
+    def on_tab(self, event=None):
+        """
+        Tab dans l'entrée : complète jusqu'à l'ambiguïté ;
+        si rien ne peut être ajouté, affiche les possibilités.
+        """
+        if not self._ready:
+            return "break"
+        text = self.entry.get()
+        found = self.completer.complete(text)
+        if not found:
+            return "break"
+
+        if len(found) == 1:
+            completed = found[0] + " " if found[0] in self.view.commands else found[0]
+        else:
+            completed = common_prefix(found)
+
+        if len(completed) >= len(text.lstrip()) and completed != text.lstrip():
+            self.entry.delete(0, "end")
+            self.entry.insert(0, completed)
+        elif len(found) > 1:
+            print("\n" + "   ".join(found) + "\n")
+        return "break"
+
+    def send_direction(self, d: str):
+        if self.view.mode == "CHOICE":
+            self.send_command(d)
+        else:
+            self.send_command(f"go {d}")
+
+    # =========================
+    # VUE (diff après chaque commande)
+    # =========================
+    def _apply_view(self, view: ViewModel):
+        """
+        Nouvel état envoyé par le moteur : on ne touche qu'aux widgets dont l'état a changé :
+        - panneau de statut : un label par champ
+        - image : seulement si le fichier ou la teinte diffèrent de l'image affichée
+        ('help', 'quests', 'history'... ne redessinent donc rien)
+        """
+        self.view = view
+        self.completer.update(view)
+        changed = view.diff(self._panel_view)
+        self._panel_view = view
+        for key in changed & self.status_labels.keys():
+            try:
+                self.status_labels[key].configure(text=self._status_text(view, key))
+            except Exception:
+                pass
+
+        if changed & {"room", "visited"}:
+            self.minimap.mark(view.room, view.visited)
+
+        if self._image_view is None or view.image_state() != self._image_view.image_state():
+            self.refresh_room_image()
+
+    def _show_map(self, layout):
+        """Nouveau chapitre : plan complet (le moteur ne l'envoie qu'une fois par chapitre)."""
+        self.minimap.show(layout)
+        self.minimap.mark(self.view.room, self.view.visited)
+
+    @staticmethod
+    def _status_text(view: ViewModel, key: str) -> str:
+        if key == "room":
+            return f"📍 Lieu : {view.room}" if view.room else "📍 Lieu : —"
+        if key == "exits":
+            return view.exits
+        if key == "ground":
+            return "Au sol : " + (", ".join(view.ground) if view.ground else "rien")
+        if key == "bag":
+            return "Inventaire : " + (", ".join(view.bag) if view.bag else "vide")
+        if key == "quest":
+            return f"Quête : {view.quest}" if view.quest else "Quête : aucune active"
+        if key == "mode":
+            return "Mode : CHOIX (N / E)" if view.mode == "CHOICE" else "Mode : exploration"
+        return ""
+
+    def send_command(self, cmd: str):
+        if not self._ready or self.view.finished:
+            return
+        if getattr(self, "_waiting_for_continue", False):
+            return
+        # Exécutée par le moteur : la fenêtre reste réactive pendant la commande
+        with self._track("send_command"):
+            self._post(("command", cmd))
+
+    def _finish_turn(self):
+        # Fin d'un tour côté moteur (la vue a déjà été envoyée juste avant)
+        self._flush_output()
+
+        # Fin du jeu : on désactive + popup (UNE SEULE FOIS)
+        if self.view.finished:
+            self.disable_inputs()
+            if not self._end_popup_shown:
+                self._show_message("Fin du jeu.")
+
+    # =========================
+    # IMAGES (FIX)
+    # =========================
+    def refresh_room_image(self):
+        """
+        Affiche l'image du dernier ViewModel reçu :
+        - image forcée d'une cinématique (view.cutscene)
+        - sinon l'image de la salle courante
+
+        Une fois l'image affichée, on relance le préchargement des suivantes.
+        """
+        # Mémorise ce qui est affiché : _apply_view ne redessine que si cela change
+        self._image_view = self.view
+        with self._track("refresh_room_image"):
+            try:
+                self._show_current_image()
+            finally:
+                self._schedule_prefetch()
+
+    def _show_current_image(self):
+        try:
+            view = self.view
+            if view.cutscene:
+                override = view.image
+                path = self.asset_index.resolve(override)
+                self._last_image_path = path
+                if path is not None:
+                    try:
+                        self._show_image(path)
+                    except Exception:
+                        self.image_label.configure(image="", text=f"(Image invalide)\n{override}")
+                else:
+                    self._wanted_key = None
+                    self.image_label.configure(image="", text=f"(assets/{override} manquant)")
+                return
+
+            if not view.room:
+                self.image_label.configure(image="", text="(Aucun lieu)")
+                self._wanted_key = None
+                self._last_image_path = None
+                self.current_photo = None
+                return
+
+            path = self.asset_index.resolve(view.image) if view.image else None
+            self._last_image_path = path
+
+            if path is None:
+                self.image_label.configure(image="", text=f"{view.room}\n\n(aucune image pour '{view.image}')")
+                self._wanted_key = None
+                self.current_photo = None
+                return
+
+            self._show_image(path)
+
+        except Exception:
+            self.image_label.configure(image="", text="(Erreur image)")
+            self._wanted_key = None
+            self._last_image_path = None
+            self.current_photo = None
+
+    def _show_image(self, path, placeholder=True):
+        """
+        Affiche l'image 'path' (résolue par l'index) ajustée au label.
+
+        Si l'image n'est pas déjà en mémoire, elle est préparée par le pool de
+        décodage. En attendant, on affiche sa miniature agrandie (si elle existe),
+        sinon l'image précédente reste affichée.
+        placeholder=False : pas de miniature (réajustement après redimensionnement).
+        """
+        source, size, op, key = self._fit_key(path)
+        self._wanted_key = key
+        self._cancel_decodes(prefetch=False)  # l'image demandée avant n'est plus attendue
+
+        photo = self.image_cache.get(key)
+        if photo is not None:
+            self._display_photo(photo)
+            return
+
+        thumb = self._placeholder_photo(path, size) if placeholder else None
+        if thumb is not None:
+            self.effect_player.cancel()
+            self._shown = None  # pas de fondu depuis une miniature
+            self.current_photo = thumb
+            self._show_frame(thumb)
+        elif self.current_photo is None:
+            self.image_label.configure(image="", text="(Chargement…)")
+        self._request_photo(source, size, op, key, keep=False)
+
+    def _placeholder_photo(self, path, size):
+        """
+        Miniature de 'path' (assets/thumbs, quelques Ko) agrandie vers 'size'
+        par un zoom entier. Mémorisée dans le cache d'images.
+        """
+        thumb = self.asset_index.thumbnail(path)
+        if thumb is None:
+            return None
+        key = (thumb, size, ("thumb",))
+        photo = self.image_cache.get(key)
+        if photo is None:
+            try:
+                small = tk.PhotoImage(data=self._read_asset_bytes(thumb))
+                k = max(1, min(size[0] // small.width(), size[1] // small.height()))
+                photo = small.zoom(k, k) if k > 1 else small
+            except Exception:
+                return None
+            self.image_cache.put(key, photo)
+        return photo
+
+    def _display_photo(self, photo):
+        """
+        Affiche l'image demandée (self._wanted_key), après l'étage d'effets :
+        - teinte selon l'état du joueur (blessé, labyrinthe)
+        - fondu enchaîné depuis l'image précédente pendant une cinématique
+        """
+        key = self._wanted_key
+        name = self._current_tint()
+        if name is not None and key is not None:
+            try:
+                photo = self._effect_photo((key, ("tint", name)), lambda: self._effect_ppm(key, name, photo))
+            except Exception:
+                name = None
+
+        if (key, name) == self._shown and self.effect_player.is_running():
+            return  # même image, fondu déjà en cours : on le laisse finir
+
+        previous, self._shown = self._shown, (key, name)
+        old_photo, self.current_photo = self.current_photo, photo
+
+        if (
+            previous is not None and previous != self._shown and key is not None
+            and self.view.cutscene
+            and old_photo is not None
+            and (old_photo.width(), old_photo.height()) == (photo.width(), photo.height())
+        ):
+            self.effect_player.play(self._fade_frames(previous, self._shown, old_photo, photo), self._show_frame)
+            return
+
+        self.effect_player.cancel()
+        self._show_frame(photo)
+
+    def _show_frame(self, photo):
+        self._effect_frame = photo
+        self.image_label.configure(image=photo, text="")
+
+    def _current_tint(self):
+        """Teinte à appliquer selon l'état du jeu (jamais pendant une cinématique)."""
+        view = self.view
+        if view.cutscene:
+            return None
+        if view.injured:
+            return "injured"
+        if view.labyrinth:
+            return "labyrinth"
+        return None
+
+    # =========================
+    # EFFETS (teintes, fondus)
+    # =========================
+    def _photo_ppm(self, key, photo):
+        """
+        Pixels PPM d'une image affichable : repris du cache disque PPM quand il
+        l'a déjà, sinon écrits une fois par Tk. Mémorisés dans effect_cache.
+        """
+        ck = (key, ("ppm",))
+        data = self.effect_cache.get(ck)
+        if data is not None:
+            return data
+
+        source, size = key[0], key[1]
+        if size is not None:
+            try:
+                data = self.transcode_cache.get(self._source_digest(source), size)
+            except Exception:
+                data = None
+        if data is None:
+            fd, tmp = tempfile.mkstemp(suffix=".ppm")
+            os.close(fd)
+            try:
+                photo.write(tmp, format="ppm")
+                with open(tmp, "rb") as f:
+                    data = f.read()
+            finally:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+
+        self.effect_cache.put(ck, data, len(data))
+        return data
+
+    def _effect_ppm(self, key, tint_name, photo):
+        """Pixels PPM de l'image 'key' avec sa teinte éventuelle (mémorisés)."""
+        if tint_name is None:
+            return self._photo_ppm(key, photo)
+        ck = (key, ("tint", tint_name, "ppm"))
+        data = self.effect_cache.get(ck)
+        if data is None:
+            data = tint(self._photo_ppm(key, photo), TINTS[tint_name])
+            self.effect_cache.put(ck, data, len(data))
+        return data
+
+    def _effect_photo(self, ck, make_ppm):
+        """PhotoImage d'un effet, construite une fois puis servie par effect_cache."""
+        photo = self.effect_cache.get(ck)
+        if photo is None:
+            photo = tk.PhotoImage(data=make_ppm())
+            self.effect_cache.put(ck, photo)
+        return photo
+
+    def _fade_frames(self, previous, current, old_photo, new_photo):
+        """
+        Images intermédiaires du fondu (calculées une par une, au fil de la lecture),
+        puis l'image finale. Chaque étape est mémorisée par (départ, arrivée, étape).
+        """
+        raw_old = self._base_photo(previous[0]) or old_photo
+        raw_new = self._base_photo(current[0]) or new_photo
+        for i in range(1, FADE_FRAMES):
+            ck = (previous, current, ("fade", i, FADE_FRAMES))
+            yield self._effect_photo(ck, lambda i=i: crossfade(
+                self._effect_ppm(previous[0], previous[1], raw_old),
+                self._effect_ppm(current[0], current[1], raw_new),
+                i / FADE_FRAMES,
+            ))
+        yield new_photo
+
+    def _base_photo(self, key):
+        """Image non teintée correspondant à une clé (None si plus en cache)."""
+        return self.image_cache.get(key) if key is not None else None
+
+    def _on_image_configure(self, event=None):
+        """
+        Redimensionnement du label : pendant qu'on tire la fenêtre, Tk envoie un
+        <Configure> par pixel. On regroupe tout en UN réajustement, une fois
+        la taille stable pendant REFIT_DELAY_MS.
+        """
+        size = self._label_size()
+        if size == self._refit_size:
+            return
+        self._refit_size = size
+        if self._refit_after_id is not None:
+            try:
+                self.after_cancel(self._refit_after_id)
+            except Exception:
+                pass
+        self._refit_after_id = self.after(self.REFIT_DELAY_MS, self._refit_last_image)
+
+    def _refit_last_image(self):
+        self._refit_after_id = None
+        try:
+            if self._last_image_path is None or self.current_photo is None:
+                return
+            self._show_image(self._last_image_path, placeholder=False)
+        except Exception:
+            pass
+
+    def _label_size(self):
+        return max(1, self.image_label.winfo_width()), max(1, self.image_label.winfo_height())
+
+    def _pick_source(self, path):
+        """
+        Fichier à décoder pour afficher l'image 'path' dans le label actuel :
+        la plus petite variante pré-réduite qui donne le même rendu, sinon l'original.
+        """
+        if self.variants is None:
+            return path
+        lw, lh = self._label_size()
+        return self.variants.pick(
+            os.path.basename(path), path, lambda w, h: compute_fit(w, h, lw, lh)[1],
+            exists=self.asset_index.has_path,
+        )
+
+    def _pack_name(self, path):
+        """Nom d'un fichier de assets/ dans l'archive (relatif, avec des '/')."""
+        return os.path.relpath(path, self.assets_dir).replace(os.sep, "/")
+
+    def _packed_name(self, path):
+        """Nom dans l'archive si c'est elle qui fournit 'path' (None : fichier lu sur le disque)."""
+        if self.asset_pack is None or not self.asset_index.packed(path):
+            return None
+        return self._pack_name(path)
+
+    def _read_asset_header(self, path, n=24):
+        name = self._packed_name(path)
+        if name is not None:
+            return bytes(self.asset_pack.view(name)[:n])
+        with open(path, "rb") as f:
+            return f.read(n)
+
+    def _source_size(self, path):
+        """
+        (Thread Tk) Dimensions d'une image sans la décoder (en-tête PNG), mémorisées.
+        Si ce n'est pas un PNG, Tk la décode : jamais appelé depuis un worker.
+        """
+        size = self._source_sizes.get(path)
+        if size is None:
+            size = png_size(self._read_asset_header(path))
+            if size is None:
+                raw = self._load_raw_photo(path)
+                size = raw.width(), raw.height()
+            self._source_sizes[path] = size
+        return size
+
+    def _source_digest(self, path):
+        """Empreinte du fichier source : gratuite depuis l'archive, sinon calculée une fois."""
+        name = self._packed_name(path)
+        if name is not None:
+            return self.asset_pack.entries[name][2]
+        return self.transcode_cache.file_digest(path)
+
+    def _read_asset_bytes(self, path):
+        """Contenu complet d'un (petit) fichier de assets/, depuis l'archive ou le disque."""
+        name = self._packed_name(path)
+        if name is not None:
+            return self.asset_pack.read(name)
+        with open(path, "rb") as f:
+            return f.read()
+
+    def _asset_data(self, path):
+        """Contenu d'une image pour pngdecode : vue dans l'archive (sans copie) ou chemin."""
+        name = self._packed_name(path)
+        if name is not None:
+            return self.asset_pack.view(name)
+        return path
+
+    def _decode_photo(self, path):
+        """Décode une image : depuis l'archive si elle la contient, sinon depuis le disque."""
+        name = self._packed_name(path)
+        if name is not None:
+            return tk.PhotoImage(data=self.asset_pack.read(name))
+        return tk.PhotoImage(file=path)
+
+    def _load_raw_photo(self, path):
+        """Image brute (taille d'origine) : décodée une seule fois, puis servie par le cache."""
+        key = (path, None, ("raw", 1))
+        photo = self.image_cache.get(key)
+        if photo is None:
+            photo = self._decode_photo(path)
+            self.image_cache.put(key, photo)
+        return photo
+
+    def _mip(self, source, level):
+        """
+        Niveau 'level' de la chaîne de mipmaps de 'source' (taille / 2**level).
+        Chaque niveau est construit depuis le précédent et gardé dans le cache.
+        """
+        if level <= 0:
+            return self._load_raw_photo(source)
+        key = (source, None, ("mip", level))
+        photo = self.image_cache.get(key)
+        if photo is None:
+            photo = mip_level(self._mip(source, level - 1), level)
+            self.image_cache.put(key, photo)
+        return photo
+
+    def _fit_key(self, path):
+        """
+        Calcule (source, taille, opération, clé de cache) pour afficher l'image 'path'.
+
+        La taille finale dépend uniquement du facteur : deux tailles de label
+        qui donnent le même facteur partagent la même entrée de cache.
+        Sans mise à l'échelle, la clé est celle de l'image brute.
+        """
+        source = self._pick_source(path)
+        iw, ih = self._source_size(source)
+        lw, lh = self._label_size()
+        op, size = compute_fit(iw, ih, lw, lh)
+        if op[0] == "raw":
+            return source, size, op, (source, None, ("raw", 1))
+        return source, size, op, (source, size, op)
+
+    # =========================
+    # DÉCODAGE HORS THREAD TK
+    # =========================
+    def _request_photo(self, source, size, op, key, keep):
+        """
+        Demande la préparation d'une image au pool de décodage.
+        keep=True : le résultat est gardé même si le joueur a changé de salle (préchargement).
+        L'image affichée (keep=False) passe devant les préchargements en attente.
+        """
+        if key in self._inflight:
+            if keep or self._inflight[key] is False:
+                self._inflight[key] = self._inflight[key] or keep
+                return
+            # Déjà demandée en préchargement : on la remonte en tête si elle attend encore
+            future = self._futures.get(key)
+            if future is None or not future.cancel():
+                return  # déjà en cours de décodage
+        else:
+            self._inflight[key] = keep
+        src_size = self._source_size(source)  # ici, dans le thread Tk (le worker ne touche pas Tk)
+        self._futures[key] = self.decode_pool.submit(
+            lambda: self._prepare_ppm(source, size, op, key, src_size),
+            lambda result, error: self._on_prepared(source, size, op, key, result, error),
+            PRIORITY_PREFETCH if keep else PRIORITY_SHOWN,
+        )
+
+    def _cancel_decodes(self, prefetch):
+        """
+        Retire du pool les préparations pas encore commencées devenues inutiles :
+        l'image demandée avant (prefetch=False) ou l'ancienne vague de préchargement
+        (prefetch=True). L'image demandée maintenant n'est jamais annulée.
+        """
+        for key, future in list(self._futures.items()):
+            if key == self._wanted_key or self._inflight.get(key, False) != prefetch:
+                continue
+            if future is not None and future.cancel():
+                del self._futures[key]
+                self._inflight.pop(key, None)
+
+    def _prepare_ppm(self, source, size, op, key, src_size):
+        """
+        (Worker, sans Tk) Empreinte de la source + octets PPM à la taille cible :
+        - depuis le cache disque s'il les contient déjà
+        - sinon décodés et réduits directement par pngdecode, originaux compris
+          (~1.7 s pour un 1536x1024, mais hors du thread Tk : la miniature reste
+          affichée en attendant), puis ajoutés au cache disque
+        Renvoie (empreinte, None) si pngdecode ne sait pas faire (agrandissement,
+        PNG entrelacé...) : seul ce cas repasse par Tk.
+        Renvoie None sans rien décoder si l'image n'est plus ni demandée ni préchargée.
+        """
+        digest = self._source_digest(source)
+        data = self.transcode_cache.get(digest, size)
+        if data is not None:
+            return digest, data
+
+        if key != self._wanted_key and not self._inflight.get(key, False):
+            return None  # le joueur est déjà ailleurs : pas une seconde de CPU pour rien
+
+        iw, ih = src_size
+        if size[0] > iw or size[1] > ih:
+            return digest, None  # pngdecode ne fait que réduire
+        try:
+            data = decode_scaled(self._asset_data(source), size)
+        except PNGError:
+            return digest, None
+
+        def write_ppm(p):
+            with open(p, "wb") as f:
+                f.write(data)
+
+        self.transcode_cache.put(digest, size, write_ppm)
+        return digest, data
+
+    def _on_prepared(self, source, size, op, key, result, error=None):
+        """(Thread Tk) Construit la PhotoImage à partir du PPM préparé par le worker."""
+        keep = self._inflight.pop(key, False)
+        self._futures.pop(key, None)
+        if key != self._wanted_key and not keep:
+            return  # résultat périmé : le joueur est déjà ailleurs
+        if result is None and error is None:
+            # Abandonnée par le worker, mais le joueur est revenu sur cette image entre-temps
+            if key == self._wanted_key:
+                self._request_photo(source, size, op, key, keep=False)
+            return
+
+        digest, data = result if result else (None, None)
+        photo = None
+        if data is not None:
+            try:
+                photo = tk.PhotoImage(data=data)
+            except Exception:
+                photo = None
+
+        if photo is None:
+            if key != self._wanted_key:
+                return  # préchargement : jamais de décodage dans le thread Tk
+            # Format non géré par pngdecode : décodage du PNG par Tk, au prochain temps mort
+            self.after_idle(self._decode_on_main, source, size, op, key, digest, keep)
+            return
+
+        self.image_cache.put(key, photo)
+        if key == self._wanted_key:
+            self._display_photo(photo)
+
+    def _decode_on_main(self, source, size, op, key, digest, keep):
+        """
+        (Thread Tk) Décodage PNG classique, puis écriture du PPM pour la prochaine fois.
+        Dernier recours, seulement pour l'image affichée (jamais pour un préchargement) ;
+        ignoré si elle n'est plus demandée (le joueur a enchaîné les déplacements).
+        """
+        if key != self._wanted_key:
+            return
+        try:
+            photo = self.image_cache.get(key)
+            if photo is None:
+                if op[0] == "scale":
+                    photo = apply_fit(self._mip(source, op[1]), op)
+                else:
+                    photo = self._load_raw_photo(source)
+                if op[0] != "raw":
+                    self.image_cache.put(key, photo)
+                if digest is not None:
+                    self.transcode_cache.put(digest, size, lambda p: photo.write(p, format="ppm"))
+            if key == self._wanted_key:
+                self._display_photo(photo)
+        except Exception:
+            if key == self._wanted_key:
+                self.image_label.configure(image="", text="(Erreur image)")
+                self.current_photo = None
+
+    # =========================
+    # PRÉCHARGEMENT
+    # =========================
+    def _schedule_prefetch(self):
+        # Nouvelle vague : les préchargements de l'ancienne qui attendent encore sont retirés
+        self._cancel_decodes(prefetch=True)
+        try:
+            if self.view.finished:
+                self.prefetcher.cancel()
+                return
+            self.prefetcher.schedule(self.view.upcoming)
+        except Exception:
+            pass
+
+    def _prefetch_image(self, name):
+        """
+        Prépare une image à l'avance (version ajustée au label), via le pool de décodage.
+        'name' : nom de fichier OUTRO ou identifiant de salle.
+        Renvoie une estimation des octets qui seront ajoutés au cache.
+        """
+        path = self.asset_index.resolve(name)
+        if path is None:
+            return 0
+
+        source, size, op, key = self._fit_key(path)
+        if key in self.image_cache or key in self._inflight:
+            return 0
+        self._request_photo(source, size, op, key, keep=True)
+        return size[0] * size[1] * ImageCache.BYTES_PER_PIXEL
+
+    def on_close(self):
+        try:
+            if self._startup_after_id is not None:
+                self.after_cancel(self._startup_after_id)
+            if self._engine_after_id is not None:
+                self.after_cancel(self._engine_after_id)
+        except Exception:
+            pass
+        self.engine.stop()
+        if self.stall_monitor is not None:
+            self.stall_monitor.stop()
+            print(self.stall_monitor.report(), file=sys.__stderr__)
+        try:
+            self.prefetcher.cancel()
+            self.effect_player.cancel()
+            self.decode_pool.shutdown()
+        except Exception:
+            pass
+        try:
+            if self.asset_pack is not None:
+                self.asset_pack.close()
+        except Exception:
+            pass
+        try:
+            sys.stdout = sys.__stdout__
+            self.transcript.close()
+        except Exception:
+            pass
+        self.destroy()
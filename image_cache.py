@@ -0,0 +1,188 @@
+# image_cache.py
+
+import math
+from collections import OrderedDict
+
+
+# Dénominateur maximal des facteurs fractionnaires (ex: 2/3, 3/4, 3/2).
+# Tk ne sait faire que zoom/subsample entiers : un facteur a/b se fait avec
+# zoom(a) puis subsample(b), donc on garde b petit pour limiter l'image temporaire.
+MAX_DENOMINATOR = 4
+MAX_ZOOM = 6
+
+
+def _ratio_below(r: float):
+    """
+    Plus grande fraction a/b <= r avec b <= MAX_DENOMINATOR et a <= MAX_ZOOM
+    (a borne la taille de l'image temporaire créée par zoom).
+    """
+    best = (1, MAX_DENOMINATOR)
+    for b in range(1, MAX_DENOMINATOR + 1):
+        a = min(MAX_ZOOM, math.floor(r * b + 1e-9))
+        if a >= 1 and a * best[1] > best[0] * b:
+            best = (a, b)
+    return best
+
+
+def compute_fit(iw, ih, lw, lh):
+    """
+    Calcule l'opération pour faire tenir une image (iw x ih) dans un label (lw x lh).
+
+    On passe par une chaîne de mipmaps (image / 2, / 4, / 8...) : on part du
+    niveau le plus petit qui reste plus grand que la cible, puis on applique un
+    facteur fractionnaire a/b. Un ajustement à 1.5x n'est donc plus arrondi à 1x ou 2x.
+
+    Retour : (opération, taille finale)
+    - ("scale", niveau, a, b) : niveau de mipmap, puis zoom(a) + subsample(b)
+    - ("raw", 1) si l'image tient telle quelle
+    """
+    s = min(lw / iw, lh / ih)
+
+    level = 0
+    if s >= 1:
+        r = min(s, MAX_ZOOM)
+    else:
+        while s * (2 ** (level + 1)) <= 1:
+            level += 1
+        r = s * (2 ** level)
+
+    a, b = _ratio_below(r)
+    if (a, b) == (1, 2):
+        # 1/2 d'un niveau = le niveau suivant tel quel (même pixels, sans calcul)
+        level, a, b = level + 1, 1, 1
+    if level == 0 and a == b:
+        return ("raw", 1), (iw, ih)
+
+    # Tailles réelles produites par Tk (subsample arrondit au supérieur)
+    mw = math.ceil(iw / (2 ** level))
+    mh = math.ceil(ih / (2 ** level))
+    return ("scale", level, a, b), (math.ceil(mw * a / b), math.ceil(mh * a / b))
+
+
+def mip_level(image, level: int):
+    """Niveau 'level' de la chaîne de mipmaps, calculé depuis le niveau précédent (taille / 2)."""
+    return image.subsample(2, 2) if level > 0 else image
+
+
+def apply_fit(mip, op):
+    """
+    Applique le facteur a/b de compute_fit à l'image du bon niveau de mipmap.
+    (zoom puis subsample : plus proche voisin au facteur exact a/b)
+    """
+    if op[0] != "scale":
+        return mip
+    _, _, a, b = op
+    if a == b:
+        return mip
+    img = mip.zoom(a, a) if a > 1 else mip
+    return img.subsample(b, b) if b > 1 else img
+
+
+class ImageCache:
+    """
+    Cache LRU borné pour les images Tk (PhotoImage) déjà décodées.
+
+    Décoder un PNG de ~2.5 Mo à chaque commande coûte cher : ce cache garde
+    en mémoire les images brutes ET leurs versions ajustées (subsample/zoom),
+    pour qu'un changement de salle ne soit plus qu'une lecture de dictionnaire.
+
+    Clés utilisées par GameGUI :
+    - image brute   : (chemin, None, ("raw", 1))
+    - mipmap        : (chemin, None, ("mip", niveau))
+    - image ajustée : (chemin, (largeur, hauteur), ("scale", niveau, a, b))
+
+    La taille est bornée en octets (estimation : largeur * hauteur * 4,
+    Tk stocke les pixels en RGBA 32 bits). Quand on dépasse, on évince
+    les entrées les moins récemment utilisées.
+    """
+
+    BYTES_PER_PIXEL = 4
+
+    def __init__(self, max_bytes: int = 96 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+
+        self._entries = OrderedDict()  # clé -> (image, nb_octets)
+
+        # Compteurs (utiles pour vérifier que le cache sert vraiment)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def estimate_bytes(cls, image) -> int:
+        """Estime la mémoire occupée par une image (pixels RGBA)."""
+        try:
+            return max(1, image.width()) * max(1, image.height()) * cls.BYTES_PER_PIXEL
+        except Exception:
+            return 0
+
+    def get(self, key):
+        """Renvoie l'image associée à la clé (et la marque récente), ou None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, image, nbytes: int = None):
+        """
+        Ajoute (ou remplace) une image dans le cache.
+
+        Une image plus grosse que tout le budget n'est pas gardée :
+        elle évincerait tout le reste pour rien.
+        """
+        if image is None:
+            return image
+        if nbytes is None:
+            nbytes = self.estimate_bytes(image)
+
+        self.discard(key)
+        if nbytes > self.max_bytes:
+            return image
+
+        self._entries[key] = (image, nbytes)
+        self.current_bytes += nbytes
+        self._evict()
+        return image
+
+    def discard(self, key) -> bool:
+        """Retire une entrée si elle existe."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self.current_bytes -= entry[1]
+        return True
+
+    def clear(self):
+        """Vide complètement le cache (les compteurs sont conservés)."""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def _evict(self):
+        """Évince les entrées les plus anciennes jusqu'à repasser sous le budget."""
+        while self.current_bytes > self.max_bytes and self._entries:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self.current_bytes -= nbytes
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """Résumé des compteurs (hits, misses, taille occupée...)."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / total) if total else 0.0,
+        }
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,152 @@
+# minimap.py
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Tuple
+
+
+# Décalage sur la grille pour chaque sortie ; U/D (étages) en diagonale
+DIRECTION_OFFSETS = {
+    "N": (0, -1),
+    "S": (0, 1),
+    "E": (1, 0),
+    "O": (-1, 0),
+    "U": (1, -1),
+    "D": (-1, 1),
+}
+
+
+@dataclass(frozen=True)
+class MapLayout:
+    """
+    Plan d'un chapitre, calculé une fois (thread du moteur) puis envoyé à la GUI.
+    - nodes : (nom de salle, x, y) sur une grille, coins à (0, 0)
+    - edges : (salle a, salle b, direction) une seule fois par couloir
+    """
+    chapter: int
+    nodes: Tuple[Tuple[str, int, int], ...]
+    edges: Tuple[Tuple[str, str, str], ...]
+    width: int
+    height: int
+
+
+def layout_rooms(chapter: int, rooms, start=None) -> MapLayout:
+    """
+    Place les salles d'un chapitre sur une grille en suivant Room.exits depuis 'start'
+    (parcours en largeur). Si la case visée est prise, on continue dans la même
+    direction. Les sorties vers des salles hors de la liste (labyrinthe) sont ignorées.
+    """
+    rooms = list(rooms)
+    known = {id(r) for r in rooms}
+    pos = {}
+    used = set()
+
+    def place(room, x, y, dx=1, dy=0):
+        while (x, y) in used:
+            x += dx
+            y += dy
+        pos[id(room)] = (x, y)
+        used.add((x, y))
+
+    order = ([start] if start is not None and id(start) in known else []) + rooms
+    for root in order:
+        if id(root) in pos:
+            continue
+        # Morceau non relié au précédent : posé à droite de tout le reste
+        place(root, max((x for x, _ in used), default=-2) + 2, 0)
+        queue = deque([root])
+        while queue:
+            room = queue.popleft()
+            x, y = pos[id(room)]
+            for d, dest in room.exits.items():
+                if dest is None or id(dest) not in known or id(dest) in pos:
+                    continue
+                dx, dy = DIRECTION_OFFSETS.get(str(d).upper(), (1, 0))
+                place(dest, x + dx, y + dy, dx, dy)
+                queue.append(dest)
+
+    min_x = min((x for x, _ in pos.values()), default=0)
+    min_y = min((y for _, y in pos.values()), default=0)
+    nodes = tuple((r.name, pos[id(r)][0] - min_x, pos[id(r)][1] - min_y) for r in rooms)
+
+    edges = []
+    seen = set()
+    for room in rooms:
+        for d, dest in room.exits.items():
+            if dest is None or id(dest) not in known:
+                continue
+            pair = frozenset((room.name, dest.name))
+            if pair not in seen:
+                seen.add(pair)
+                edges.append((room.name, dest.name, str(d).upper()))
+
+    width = max((x for _, x, _ in nodes), default=0) + 1
+    height = max((y for _, _, y in nodes), default=0) + 1
+    return MapLayout(chapter, nodes, tuple(edges), width, height)
+
+
+class Minimap:
+    """
+    Minimap sur un tk.Canvas.
+
+    show(layout) dessine tout le plan : une seule fois par chapitre.
+    mark(salle, visitées) ne recolore que les cases qui changent
+    (ancienne salle courante, nouvelle salle courante, salles découvertes).
+    """
+
+    COLORS = {
+        "unknown": ("", "#55606b"),       # (remplissage, contour)
+        "visited": ("#7a8a99", "#7a8a99"),
+        "current": ("#e0b040", "#fff2c0"),
+    }
+
+    def __init__(self, canvas, margin: int = 10, max_cell: int = 28):
+        self.canvas = canvas
+        self.margin = margin
+        self.max_cell = max_cell
+
+        self.layout = None
+        self._items = {}      # salle -> id du carré
+        self._state = {}      # salle -> "unknown" / "visited" / "current"
+        self.redraws = 0      # plans complets dessinés (un par chapitre)
+
+    def show(self, layout: MapLayout):
+        if layout == self.layout:
+            return
+        self.layout = layout
+        self.redraws += 1
+        c = self.canvas
+        c.delete("all")
+        self._items = {}
+        self._state = {}
+
+        w = int(c.cget("width"))
+        h = int(c.cget("height"))
+        cell = min(self.max_cell, (w - 2 * self.margin) // layout.width, (h - 2 * self.margin) // layout.height)
+        cell = max(cell, 6)
+        ox = (w - cell * layout.width) // 2
+        oy = (h - cell * layout.height) // 2
+        centers = {
+            name: (ox + x * cell + cell // 2, oy + y * cell + cell // 2)
+            for name, x, y in layout.nodes
+        }
+
+        for a, b, d in layout.edges:
+            (x1, y1), (x2, y2) = centers[a], centers[b]
+            c.create_line(x1, y1, x2, y2, fill="#3c454e", dash=(2, 2) if d in ("U", "D") else None)
+
+        half = max(2, cell // 3)
+        fill, outline = self.COLORS["unknown"]
+        for name, (x, y) in centers.items():
+            self._items[name] = c.create_rectangle(x - half, y - half, x + half, y + half, fill=fill, outline=outline)
+            self._state[name] = "unknown"
+
+    def mark(self, current: str, visited):
+        """Recolore seulement les salles dont l'état a changé."""
+        visited = set(visited)
+        for name, item in self._items.items():
+            state = "current" if name == current else "visited" if name in visited else "unknown"
+            if self._state[name] != state:
+                self._state[name] = state
+                fill, outline = self.COLORS[state]
+                self.canvas.itemconfigure(item, fill=fill, outline=outline)
@@ -0,0 +1,306 @@
+# pngdecode.py
+"""
+Décodeur PNG en Python pur (zlib + memoryview), qui réduit l'image PENDANT
+le décodage.
+
+Tk décode le PNG entier (1536x1024 -> 6 Mo de pixels), puis on jette
+la plupart des pixels avec subsample. Ici, les lignes sont décompressées
+une par une, "défiltrées", puis moyennées directement dans la taille voulue
+(filtre boîte) : la mémoire utilisée dépend de l'image de sortie, pas du PNG.
+
+Gère les PNG 8 bits non entrelacés (gris, gris+alpha, RVB, RVBA) ;
+pour le reste (palette, 16 bits, Adam7), PNGError -> on repasse par Tk.
+Le résultat est un PPM (P6), directement utilisable par PhotoImage(data=...).
+"""
+
+import struct
+import zlib
+from operator import add, floordiv, itemgetter
+
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Octets par pixel selon le type de couleur (8 bits par canal)
+_CHANNELS = {0: 1, 2: 3, 4: 2, 6: 4}
+
+# Taille des morceaux lus dans le fichier / décompressés à la fois
+_READ_SIZE = 64 * 1024
+
+
+class PNGError(ValueError):
+    """PNG invalide ou non géré par ce décodeur."""
+
+
+# -------------------------
+# Lecture des chunks
+# -------------------------
+class _BufferReader:
+    """Lecture séquentielle d'un buffer (ex: vue de l'archive) sans le recopier en entier."""
+
+    def __init__(self, data):
+        self._view = memoryview(data)
+        self._pos = 0
+
+    def read(self, n: int) -> bytes:
+        chunk = bytes(self._view[self._pos:self._pos + n])
+        self._pos += len(chunk)
+        return chunk
+
+
+def _read_exact(f, n: int) -> bytes:
+    data = f.read(n)
+    if len(data) != n:
+        raise PNGError("PNG tronqué")
+    return data
+
+
+def _iter_idat(f):
+    """Parcourt les chunks après IHDR et renvoie le contenu des IDAT, morceau par morceau."""
+    while True:
+        length, ctype = struct.unpack(">I4s", _read_exact(f, 8))
+        if ctype == b"IDAT":
+            left = length
+            while left > 0:
+                part = _read_exact(f, min(left, _READ_SIZE))
+                left -= len(part)
+                yield part
+            _read_exact(f, 4)  # CRC
+        elif ctype == b"IEND":
+            return
+        else:
+            f.read(length + 4)
+
+
+# -------------------------
+# Défiltrage des lignes
+# -------------------------
+class _RowUnfilter:
+    """
+    Reconstruit les lignes d'un PNG (filtres None / Sub / Up / Average / Paeth).
+
+    Sub et Up se font sur toute la ligne d'un coup : la ligne est vue comme
+    un grand entier, et l'addition octet par octet (modulo 256) se fait sans
+    retenue entre octets (masques 0x7f / 0x80). Sub devient une somme préfixe
+    en log2(largeur) additions. Average et Paeth dépendent du pixel tout juste
+    reconstruit : boucle Python, c'est le cas lent.
+    """
+
+    def __init__(self, stride: int, bpp: int):
+        self.stride = stride
+        self.bpp = bpp
+        self.prev = bytes(stride)
+        self._lo = int.from_bytes(b"\x7f" * stride, "big")
+        self._hi = int.from_bytes(b"\x80" * stride, "big")
+
+    def _add(self, a: int, b: int) -> int:
+        return ((a & self._lo) + (b & self._lo)) ^ ((a ^ b) & self._hi)
+
+    def unfilter(self, ftype: int, line) -> bytes:
+        n = self.stride
+        bpp = self.bpp
+        prev = self.prev
+
+        if ftype == 0:
+            row = bytes(line)
+        elif ftype == 1:
+            x = int.from_bytes(line, "big")
+            shift = 8 * bpp
+            while shift < 8 * n:
+                x = self._add(x, x >> shift)
+                shift *= 2
+            row = x.to_bytes(n, "big")
+        elif ftype == 2:
+            row = self._add(int.from_bytes(line, "big"), int.from_bytes(prev, "big")).to_bytes(n, "big")
+        elif ftype == 3:
+            out = bytearray(n)
+            for ch in range(bpp):
+                a = 0
+                res = []
+                for f, b in zip(line[ch::bpp], prev[ch::bpp]):
+                    a = (f + ((a + b) >> 1)) & 0xFF
+                    res.append(a)
+                out[ch::bpp] = bytes(res)
+            row = bytes(out)
+        elif ftype == 4:
+            # Canal par canal : a (gauche) et c (haut-gauche) restent dans des variables locales
+            out = bytearray(n)
+            for ch in range(bpp):
+                a = c = 0
+                res = []
+                for f, b in zip(line[ch::bpp], prev[ch::bpp]):
+                    pa = b - c
+                    pb = a - c
+                    pc = pa + pb
+                    if pa < 0:
+                        pa = -pa
+                    if pb < 0:
+                        pb = -pb
+                    if pc < 0:
+                        pc = -pc
+                    if pa <= pb and pa <= pc:
+                        a = (f + a) & 0xFF
+                    elif pb <= pc:
+                        a = (f + b) & 0xFF
+                    else:
+                        a = (f + c) & 0xFF
+                    c = b
+                    res.append(a)
+                out[ch::bpp] = bytes(res)
+            row = bytes(out)
+        else:
+            raise PNGError(f"filtre inconnu : {ftype}")
+
+        self.prev = row
+        return row
+
+
+# -------------------------
+# Réduction (filtre boîte)
+# -------------------------
+def _box_bounds(src: int, dst: int) -> list:
+    """Pour chaque pixel de sortie, l'intervalle [début, fin) des pixels source qu'il moyenne."""
+    bounds = []
+    for o in range(dst):
+        start = o * src // dst
+        end = max(start + 1, (o + 1) * src // dst)
+        bounds.append((start, end))
+    return bounds
+
+
+class _BoxScaler:
+    """
+    Réduit les lignes reconstruites vers (ow, oh) :
+    - vertical : les lignes source d'une même ligne de sortie sont additionnées
+    - horizontal : pour chaque décalage j dans une boîte, un itemgetter prend
+      le j-ème pixel de chaque boîte (index "zéro" si la boîte est plus courte)
+    """
+
+    def __init__(self, iw: int, ih: int, ow: int, oh: int, bpp: int):
+        self.bpp = bpp
+        self.ow = ow
+        self._row_of = [0] * ih
+        for oy, (start, end) in enumerate(_box_bounds(ih, oh)):
+            for y in range(start, end):
+                self._row_of[y] = oy
+        self._rows_in = [end - start for start, end in _box_bounds(ih, oh)]
+
+        cols = _box_bounds(iw, ow)
+        width = max(end - start for start, end in cols)
+        zero = iw * bpp  # index de l'élément nul ajouté en fin d'accumulateur
+        self._getters = []
+        for j in range(width):
+            idx = []
+            for start, end in cols:
+                x = start + j
+                for c in range(bpp):
+                    idx.append(x * bpp + c if x < end else zero)
+            self._getters.append(itemgetter(*idx))
+        self._cols_in = [end - start for start, end in cols for _ in range(bpp)]
+
+        self._acc = None
+        self._current = 0
+
+    def feed(self, y: int, row: bytes):
+        """Ajoute la ligne source y ; renvoie la ligne de sortie terminée, s'il y en a une."""
+        self._acc = list(row) if self._acc is None else list(map(add, self._acc, row))
+        done = y + 1 >= len(self._row_of) or self._row_of[y + 1] != self._current
+        if not done:
+            return None
+        out = self._emit(self._rows_in[self._current])
+        self._current += 1
+        self._acc = None
+        return out
+
+    def _emit(self, rows: int) -> bytes:
+        acc = self._acc
+        acc.append(0)
+        sums = self._getters[0](acc)
+        for getter in self._getters[1:]:
+            sums = map(add, sums, getter(acc))
+        div = [n * rows for n in self._cols_in]
+        half = [d >> 1 for d in div]
+        return bytes(map(floordiv, map(add, sums, half), div))
+
+
+# -------------------------
+# API
+# -------------------------
+def _open(source):
+    if isinstance(source, str):
+        return open(source, "rb")
+    return _BufferReader(source)
+
+
+def decode_scaled(source, size) -> bytes:
+    """
+    Décode un PNG (chemin ou octets / memoryview) directement à la taille 'size' (w, h).
+    Renvoie un PPM P6. Lève PNGError si le format n'est pas géré.
+    """
+    ow, oh = size
+    f = _open(source)
+    try:
+        if _read_exact(f, 8) != PNG_SIGNATURE:
+            raise PNGError("signature PNG absente")
+        length, ctype = struct.unpack(">I4s", _read_exact(f, 8))
+        if ctype != b"IHDR" or length != 13:
+            raise PNGError("IHDR attendu")
+        iw, ih, depth, color, _, _, interlace = struct.unpack(">IIBBBBB", _read_exact(f, 13))
+        _read_exact(f, 4)
+        if depth != 8 or color not in _CHANNELS or interlace != 0:
+            raise PNGError(f"format non géré (profondeur {depth}, couleur {color}, entrelacement {interlace})")
+        if not (0 < ow <= iw and 0 < oh <= ih):
+            raise PNGError("taille de sortie invalide (réduction uniquement)")
+
+        bpp = _CHANNELS[color]
+        stride = iw * bpp
+        unfilter = _RowUnfilter(stride, bpp)
+        scaler = _BoxScaler(iw, ih, ow, oh, bpp)
+
+        out_rows = []
+        inflater = zlib.decompressobj()
+        pending = bytearray()
+        y = 0
+        for part in _iter_idat(f):
+            data = inflater.decompress(part, _READ_SIZE)
+            while True:
+                pending += data
+                while len(pending) > stride and y < ih:
+                    line = memoryview(pending)[1:stride + 1]
+                    row = unfilter.unfilter(pending[0], line)
+                    line.release()
+                    del pending[:stride + 1]
+                    out = scaler.feed(y, row)
+                    if out is not None:
+                        out_rows.append(out)
+                    y += 1
+                if not inflater.unconsumed_tail:
+                    break
+                data = inflater.decompress(inflater.unconsumed_tail, _READ_SIZE)
+            if y >= ih:
+                break
+        if y < ih:
+            raise PNGError("données d'image incomplètes")
+    except (struct.error, zlib.error) as e:
+        raise PNGError(str(e)) from e
+    finally:
+        if hasattr(f, "close"):
+            f.close()
+
+    return _to_ppm(ow, oh, color, out_rows)
+
+
+def _to_ppm(ow: int, oh: int, color: int, rows: list) -> bytes:
+    """Assemble les lignes réduites en PPM RVB (alpha ignoré, gris recopié sur 3 canaux)."""
+    pixels = b"".join(rows)
+    if color == 6:
+        rgb = bytearray(ow * oh * 3)
+        for c in range(3):
+            rgb[c::3] = pixels[c::4]
+        pixels = bytes(rgb)
+    elif color in (0, 4):
+        gray = pixels if color == 0 else pixels[0::2]
+        rgb = bytearray(ow * oh * 3)
+        for c in range(3):
+            rgb[c::3] = gray
+        pixels = bytes(rgb)
+    return b"P6\n%d %d\n255\n" % (ow, oh) + pixels
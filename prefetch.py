@@ -0,0 +1,92 @@
+# prefetch.py
+
+from collections import deque
+
+
+class ImagePrefetcher:
+    """
+    Préchargement des images "probables" pendant les temps morts de Tk.
+
+    Quand le joueur est dans une salle, on sait déjà quelles images il peut voir
+    ensuite (sorties de la salle, salle de départ du chapitre suivant, cinématiques).
+    On les décode à l'avance, une par une, via after_idle : l'interface reste
+    réactive et le prochain changement de salle trouve l'image déjà en cache.
+
+    - widget : n'importe quel widget Tk (sert juste pour after_idle / after_cancel)
+    - loader : fonction(nom) -> nombre d'octets réellement décodés (0 si déjà en cache)
+    - budget_bytes : mémoire maximale décodée par vague de préchargement
+    """
+
+    def __init__(self, widget, loader, budget_bytes: int = 32 * 1024 * 1024):
+        self.widget = widget
+        self.loader = loader
+        self.budget_bytes = budget_bytes
+
+        self._pending = deque()
+        self._after_id = None
+        self.spent_bytes = 0
+
+        # Compteurs
+        self.loaded = 0
+        self.skipped = 0
+
+    def schedule(self, names):
+        """
+        Lance une nouvelle vague de préchargement.
+
+        La vague précédente est annulée : si le joueur a bougé, ses "prochaines"
+        images ne sont plus forcément les bonnes.
+        """
+        self.cancel()
+
+        seen = set()
+        for name in names:
+            if name and name not in seen:
+                seen.add(name)
+                self._pending.append(name)
+
+        if self._pending:
+            self._after_id = self.widget.after_idle(self._step)
+
+    def cancel(self):
+        """
+        Annule la vague en cours (plus rien n'est demandé au loader après cet appel).
+        Les images déjà confiées au pool de décodage sont annulées par la GUI
+        (GameGUI._cancel_decodes), tant qu'elles n'ont pas commencé.
+        """
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        self._pending.clear()
+        self.spent_bytes = 0
+
+    def is_running(self) -> bool:
+        return self._after_id is not None
+
+    def _step(self):
+        """Décode UNE image, puis se replanifie au prochain temps mort."""
+        self._after_id = None
+        if not self._pending:
+            return
+
+        if self.spent_bytes >= self.budget_bytes:
+            # Budget atteint : on garde la mémoire pour la navigation réelle
+            self.skipped += len(self._pending)
+            self._pending.clear()
+            return
+
+        name = self._pending.popleft()
+        try:
+            cost = self.loader(name) or 0
+        except Exception:
+            cost = 0
+
+        if cost:
+            self.loaded += 1
+            self.spent_bytes += cost
+
+        if self._pending:
+            self._after_id = self.widget.after_idle(self._step)
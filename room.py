@@ -1,5 +1,61 @@
 # room.py
 
+from asset_index import normalize_key
+
+
+# Mots acceptés pour chaque direction (go nord, go up, ou "n" tout seul)
+DIRECTION_SYNONYMS = {
+    "N": ("N", "NORD"),
+    "S": ("S", "SUD"),
+    "E": ("E", "EST"),
+    "O": ("O", "OUEST"),
+    "U": ("U", "UP", "HAUT"),
+    "D": ("D", "DOWN", "BAS"),
+}
+
+
+class ExitMap(dict):
+    """
+    dict des sorties d'une salle, avec un compteur 'version' augmenté à chaque
+    modification (sortie débloquée par un déclencheur, plan reconstruit...).
+    Ce qui est calculé à partir des sorties (alias acceptés par 'go') est gardé
+    tant que la version ne change pas.
+    """
+
+    def __init__(self, *args, version: int = 0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = version
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
+
+    def pop(self, key, *default):
+        self.version += 1
+        return super().pop(key, *default)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+
 class Room:
     """
     Représente un lieu du jeu.
@@ -11,13 +67,17 @@ class Room:
     - un inventaire d'objets (items au sol)
     - une liste de personnages présents (PNJ / personnages)
     - un flag 'visited' utile pour les déclencheurs de scénario
+    - un identifiant stable 'asset_id' pour retrouver son image, donné
+      explicitement par les cartes du jeu (renommer une salle ne le change pas) ;
+      à défaut, dérivé du nom : "No Man’s Land" -> "no_man_s_land"
     """
 
-    def __init__(self, name: str, description: str):
+    def __init__(self, name: str, description: str, asset_id: str = None):
         self.name = name
         self.description = description
+        self.asset_id = asset_id or normalize_key(name)
 
-        self.exits = {}         # ex: {"N": other_room, "S": None}
+        self.exits = {}         # ex: {"N": other_room, "S": None} (converti en ExitMap)
         self.inventory = []     # liste d'Item posés dans la salle
         self.characters = []    # liste de Character présents ici
         self.visited = False
@@ -25,6 +85,34 @@ class Room:
     # -------------------------
     # Déplacements
     # -------------------------
+    @property
+    def exits(self) -> ExitMap:
+        return self._exits
+
+    @exits.setter
+    def exits(self, value):
+        # room.exits = {...} remplace tout : nouvelle version, les caches sont invalidés
+        old = getattr(self, "_exits", None)
+        self._exits = ExitMap(value, version=old.version + 1 if old is not None else 0)
+
+    def exit_aliases(self) -> dict:
+        """
+        Alias de directions acceptés depuis cette salle (ex: "OUEST" -> "O"),
+        seulement pour les sorties qui existent. Calculé une fois par version des sorties.
+        """
+        cached = getattr(self, "_aliases", None)
+        if cached is not None and cached[0] == self._exits.version:
+            return cached[1]
+
+        available = {str(d).strip().upper() for d, dest in self._exits.items() if d and dest is not None}
+        aliases = {}
+        for canon, syns in DIRECTION_SYNONYMS.items():
+            if canon in available:
+                for s in syns:
+                    aliases[s] = canon
+        self._aliases = (self._exits.version, aliases)
+        return aliases
+
     def get_exit(self, direction):
         """Retourne la salle associée à une direction (N/E/S/O/U/D), ou None si impossible."""
         if direction is None:
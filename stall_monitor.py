@@ -0,0 +1,132 @@
+# stall_monitor.py
+
+import heapq
+import time
+from contextlib import contextmanager
+
+
+class StallMonitor:
+    """
+    Mesure les blocages de la boucle Tk (optionnel, ATLAS_STALLS=1).
+
+    Un battement est planifié toutes les period_ms via after() : s'il arrive
+    en retard, c'est que la boucle Tk était occupée. Chaque retard va dans un
+    histogramme ; au-delà de threshold_ms, c'est un blocage, enregistré avec
+    ce qui a tourné depuis le battement précédent (track("send_command")...).
+    report() résume le tout : histogramme + pires blocages.
+
+    - widget : widget Tk (pour after / after_cancel)
+    - keep : nombre de pires blocages gardés
+    """
+
+    # Bornes hautes des classes de l'histogramme (ms) ; la dernière classe est "au-delà"
+    BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000)
+
+    def __init__(self, widget, period_ms: int = 50, threshold_ms: int = 100, keep: int = 10):
+        self.widget = widget
+        self.period_ms = period_ms
+        self.threshold_ms = threshold_ms
+        self.keep = keep
+
+        self._after_id = None
+        self._due = None
+        self._active = []   # activités en cours (pile de (activité, début))
+        self._recent = {}   # activité -> durée max (ms) depuis le battement précédent
+
+        # Statistiques
+        self.beats = 0
+        self.stalls = 0
+        self.histogram = [0] * (len(self.BUCKETS_MS) + 1)
+        self.by_tag = {}    # activité -> [nombre de blocages, retard max]
+        self._worst = []    # tas (retard, n°, activités)
+
+    def start(self):
+        if self._after_id is None:
+            self._schedule()
+
+    def stop(self):
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    @contextmanager
+    def track(self, tag: str):
+        """Marque une activité (commande, image, pause) pour l'attribuer aux blocages."""
+        t0 = time.perf_counter()
+        self._active.append((tag, t0))
+        try:
+            yield
+        finally:
+            self._active.pop()
+            spent = (time.perf_counter() - t0) * 1000
+            if spent > self._recent.get(tag, -1):
+                self._recent[tag] = spent
+
+    def _schedule(self):
+        self._due = time.perf_counter() + self.period_ms / 1000
+        self._after_id = self.widget.after(self.period_ms, self._beat)
+
+    def _beat(self):
+        self._after_id = None
+        late = max(0.0, (time.perf_counter() - self._due) * 1000)
+        self.beats += 1
+
+        i = 0
+        while i < len(self.BUCKETS_MS) and late >= self.BUCKETS_MS[i]:
+            i += 1
+        self.histogram[i] += 1
+
+        if late >= self.threshold_ms:
+            self._record(late)
+        self._recent = {}
+        self._schedule()
+
+    def _record(self, late: float):
+        self.stalls += 1
+        # Activités encore en cours (boucle imbriquée, ex: popup) + terminées depuis le battement précédent
+        now = time.perf_counter()
+        spent = dict(self._recent)
+        for tag, t0 in self._active:
+            spent[tag] = max(spent.get(tag, 0.0), (now - t0) * 1000)
+        tags = tuple(sorted(spent.items(), key=lambda kv: -kv[1])) or (("?", late),)
+
+        # Le blocage est imputé aux activités qui ont pris une bonne part du retard
+        for tag, ms in tags:
+            if ms >= self.threshold_ms / 2 or tag == "?":
+                stat = self.by_tag.setdefault(tag, [0, 0.0])
+                stat[0] += 1
+                stat[1] = max(stat[1], late)
+
+        entry = (late, self.beats, tags)
+        if len(self._worst) < self.keep:
+            heapq.heappush(self._worst, entry)
+        else:
+            heapq.heappushpop(self._worst, entry)
+
+    def worst(self) -> list:
+        """Pires blocages : [(retard ms, ((activité, durée ms), ...))], du plus long au plus court."""
+        return [(late, tags) for late, _, tags in sorted(self._worst, reverse=True)]
+
+    def report(self) -> str:
+        lines = [f"[latence] {self.beats} battements ({self.period_ms} ms), "
+                 f"blocages >= {self.threshold_ms} ms : {self.stalls}"]
+
+        labels = []
+        low = 0
+        for high, count in zip(self.BUCKETS_MS + (None,), self.histogram):
+            labels.append(f"{low}-{high} ms : {count}" if high is not None else f">= {low} ms : {count}")
+            low = high
+        lines.append("  retards : " + " | ".join(labels))
+
+        if self._worst:
+            lines.append("  pires blocages :")
+            for late, tags in self.worst():
+                shown = [f"{tag} ({ms:.0f} ms)" for tag, ms in tags if ms >= 1] or [tags[0][0]]
+                lines.append(f"    {late:7.0f} ms  " + ", ".join(shown))
+            lines.append("  par activité (blocages, retard max) :")
+            for tag, (n, late) in sorted(self.by_tag.items(), key=lambda kv: -kv[1][1]):
+                lines.append(f"    {tag} : {n}, {late:.0f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,179 @@
+# terminal.py
+
+import os
+import shutil
+import sys
+import unicodedata
+
+
+# Séquences ANSI (VT100)
+ESC = "\x1b["
+HOME = ESC + "H"
+ERASE_SCREEN = ESC + "2J"
+ERASE_LINE = ESC + "2K"
+SAVE_CURSOR = "\x1b7"
+RESTORE_CURSOR = "\x1b8"
+REVERSE = ESC + "7m"
+RESET = ESC + "0m"
+
+
+def _ansi_supported(out) -> bool:
+    """Terminal interactif qui comprend les séquences ANSI (pas un pipe, pas TERM=dumb)."""
+    try:
+        if not out.isatty():
+            return False
+    except Exception:
+        return False
+    if os.environ.get("TERM") == "dumb":
+        return False
+    if os.name == "nt":
+        # Console Windows : ANSI seulement dans les terminaux récents
+        return bool(os.environ.get("WT_SESSION") or os.environ.get("ANSICON") or os.environ.get("TERM"))
+    return True
+
+
+def text_width(text: str) -> int:
+    """Largeur affichée : emojis / caractères larges = 2 colonnes, accents combinants = 0."""
+    width = 0
+    for ch in text:
+        if unicodedata.combining(ch):
+            continue
+        width += 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+    return width
+
+
+def fit(text: str, width: int) -> str:
+    """Coupe 'text' pour qu'il tienne sur 'width' colonnes (… à la fin si coupé)."""
+    if text_width(text) <= width:
+        return text
+    out = []
+    used = 0
+    for ch in text:
+        w = text_width(ch)
+        if used + w > width - 1:
+            break
+        out.append(ch)
+        used += w
+    return "".join(out) + "…"
+
+
+def status_line(view) -> str:
+    """Ligne de statut du CLI à partir d'un ViewModel : salle, sorties, quête active."""
+    room = view.room or "—"
+    exits = ", ".join(view.directions) if view.directions else "aucune"
+    quest = view.quest or "aucune quête active"
+    return f" {room} | Sorties : {exits} | {quest}"
+
+
+class TerminalRenderer:
+    """
+    sys.stdout du mode CLI.
+
+    - clear() efface l'écran avec des séquences ANSI (plus de os.system("clear"),
+      qui lançait un shell + un processus à chaque écran de cinématique)
+    - la première ligne du terminal est une ligne de statut fixe (salle, sorties,
+      quête) : le texte défile en dessous (zone de défilement ANSI) et
+      set_status() la réécrit sur place
+    - print() est mis en tampon : chaque écran part en un seul write, au moment
+      où le jeu attend le joueur (input() appelle flush)
+
+    Hors terminal (pipe, fichier, TERM=dumb) : pas de séquences, le texte passe tel quel.
+    """
+
+    FLUSH_THRESHOLD = 64 * 1024
+
+    def __init__(self, out=None, ansi=None):
+        self.out = out if out is not None else sys.__stdout__
+        self.ansi = _ansi_supported(self.out) if ansi is None else ansi
+        self.status = ""
+        self._parts = []
+        self._size = 0
+        self._rows = None  # hauteur du terminal quand la zone de défilement a été posée
+        self.writes = 0    # écritures réelles sur le terminal
+
+    # -------------------------
+    # Fichier texte (print, input)
+    # -------------------------
+    def write(self, s: str):
+        if not s:
+            return 0
+        self._parts.append(s)
+        self._size += len(s)
+        if self._size >= self.FLUSH_THRESHOLD:
+            self.flush()
+        return len(s)
+
+    def flush(self):
+        if self._parts:
+            data = "".join(self._parts)
+            self._parts = []
+            self._size = 0
+            self.out.write(data)
+            self.writes += 1
+        self.out.flush()
+
+    def fileno(self):
+        # input() n'utilise readline (historique, Tab) que si stdout est le vrai terminal
+        return self.out.fileno()
+
+    def isatty(self) -> bool:
+        try:
+            return self.out.isatty()
+        except Exception:
+            return False
+
+    # input() lit aussi encoding et errors de sys.stdout avant de passer par readline :
+    # s'il en manque un, il retombe sur une lecture brute (Tab = "\t", plus d'historique)
+    @property
+    def encoding(self):
+        return getattr(self.out, "encoding", None) or "utf-8"
+
+    @property
+    def errors(self):
+        return getattr(self.out, "errors", None) or "strict"
+
+    # -------------------------
+    # Écran
+    # -------------------------
+    def clear(self):
+        """
+        Efface l'écran : le texte en attente est jeté (il serait effacé aussitôt),
+        la ligne de statut est redessinée. Hors ANSI rien n'est effacé : le texte
+        en attente est gardé tel quel.
+        """
+        if not self.ansi:
+            return
+        self._parts = []
+        self._size = 0
+        cols, rows = shutil.get_terminal_size()
+        self._rows = rows
+        # Zone de défilement = lignes 2..rows (la ligne 1 reste au statut)
+        self._parts.append(f"{ESC}2;{rows}r{HOME}{ERASE_SCREEN}")
+        self._parts.append(self._status_sequence(cols))
+        self._parts.append(f"{ESC}2;1H")
+
+    def set_status(self, text: str):
+        """Met à jour la ligne de statut sur place (rien n'est écrit si elle n'a pas changé)."""
+        if text == self.status:
+            return
+        self.status = text
+        if not self.ansi:
+            return
+        cols, rows = shutil.get_terminal_size()
+        if rows != self._rows:
+            # Premier affichage ou terminal redimensionné : on repose la zone de défilement
+            self._rows = rows
+            self._parts.append(f"{SAVE_CURSOR}{ESC}2;{rows}r{RESTORE_CURSOR}")
+        self._parts.append(SAVE_CURSOR + self._status_sequence(cols) + RESTORE_CURSOR)
+
+    def _status_sequence(self, cols: int) -> str:
+        line = fit(self.status, max(cols - 1, 1))
+        pad = " " * max(cols - text_width(line), 0)
+        return f"{ESC}1;1H{ERASE_LINE}{REVERSE}{line}{pad}{RESET}"
+
+    def close(self):
+        """Rend un terminal normal (zone de défilement complète, curseur en bas)."""
+        if self.ansi and self._rows is not None:
+            self._parts.append(f"{ESC}r{ESC}{self._rows};1H\n")
+            self._rows = None
+        self.flush()
@@ -0,0 +1,195 @@
+# transcode_cache.py
+
+import hashlib
+import json
+import os
+import struct
+import threading
+import zlib
+
+
+def default_cache_dir() -> str:
+    """
+    Dossier de cache propre à l'utilisateur :
+    - Windows : %LOCALAPPDATA%/atlas2160/ppm
+    - ailleurs : $XDG_CACHE_HOME/atlas2160/ppm (ou ~/.cache/atlas2160/ppm)
+    """
+    if os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+        base = os.environ["LOCALAPPDATA"]
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "atlas2160", "ppm")
+
+
+def png_size(header: bytes):
+    """
+    Dimensions d'un PNG à partir de ses 24 premiers octets (chunk IHDR).
+    Renvoie None si ce n'est pas un PNG.
+    """
+    if len(header) < 24 or header[:8] != b"\x89PNG\r\n\x1a\n" or header[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", header[16:24])
+
+
+class TranscodeCache:
+    """
+    Cache disque des images déjà ajustées, au format PPM brut (P6).
+
+    Décoder un PNG, c'est surtout du zlib + des filtres ligne par ligne.
+    Un PPM, c'est un en-tête et des pixels : Tk le charge quasiment sans calcul.
+    On garde donc, pour chaque image et chaque taille d'affichage, une copie PPM :
+    - clé : empreinte sha256 du fichier source + taille cible
+    - vérification : crc32 du fichier PPM, stocké dans index.json
+
+    Le cache se remplit au premier affichage (ou via assets_tool.py warmup).
+    Utilisable depuis plusieurs threads (l'index est protégé par un verrou).
+    """
+
+    INDEX_NAME = "index.json"
+
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self._index = None  # chargé à la première utilisation
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.corrupted = 0
+
+    # -------------------------
+    # Index (checksums + empreintes des sources)
+    # -------------------------
+    def _load_index(self) -> dict:
+        with self._lock:
+            return self._load_index_locked()
+
+    def _load_index_locked(self) -> dict:
+        if self._index is None:
+            try:
+                with open(os.path.join(self.cache_dir, self.INDEX_NAME), "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._index = {"files": dict(data.get("files", {})), "sources": dict(data.get("sources", {}))}
+            except (OSError, ValueError):
+                self._index = {"files": {}, "sources": {}}
+        return self._index
+
+    def _save_index(self):
+        with self._lock:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = os.path.join(self.cache_dir, self.INDEX_NAME)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._load_index_locked(), f, ensure_ascii=False)
+            os.replace(tmp, path)
+
+    def file_digest(self, path: str) -> str:
+        """
+        Empreinte sha256 d'un fichier source.
+
+        Mémorisée par (chemin, date de modification, taille) : on ne relit pas
+        le PNG à chaque lancement, seulement s'il a changé.
+        """
+        st = os.stat(path)
+        sources = self._load_index()["sources"]
+        with self._lock:
+            known = sources.get(path)
+        if known and known[0] == st.st_mtime and known[1] == st.st_size:
+            return known[2]
+
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+
+        with self._lock:
+            sources[path] = [st.st_mtime, st.st_size, digest]
+        try:
+            self._save_index()
+        except OSError:
+            pass
+        return digest
+
+    # -------------------------
+    # Entrées PPM
+    # -------------------------
+    @staticmethod
+    def key(digest: str, size) -> str:
+        w, h = size
+        return f"{digest[:32]}_{w}x{h}"
+
+    def path_for(self, digest: str, size) -> str:
+        return os.path.join(self.cache_dir, self.key(digest, size) + ".ppm")
+
+    def get(self, digest: str, size):
+        """
+        Renvoie les octets PPM (à passer à PhotoImage(data=...)) ou None.
+        Une entrée dont le checksum ne correspond plus est supprimée.
+        """
+        key = self.key(digest, size)
+        with self._lock:
+            expected = self._load_index_locked()["files"].get(key)
+        if expected is None:
+            self.misses += 1
+            return None
+
+        path = self.path_for(digest, size)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            data = None
+
+        if data is None or zlib.crc32(data) != expected:
+            self.corrupted += 1
+            self.misses += 1
+            self.discard(digest, size)
+            return None
+
+        self.hits += 1
+        return data
+
+    def put(self, digest: str, size, write_ppm) -> bool:
+        """
+        Ajoute une entrée. 'write_ppm' est une fonction(chemin) qui écrit le PPM
+        (en GUI : lambda p: photo.write(p, format="ppm")).
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path_for(digest, size)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            write_ppm(tmp)
+            with open(tmp, "rb") as f:
+                crc = zlib.crc32(f.read())
+            os.replace(tmp, path)
+        except Exception:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return False
+
+        with self._lock:
+            self._load_index_locked()["files"][self.key(digest, size)] = crc
+        try:
+            self._save_index()
+        except OSError:
+            return False
+        return True
+
+    def discard(self, digest: str, size):
+        with self._lock:
+            self._load_index_locked()["files"].pop(self.key(digest, size), None)
+        try:
+            os.remove(self.path_for(digest, size))
+        except OSError:
+            pass
+        try:
+            self._save_index()
+        except OSError:
+            pass
+
+    def __contains__(self, item) -> bool:
+        digest, size = item
+        with self._lock:
+            return self.key(digest, size) in self._load_index_locked()["files"]
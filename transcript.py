@@ -0,0 +1,61 @@
+# transcript.py
+
+import os
+import time
+
+
+def default_transcript_dir() -> str:
+    """
+    Dossier des journaux de partie :
+    - Windows : %APPDATA%/atlas2160/transcripts
+    - ailleurs : $XDG_DATA_HOME/atlas2160/transcripts (ou ~/.local/share/...)
+    """
+    if os.name == "nt" and os.environ.get("APPDATA"):
+        base = os.environ["APPDATA"]
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(base, "atlas2160", "transcripts")
+
+
+class Transcript:
+    """
+    Journal complet d'une partie, en ajout seul sur le disque.
+
+    La zone de texte de la GUI ne garde que les dernières lignes : tout le
+    reste est ici (un fichier par session). Le fichier n'est créé qu'au
+    premier texte écrit ; en cas d'erreur disque, le journal se désactive
+    sans gêner la partie.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or os.path.join(
+            default_transcript_dir(), time.strftime("session-%Y%m%d-%H%M%S.txt")
+        )
+        self._file = None
+        self._failed = False
+
+    def write(self, s: str):
+        if not s or self._failed:
+            return
+        try:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(s)
+        except OSError:
+            self._failed = True
+
+    def flush(self):
+        if self._file is not None:
+            try:
+                self._file.flush()
+            except OSError:
+                self._failed = True
+
+    def close(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
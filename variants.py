@@ -0,0 +1,107 @@
+# variants.py
+
+import json
+import os
+
+
+VARIANTS_DIRNAME = "variants"
+MANIFEST_NAME = "manifest.json"
+
+# 1/3 est là exprès : à la taille de fenêtre par défaut (label ~960x380),
+# l'image pleine taille est réduite d'un facteur 3. La variante 1/3 donne donc
+# exactement le même affichage, avec 9 fois moins de pixels à décoder.
+DEFAULT_FACTORS = (2, 3, 4, 8)
+
+
+class VariantManifest:
+    """
+    Index des variantes pré-réduites des images (générées par assets_tool.py).
+
+    Structure du manifest (assets/variants/manifest.json) :
+        {
+          "factors": [2, 3, 4, 8],
+          "images": {
+            "BioDome.png": {"size": [1536, 1024], "variants": {"2": [768, 512], ...}},
+            ...
+          }
+        }
+
+    Chaque variante est rangée dans assets/variants/<facteur>/<nom>.
+    """
+
+    def __init__(self, variants_dir: str, images: dict = None, factors=DEFAULT_FACTORS):
+        self.variants_dir = variants_dir
+        self.images = images or {}
+        self.factors = tuple(factors)
+
+    # -------------------------
+    # Chargement / sauvegarde
+    # -------------------------
+    @classmethod
+    def load(cls, assets_dir: str, pack=None):
+        """
+        Charge le manifest s'il existe, sinon renvoie None (pas de variantes).
+        Si une archive (AssetPack) est fournie, on y cherche d'abord le manifest.
+        """
+        variants_dir = os.path.join(assets_dir, VARIANTS_DIRNAME)
+        packed_name = f"{VARIANTS_DIRNAME}/{MANIFEST_NAME}"
+        try:
+            if pack is not None and packed_name in pack:
+                data = json.loads(pack.read(packed_name).decode("utf-8"))
+            else:
+                with open(os.path.join(variants_dir, MANIFEST_NAME), "r", encoding="utf-8") as f:
+                    data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return cls(variants_dir, data.get("images", {}), data.get("factors", DEFAULT_FACTORS))
+
+    def save(self):
+        os.makedirs(self.variants_dir, exist_ok=True)
+        path = os.path.join(self.variants_dir, MANIFEST_NAME)
+        data = {"factors": list(self.factors), "images": self.images}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+    # -------------------------
+    # Accès
+    # -------------------------
+    def variant_path(self, name: str, factor: int) -> str:
+        return os.path.join(self.variants_dir, str(factor), name)
+
+    def add(self, name: str, size, variants: dict):
+        """Enregistre une image : taille d'origine + {facteur: (largeur, hauteur)}."""
+        self.images[name] = {
+            "size": list(size),
+            "variants": {str(f): list(wh) for f, wh in variants.items()},
+        }
+
+    def pick(self, name: str, source_path: str, fitted_size, exists=os.path.exists):
+        """
+        Choisit le fichier le plus petit qui donne le même affichage que l'original.
+
+        - fitted_size : fonction(largeur, hauteur) -> taille affichée après ajustement au label
+        - exists : test d'existence d'un chemin (disque par défaut, ou archive)
+        - renvoie le chemin à charger (source_path si aucune variante ne convient)
+        """
+        entry = self.images.get(name)
+        if not entry:
+            return source_path
+
+        iw, ih = entry["size"]
+        fw, fh = fitted_size(iw, ih)
+        best_path, best_pixels = source_path, iw * ih
+
+        for factor, (vw, vh) in entry.get("variants", {}).items():
+            if vw * vh >= best_pixels:
+                continue
+            # Une variante ne convient que si, une fois ajustée, elle couvre
+            # au moins autant de pixels affichés que l'image pleine taille,
+            # sans être agrandie (un zoom d'une petite variante serait flou).
+            vfw, vfh = fitted_size(vw, vh)
+            if vfw < fw or vfh < fh or vfw > vw or vfh > vh:
+                continue
+            path = self.variant_path(name, factor)
+            if exists(path):
+                best_path, best_pixels = path, vw * vh
+
+        return best_path
@@ -0,0 +1,95 @@
+# viewmodel.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Optional, Set, Tuple
+
+
+@dataclass(frozen=True)
+class ViewModel:
+    """
+    Résumé de ce que la GUI affiche, en valeurs simples et comparables.
+
+    Après chaque commande, le moteur envoie un ViewModel à GameGUI, qui le
+    compare au précédent (diff) : seuls les widgets dont le champ a changé sont
+    mis à jour. Une commande comme 'help' ou 'quests' ne touche donc ni l'image
+    ni le panneau. Le ViewModel est figé : il passe sans risque d'un thread à l'autre.
+    """
+    room: str = ""
+    exits: str = ""
+    directions: Tuple[str, ...] = ()   # sorties accessibles (complétion)
+    image: Optional[str] = None   # image forcée (cinématique) ou identifiant de la salle
+    cutscene: bool = False        # image forcée par une cinématique
+    injured: bool = False         # teinte de l'image
+    labyrinth: bool = False
+    ground: Tuple[str, ...] = ()  # objets au sol
+    bag: Tuple[str, ...] = ()     # inventaire du joueur
+    characters: Tuple[str, ...] = ()
+    commands: Tuple[str, ...] = ()
+    quest: str = ""
+    mode: str = "NORMAL"
+    chapter: int = 0
+    visited: Tuple[str, ...] = ()   # salles visitées du chapitre (minimap)
+    choice_prompt: str = ""
+    finished: bool = False
+    upcoming: Tuple[str, ...] = ()  # images à précharger
+
+    @classmethod
+    def from_game(cls, game) -> "ViewModel":
+        player = getattr(game, "player", None)
+        room = getattr(player, "current_room", None)
+
+        quest = ""
+        qm = getattr(game, "qm", None)
+        active = qm.get(qm.active_qid) if qm is not None and getattr(qm, "active_qid", None) else None
+        if active is not None:
+            quest = active.status_line()
+
+        override = getattr(game, "_override_image", None)
+        image = override
+        if not image and room is not None:
+            image = room.asset_id
+
+        try:
+            upcoming = tuple(game.upcoming_images())
+        except Exception:
+            upcoming = ()
+
+        try:
+            rooms, _ = game.chapter_rooms()
+            visited = tuple(r.name for r in rooms if getattr(r, "visited", False))
+        except Exception:
+            visited = ()
+
+        return cls(
+            room=room.name if room is not None else "",
+            exits=room.get_exit_string() if room is not None else "",
+            directions=tuple(str(d) for d, dest in getattr(room, "exits", {}).items() if dest is not None),
+            image=image or None,
+            cutscene=bool(override),
+            injured=bool(getattr(game, "player_injured", False)),
+            labyrinth=bool(getattr(game, "in_labyrinth", False)),
+            ground=tuple(it.name for it in getattr(room, "inventory", [])),
+            bag=tuple(it.name for it in getattr(player, "inventory", [])),
+            characters=tuple(c.name for c in getattr(room, "characters", [])),
+            commands=tuple(getattr(game, "commands", {})),
+            quest=quest,
+            mode=getattr(game, "input_mode", "NORMAL"),
+            chapter=getattr(game, "chapter", 0),
+            visited=visited,
+            choice_prompt=getattr(game, "choice_prompt", "") or "",
+            finished=bool(getattr(game, "finished", False)),
+            upcoming=upcoming,
+        )
+
+    def image_state(self) -> tuple:
+        """Ce qui détermine l'image affichée (fichier + teinte)."""
+        return self.image, self.cutscene, self.injured, self.labyrinth
+
+    def diff(self, other: Optional["ViewModel"]) -> Set[str]:
+        """Noms des champs qui diffèrent de 'other' (tous si other est None)."""
+        names = {f.name for f in fields(self)}
+        if other is None:
+            return names
+        return {n for n in names if getattr(self, n) != getattr(other, n)}